@@ -0,0 +1,49 @@
+"""Benchmark of applying operators that adapt the signature of their
+function argument, like select and where. Reports the time per adapt_call
+for a few kinds of callables, and per application of a select and where
+pair to a source.
+
+    PYTHONPATH=. python benchmarks/bench_adapt_call.py
+"""
+
+from functools import partial
+from timeit import default_timer
+
+from rx import Observable
+from rx.internal.utils import adapt_call
+
+
+class Selector(object):
+    def select(self, x):
+        return x
+
+
+def add(x, y):
+    return x + y
+
+
+def measure(func, count):
+    start = default_timer()
+    for _ in range(count):
+        func()
+    return (default_timer() - start) / count * 1e6
+
+
+def main():
+    count = 10 ** 5
+    callables = [
+        ("function", lambda x: x),
+        ("method", Selector().select),
+        ("partial", partial(add, 1)),
+    ]
+    for name, func in callables:
+        elapsed = measure(lambda: adapt_call(func), count)
+        print("%-13s %6.2f us/adapt_call" % (name, elapsed))
+
+    xs = Observable.never()
+    elapsed = measure(lambda: xs.select(lambda x: x).where(lambda x: x),
+                      count)
+    print("operators     %6.2f us/select+where" % elapsed)
+
+if __name__ == "__main__":
+    main()
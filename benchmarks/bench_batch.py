@@ -0,0 +1,68 @@
+"""Benchmark of batched notifications. Pushes a million elements through a
+select/where/buffer_with_count chain, observed on the current thread
+scheduler, and through a Subject with ten observers, one element at a time
+and in batches.
+
+    PYTHONPATH=. python benchmarks/bench_batch.py
+"""
+
+from timeit import default_timer
+
+from rx import Observable, Observer
+from rx.concurrency import current_thread_scheduler
+from rx.subjects import Subject
+
+
+def noop(*args):
+    pass
+
+
+def chain(count, batch_size):
+    source = Observable.from_iterable(range(count), batch_size=batch_size)
+    observer = Observer(noop, noop, noop, noop)
+
+    start = default_timer()
+    source.select(lambda x: x + 1) \
+        .where(lambda x: x % 3) \
+        .buffer_with_count(100) \
+        .observe_on(current_thread_scheduler) \
+        .subscribe(observer)
+    return default_timer() - start
+
+
+def subject(count, batch_size):
+    values = list(range(count))
+    subject = Subject()
+    received = [0]
+
+    def on_next(value):
+        received[0] += 1
+
+    def on_next_batch(values):
+        for value in values:
+            received[0] += 1
+
+    for _ in range(10):
+        subject.subscribe(Observer(on_next, noop, noop, on_next_batch))
+
+    start = default_timer()
+    if batch_size:
+        for index in range(0, count, batch_size):
+            subject.on_next_many(values[index:index + batch_size])
+    else:
+        for value in values:
+            subject.on_next(value)
+    return default_timer() - start
+
+
+def main():
+    count = 10 ** 6
+
+    for name, bench in (("chain", chain), ("subject", subject)):
+        for batch_size in (None, 1000):
+            elapsed = bench(count, batch_size)
+            print("%-8s batch_size %-5s %6.2f s  %6.2f us/element" % (
+                name, batch_size, elapsed, elapsed / count * 1e6))
+
+if __name__ == "__main__":
+    main()
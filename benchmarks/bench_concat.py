@@ -0,0 +1,73 @@
+"""Benchmark of concatenating many sources that terminate while they are
+being subscribed, as concat, repeat, retry, while_do, catch_exception and
+on_error_resume_next do. Reports the time per source, and the deepest stack
+seen by the elements.
+
+    PYTHONPATH=. python benchmarks/bench_concat.py
+"""
+
+import sys
+from timeit import default_timer
+
+from rx import Observable
+from rx.concurrency import immediate_scheduler
+
+
+def stack_depth():
+    frame = sys._getframe()
+    depth = 0
+    while frame:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def one():
+    return Observable.return_value(1, immediate_scheduler)
+
+
+def error():
+    return Observable.throw_exception(Exception(), immediate_scheduler)
+
+
+def while_do(count):
+    remaining = [count]
+
+    def condition(source):
+        remaining[0] -= 1
+        return remaining[0] >= 0
+    return Observable.while_do(condition, one())
+
+
+def main():
+    count = 10 ** 5
+    cases = [
+        ("concat", lambda: Observable.concat([one() for _ in range(count)])),
+        ("repeat", lambda: one().repeat(count)),
+        ("retry", lambda: error().retry(count)),
+        ("while_do", lambda: while_do(count)),
+        ("catch", lambda: Observable.catch_exception(
+            [error() for _ in range(count)])),
+        ("resume", lambda: Observable.on_error_resume_next(
+            [error() for _ in range(count)])),
+    ]
+
+    for name, create in cases:
+        xs = create()
+        depth = [0]
+        seen = [0]
+
+        def on_next(value):
+            # Sample the stack, as walking it is slower than a step
+            seen[0] += 1
+            if seen[0] % 1000 == 1:
+                depth[0] = max(depth[0], stack_depth())
+
+        start = default_timer()
+        xs.subscribe(on_next, lambda ex: None)
+        elapsed = default_timer() - start
+        print("%-10s %6.2f us/source, stack depth %d" % (
+            name, elapsed / count * 1e6, depth[0]))
+
+if __name__ == "__main__":
+    main()
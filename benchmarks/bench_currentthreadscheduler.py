@@ -0,0 +1,47 @@
+"""Benchmark of concurrent subscriptions on the current thread scheduler.
+Each thread repeatedly subscribes to a small synchronous observable, which
+goes through the trampoline of the subscribing thread.
+
+    PYTHONPATH=. python benchmarks/bench_currentthreadscheduler.py
+
+Note that on CPython the GIL limits the aggregate throughput; the per-thread
+trampolines remove the contention and cross-thread interference, not the
+interpreter lock.
+"""
+
+import threading
+from timeit import default_timer
+
+from rx import Observable
+
+
+def worker(count, source):
+    for _ in range(count):
+        source.subscribe()
+
+
+def bench(threads, count):
+    source = Observable.from_iterable([1, 2, 3]).map(lambda x: x * 2)
+    workers = [threading.Thread(target=worker, args=(count, source))
+               for _ in range(threads)]
+
+    start = default_timer()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = default_timer() - start
+
+    return threads * count / elapsed
+
+
+def main():
+    count = 5000
+    single = bench(1, count)
+    for threads in (1, 2, 4, 8):
+        rate = single if threads == 1 else bench(threads, count)
+        print("threads=%d %10.0f subscriptions/s (%.2fx)" % (
+            threads, rate, rate / single))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark of scheduling many relative actions on one EventLoopScheduler.
+
+    PYTHONPATH=. python benchmarks/bench_eventloopscheduler.py [count]
+"""
+
+import sys
+import random
+import threading
+from datetime import timedelta
+from timeit import default_timer
+
+from rx.concurrency import EventLoopScheduler
+
+
+def bench(count, spread=1000):
+    scheduler = EventLoopScheduler()
+    done = threading.Event()
+    remaining = [count]
+    peak_threads = [threading.active_count()]
+    lag = [timedelta(0)]
+
+    def action(scheduler, duetime):
+        lag[0] = max(lag[0], scheduler.now() - duetime)
+        remaining[0] -= 1
+        if not remaining[0]:
+            done.set()
+
+    start = default_timer()
+    for _ in range(count):
+        duetime = timedelta(milliseconds=random.randint(0, spread))
+        scheduler.schedule_relative(duetime, action, scheduler.now() + duetime)
+        peak_threads[0] = max(peak_threads[0], threading.active_count())
+    scheduled = default_timer() - start
+
+    while not done.wait(0.1):
+        peak_threads[0] = max(peak_threads[0], threading.active_count())
+    elapsed = default_timer() - start
+    scheduler.dispose()
+
+    print("%d relative actions over %d ms" % (count, spread))
+    print("  schedule:   %8.3f s (%.2f us/action)" % (
+        scheduled, scheduled / count * 1e6))
+    print("  completed:  %8.3f s" % elapsed)
+    print("  max lag:    %8.3f s" % lag[0].total_seconds())
+    print("  peak threads: %d" % peak_threads[0])
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
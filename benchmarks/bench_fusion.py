@@ -0,0 +1,54 @@
+"""Benchmark of operator fusion. Runs a chain of ten fusible operators over
+a synchronous source of a million elements, with fusion off and on.
+
+    PYTHONPATH=. python benchmarks/bench_fusion.py
+"""
+
+from timeit import default_timer
+
+import rx
+from rx import Observable
+
+
+def chain(source):
+    return source.select(lambda x: x + 1) \
+        .where(lambda x: x % 7) \
+        .do_action(lambda x: None) \
+        .select(lambda x, i: x - i) \
+        .skip_while(lambda x: x < 0) \
+        .take_while(lambda x: x >= 0) \
+        .where(lambda x: True) \
+        .scan(lambda acc, x: x) \
+        .select(lambda x: x * 2) \
+        .do_action(lambda x: None)
+
+
+def run(count):
+    result = [0]
+
+    def on_next(x):
+        result[0] += 1
+
+    def subscribe(observer):
+        # A plain loop, so that the operators dominate the run time
+        for x in range(count):
+            observer.on_next(x)
+        observer.on_completed()
+    source = Observable.create(subscribe)
+
+    start = default_timer()
+    chain(source).subscribe(on_next)
+    return default_timer() - start, result[0]
+
+
+def main():
+    count = 10 ** 6
+
+    for fusion in (False, True):
+        rx.config["fusion"] = fusion
+        elapsed, received = run(count)
+        print("fusion %-5s %6.2f s  %6.2f us/element  (%d received)" % (
+            fusion, elapsed, elapsed / count * 1e6, received))
+
+if __name__ == "__main__":
+    main()
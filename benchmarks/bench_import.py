@@ -0,0 +1,37 @@
+"""Benchmark of the time of `import rx`. Runs fresh interpreters with
+`python -X importtime -c "import rx"` and reports the best cumulative import
+time of the rx package, and the number of rx modules imported.
+
+    PYTHONPATH=. python benchmarks/bench_import.py
+"""
+
+import sys
+import subprocess
+
+
+def import_time():
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", "import rx"],
+        stderr=subprocess.STDOUT, universal_newlines=True)
+
+    modules = 0
+    total = None
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name == "rx" or name.startswith("rx."):
+            modules += 1
+        if name == "rx":
+            total = int(cumulative) / 1000.0
+    return total, modules
+
+
+def main():
+    runs = [import_time() for _ in range(5)]
+    total, modules = min(runs)
+    print("import rx     %6.1f ms  (%d rx modules)" % (total, modules))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark of Observable construction cost and per instance memory.
+Measures constructing AnonymousObservable instances and the memory they
+hold, using tracemalloc.
+
+    PYTHONPATH=. python benchmarks/bench_observable.py
+"""
+
+import tracemalloc
+from timeit import default_timer
+
+from rx.anonymousobservable import AnonymousObservable
+
+
+def subscribe(observer):
+    pass
+
+
+def main():
+    count = 10 ** 5
+
+    start = default_timer()
+    for _ in range(count):
+        AnonymousObservable(subscribe)
+    elapsed = default_timer() - start
+    print("construction  %6.2f us/instance" % (elapsed / count * 1e6))
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [AnonymousObservable(subscribe) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print("memory        %6.0f bytes/instance" % (size / float(len(instances))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark of the scheduler priority queue and the virtual time
+schedulers built on top of it.
+
+    PYTHONPATH=. python benchmarks/bench_priorityqueue.py
+"""
+
+import random
+from timeit import default_timer
+
+from rx.internal import PriorityQueue
+from rx.testing import TestScheduler
+
+
+class Item(object):
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def bench_queue(n):
+    items = [Item(random.random()) for _ in range(n)]
+    queue = PriorityQueue()
+
+    start = default_timer()
+    for item in items:
+        queue.enqueue(item)
+    for item in items[::2]:
+        queue.remove(item)
+    while len(queue):
+        queue.dequeue()
+    elapsed = default_timer() - start
+
+    ops = n + n // 2 + (n - n // 2)
+    return elapsed, ops
+
+
+def bench_scheduler(n):
+    scheduler = TestScheduler()
+
+    def action(scheduler, state):
+        pass
+
+    disposables = [scheduler.schedule_absolute(random.randint(1, n), action)
+                   for _ in range(n)]
+    for d in disposables[::2]:
+        d.dispose()
+
+    start = default_timer()
+    scheduler.start()
+    elapsed = default_timer() - start
+    return elapsed, n
+
+
+def main():
+    for name, bench in (("PriorityQueue", bench_queue),
+                        ("TestScheduler", bench_scheduler)):
+        for n in (10**4, 10**5, 10**6):
+            elapsed, ops = bench(n)
+            print("%-14s n=%-8d %8.3f s %8.3f us/op" % (
+                name, n, elapsed, elapsed / ops * 1e6))
+
+if __name__ == "__main__":
+    main()
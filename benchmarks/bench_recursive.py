@@ -0,0 +1,35 @@
+"""Benchmark of recursive scheduling through synchronous sources. Emits
+range(0, 10**6) on the current thread and the immediate scheduler.
+
+    PYTHONPATH=. python benchmarks/bench_recursive.py
+"""
+
+import sys
+from timeit import default_timer
+
+from rx import Observable
+from rx.concurrency import current_thread_scheduler, immediate_scheduler
+
+
+def bench(name, create):
+    start = default_timer()
+    try:
+        create().subscribe(lambda x: None)
+    except RuntimeError as ex:  # RecursionError on Python 3.5+
+        print("%-30s failed: %s" % (name, ex.__class__.__name__))
+        return
+    elapsed = default_timer() - start
+    print("%-30s %8.3f s" % (name, elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    bench("range current_thread", lambda: Observable.range(
+        0, count, current_thread_scheduler))
+    bench("range immediate", lambda: Observable.range(
+        0, count, immediate_scheduler))
+    bench("from_iterable current_thread", lambda: Observable.from_iterable(
+        range(count), current_thread_scheduler))
+
+if __name__ == "__main__":
+    main()
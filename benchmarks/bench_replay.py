@@ -0,0 +1,69 @@
+"""Benchmark of ReplaySubject buffers. Reports the time to publish an
+element into a full buffer by buffer size, with and without a window, and
+the time per element to replay the buffer to a late subscriber. Also
+reports the time for a late subscriber to catch up on the state of 1000
+keys after 10^6 updates, from a full replay and from a compacted replay.
+
+    PYTHONPATH=. python benchmarks/bench_replay.py
+"""
+
+import gc
+from timeit import default_timer
+
+from rx.subjects import ReplaySubject, CompactedReplaySubject
+
+
+def noop(*args):
+    pass
+
+
+def publish(subject, size, count):
+    for i in range(size):
+        subject.on_next(i)
+
+    start = default_timer()
+    for i in range(count):
+        subject.on_next(i)
+    return (default_timer() - start) / count * 1e6
+
+
+def replay(subject, size):
+    for i in range(size):
+        subject.on_next(i)
+
+    gc.collect()
+    start = default_timer()
+    subject.subscribe(noop)
+    return (default_timer() - start) / size * 1e6
+
+
+def catch_up(subject, keys, updates):
+    for i in range(updates):
+        subject.on_next((i % keys, i))
+
+    gc.collect()
+    start = default_timer()
+    subject.subscribe(noop)
+    return (default_timer() - start) * 1e3
+
+
+def main():
+    for size in (10 ** 3, 10 ** 5, 10 ** 6):
+        count = 10 ** 5
+        for window in (None, 10 ** 6):
+            elapsed = publish(ReplaySubject(size, window), size, count)
+            print("publish %-10s %8d buffered %8.2f us/element" % (
+                "window" if window else "no window", size, elapsed))
+
+    for size in (10 ** 3, 10 ** 5, 10 ** 6):
+        elapsed = replay(ReplaySubject(size), size)
+        print("replay  %8d buffered %8.2f us/element" % (size, elapsed))
+
+    keys, updates = 1000, 10 ** 6
+    for subject in (ReplaySubject(), CompactedReplaySubject(lambda x: x[0])):
+        elapsed = catch_up(subject, keys, updates)
+        print("catch up %-22s %d keys %8.2f ms" % (
+            type(subject).__name__, keys, elapsed))
+
+if __name__ == "__main__":
+    main()
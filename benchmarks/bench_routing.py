@@ -0,0 +1,50 @@
+"""Benchmark of fanning a stream out by topic. Reports the time to publish
+an element to subscribers of one topic each, filtering a Subject with where
+against routing through a RoutingSubject.
+
+    PYTHONPATH=. python benchmarks/bench_routing.py
+"""
+
+from timeit import default_timer
+
+from rx.subjects import Subject, RoutingSubject
+
+
+def noop(*args):
+    pass
+
+
+def topic(value):
+    return value[0]
+
+
+def filtered(subscribers, count):
+    subject = Subject()
+    for i in range(subscribers):
+        subject.where(lambda e, i=i: e[0] == i).subscribe(noop)
+    return publish(subject, subscribers, count)
+
+
+def routed(subscribers, count):
+    subject = RoutingSubject(topic)
+    for i in range(subscribers):
+        subject.subscribe_key(i, noop)
+    return publish(subject, subscribers, count)
+
+
+def publish(subject, subscribers, count):
+    start = default_timer()
+    for i in range(count):
+        subject.on_next((i % subscribers, i))
+    return (default_timer() - start) / count * 1e6
+
+
+def main():
+    for subscribers in (10, 1000, 10000):
+        count = max(100, 10 ** 6 // subscribers)
+        for name, run in (("where", filtered), ("routing", routed)):
+            print("%-8s %5d subscribers %8.2f us/element" % (
+                name, subscribers, run(subscribers, count)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark of the cost of scheduler instrumentation. Runs 10**5 actions
+through the current thread trampoline and the event loop scheduler with
+stats disabled and enabled.
+
+    PYTHONPATH=. python benchmarks/bench_schedulerstats.py
+"""
+
+import threading
+from timeit import default_timer
+
+from rx.concurrency import CurrentThreadScheduler, EventLoopScheduler
+
+
+def noop(scheduler, state):
+    pass
+
+
+def bench_trampoline(scheduler, count):
+    def outer(scheduler, state):
+        for _ in range(count):
+            scheduler.schedule(noop)
+
+    start = default_timer()
+    scheduler.schedule(outer)
+    return default_timer() - start
+
+
+def bench_event_loop(scheduler, count):
+    gate = threading.Semaphore(0)
+
+    start = default_timer()
+    for _ in range(count - 1):
+        scheduler.schedule(noop)
+    scheduler.schedule(lambda scheduler, state: gate.release())
+    gate.acquire()
+    return default_timer() - start
+
+
+def main():
+    count = 10 ** 5
+    for name, factory, bench in (
+            ("current_thread", CurrentThreadScheduler, bench_trampoline),
+            ("event_loop", EventLoopScheduler, bench_event_loop)):
+        scheduler = factory()
+        disabled = min(bench(scheduler, count) for _ in range(3))
+        scheduler.enable_stats()
+        enabled = min(bench(scheduler, count) for _ in range(3))
+        print("%-15s disabled %6.3f s  enabled %6.3f s" % (
+            name, disabled, enabled))
+        if hasattr(scheduler, "dispose"):
+            scheduler.dispose()
+
+if __name__ == "__main__":
+    main()
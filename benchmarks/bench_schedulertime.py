@@ -0,0 +1,68 @@
+"""Micro-benchmark of the per action cost of scheduling, reporting the time
+per call and the number of memory blocks kept alive per pending action.
+
+    PYTHONPATH=. python benchmarks/bench_schedulertime.py
+"""
+
+import sys
+from timeit import default_timer
+
+from rx.concurrency import CurrentThreadScheduler, TimeoutScheduler, \
+    EventLoopScheduler
+
+COUNT = 100000
+
+
+def action(scheduler, state):
+    pass
+
+
+def bench_pending(scheduler):
+    """Schedules actions far in the future and measures what stays alive."""
+
+    blocks = sys.getallocatedblocks()
+    start = default_timer()
+    disposables = [scheduler.schedule_relative(3600000, action)
+                   for _ in range(COUNT)]
+    elapsed = default_timer() - start
+    blocks = sys.getallocatedblocks() - blocks
+
+    for d in disposables:
+        d.dispose()
+    return elapsed, blocks
+
+
+def bench_trampoline(scheduler):
+    """Schedules actions that run immediately on the trampoline."""
+
+    def outer(scheduler, state):
+        for _ in range(COUNT):
+            scheduler.schedule(action)
+
+    start = default_timer()
+    scheduler.schedule(outer)
+    return default_timer() - start, None
+
+
+def main():
+    benchmarks = (
+        ("CurrentThreadScheduler.schedule", bench_trampoline,
+         CurrentThreadScheduler()),
+        ("TimeoutScheduler.schedule_relative", bench_pending,
+         TimeoutScheduler()),
+        ("EventLoopScheduler.schedule_relative", bench_pending,
+         EventLoopScheduler()),
+    )
+
+    for name, bench, scheduler in benchmarks:
+        elapsed, blocks = bench(scheduler)
+        line = "%-38s %6.2f us/action" % (name, elapsed / COUNT * 1e6)
+        if blocks is not None:
+            line += " %6.1f blocks/pending action" % (float(blocks) / COUNT)
+        print(line)
+
+        if hasattr(scheduler, "dispose"):
+            scheduler.dispose()
+
+if __name__ == "__main__":
+    main()
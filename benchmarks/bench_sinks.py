@@ -0,0 +1,60 @@
+"""Benchmark of the throughput of the main operators, which subscribe to
+their source with slotted sink objects. Run it on CPython and on PyPy:
+
+    PYTHONPATH=. python benchmarks/bench_sinks.py
+    PYTHONPATH=. pypy benchmarks/bench_sinks.py
+"""
+
+import platform
+from timeit import default_timer
+
+from rx import Observable
+from rx.subjects import Subject
+
+
+def noop(*args):
+    pass
+
+
+def chain(xs, ys):
+    return xs.select(lambda x: x + 1) \
+        .where(lambda x: x % 3) \
+        .distinct_until_changed() \
+        .skip(1) \
+        .skip_while(lambda x: x < 0) \
+        .take_while(lambda x: x >= 0) \
+        .take(10 ** 9)
+
+
+def combine_latest(xs, ys):
+    return xs.combine_latest(ys, lambda x, y: x + y)
+
+
+def zip(xs, ys):
+    return xs.zip(ys, lambda x, y: x + y)
+
+
+def measure(create, count):
+    xs = Subject()
+    ys = Subject()
+    create(xs, ys).subscribe(noop)
+    ys.on_next(0)
+
+    start = default_timer()
+    for i in range(count):
+        xs.on_next(i)
+        ys.on_next(i)
+    return (default_timer() - start) / count * 1e6
+
+
+def main():
+    count = 10 ** 5
+    print("%s %s" % (platform.python_implementation(),
+                     platform.python_version()))
+    for create in (chain, combine_latest, zip):
+        measure(create, count // 10)  # Warm up the JIT on PyPy
+        elapsed = min(measure(create, count) for _ in range(5))
+        print("%-15s %6.2f us/element" % (create.__name__, elapsed))
+
+if __name__ == "__main__":
+    main()
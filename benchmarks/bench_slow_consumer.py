@@ -0,0 +1,62 @@
+"""Benchmark of a published stream with one slow subscriber. Reports the
+time per element for the producer, and so for the fast subscriber, when the
+slow subscriber is subscribed directly and through a bounded queue drained
+on its own event loop.
+
+    PYTHONPATH=. python benchmarks/bench_slow_consumer.py
+"""
+
+import time
+from timeit import default_timer
+
+from rx.subjects import Subject
+from rx.concurrency import EventLoopScheduler
+from rx.boundedobserver import DROP_OLDEST, LATEST
+
+
+def noop(*args):
+    pass
+
+
+def slow(value):
+    time.sleep(0.001)
+
+
+def produce(count, overflow=None):
+    source = Subject()
+    published = source.publish()
+    published.subscribe(noop)
+
+    subscription = None
+    scheduler = None
+    if overflow is None:
+        published.subscribe(slow)
+    else:
+        scheduler = EventLoopScheduler()
+        subscription = published.subscribe_bounded(slow, scheduler, 100,
+                                                   overflow)
+    published.connect()
+
+    start = default_timer()
+    for i in range(count):
+        source.on_next(i)
+    elapsed = (default_timer() - start) / count * 1e6
+
+    if subscription is not None:
+        dropped = subscription.dropped
+        subscription.dispose()
+        scheduler.dispose()
+    else:
+        dropped = 0
+    return elapsed, dropped
+
+
+def main():
+    for overflow, count in ((None, 1000), (DROP_OLDEST, 10 ** 5),
+                            (LATEST, 10 ** 5)):
+        elapsed, dropped = produce(count, overflow)
+        print("%-12s %10.2f us/element %6d dropped" % (
+            overflow or "direct", elapsed, dropped))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark of subjects with many subscribers. Reports the time to
+publish an element by subscriber count, and the time to subscribe and
+unsubscribe one observer while many others stay subscribed.
+
+    PYTHONPATH=. python benchmarks/bench_subject_fanout.py
+"""
+
+from timeit import default_timer
+
+from rx.subjects import Subject, BehaviorSubject, AsyncSubject, \
+    ReplaySubject
+
+
+def noop(*args):
+    pass
+
+
+def publish(subject, subscribers, count):
+    for _ in range(subscribers):
+        subject.subscribe(noop)
+
+    start = default_timer()
+    for i in range(count):
+        subject.on_next(i)
+    return (default_timer() - start) / count * 1e6
+
+
+def churn(subject, subscribers, count):
+    subscriptions = [subject.subscribe(noop) for _ in range(subscribers)]
+
+    start = default_timer()
+    for i in range(count):
+        # Unsubscribe the oldest observer left from the back, which a list
+        # finds after scanning all observers in front of it
+        index = subscribers - 1 - i % subscribers
+        subscriptions[index].dispose()
+        subscriptions[index] = subject.subscribe(noop)
+    return (default_timer() - start) / count * 1e6
+
+
+def main():
+    for subscribers in (1, 100, 10000):
+        count = max(10, 10 ** 5 // subscribers)
+        for cls in (Subject, BehaviorSubject):
+            elapsed = publish(cls(*([0] if cls is BehaviorSubject else [])),
+                              subscribers, count)
+            print("publish %-15s %5d subscribers %8.2f us/element" % (
+                cls.__name__, subscribers, elapsed))
+
+    subscribers = 10000
+    for cls in (Subject, BehaviorSubject, AsyncSubject, ReplaySubject):
+        subject = cls(0) if cls is BehaviorSubject else cls()
+        elapsed = churn(subject, subscribers, 10000)
+        print("churn   %-15s %5d subscribers %8.2f us/resubscribe" % (
+            cls.__name__, subscribers, elapsed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark of short-lived subscriptions. Subscribes and disposes many
+times to a Subject behind a few operators, and to a cold sequence that
+completes during the subscription, and reports the time per subscription.
+
+    PYTHONPATH=. python benchmarks/bench_subscribe_churn.py
+"""
+
+from timeit import default_timer
+
+from rx import Observable
+from rx.subjects import Subject
+
+
+def pipeline(source):
+    return source.select(lambda x: x + 1) \
+        .where(lambda x: x % 2) \
+        .distinct_until_changed() \
+        .take(1)
+
+
+def noop(*args):
+    pass
+
+
+def churn(xs, count):
+    start = default_timer()
+    for _ in range(count):
+        xs.subscribe(noop).dispose()
+    return default_timer() - start
+
+
+def main():
+    count = 10 ** 5
+
+    xs = pipeline(Subject())
+    elapsed = churn(xs, count)
+    print("subject       %6.2f us/subscription" % (elapsed / count * 1e6))
+
+    xs = pipeline(Observable.return_value(1))
+    elapsed = churn(xs, count)
+    print("cold          %6.2f us/subscription" % (elapsed / count * 1e6))
+
+if __name__ == "__main__":
+    main()
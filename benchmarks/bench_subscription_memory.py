@@ -0,0 +1,57 @@
+"""Report of the memory held by live subscriptions. Subscribes many times to
+a ten operator pipeline on a Subject, so that all subscriptions stay alive,
+and reports the bytes allocated per subscription using tracemalloc.
+
+    PYTHONPATH=. python benchmarks/bench_subscription_memory.py
+"""
+
+import tracemalloc
+from timeit import default_timer
+
+from rx.subjects import Subject
+
+
+def pipeline(source):
+    return source.select(lambda x: x + 1) \
+        .where(lambda x: x % 2) \
+        .select(lambda x: x * 2) \
+        .distinct_until_changed() \
+        .skip_while(lambda x: x < 0) \
+        .take_while(lambda x: x >= 0) \
+        .do_action(lambda x: None) \
+        .scan(lambda acc, x: acc + x, 0) \
+        .where(lambda x: True) \
+        .select(lambda x: x)
+
+
+def noop(*args):
+    pass
+
+
+def main():
+    count = 10 ** 4
+    subject = Subject()
+    xs = pipeline(subject)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = default_timer()
+    subscriptions = [xs.subscribe(noop) for _ in range(count)]
+    elapsed = default_timer() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    print("subscribe     %6.2f us/subscription" % (elapsed / count * 1e6))
+    print("memory        %6.0f bytes/subscription" % (size / float(count)))
+    for stat in stats[:5]:
+        print("  %-50s %6.0f bytes/subscription" % (
+            stat.traceback[0].filename[-50:], stat.size_diff / float(count)))
+
+    subject.on_next(1)
+    for subscription in subscriptions:
+        subscription.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,21 @@ try:
 except ImportError:
     from rx.internal.concurrency import NoLock as Lock
 
-try:
-    from asyncio import Future
-except ImportError:
-    Future = None
-
-# Rx configuration dictionary
+# Rx configuration dictionary. Future defaults to asyncio.Future, which is
+# imported on first use since asyncio is slow to import. Lock is the type of
+# the locks created by observables, observers and subjects, and is read when
+# they are created. Set it to rx.internal.concurrency.SingleThreadLock before
+# constructing pipelines that only run on a single thread
 config = {
-    "Future": Future,
-    "Lock": Lock
+    "Future": None,
+    "Lock": Lock,
+    "fusion": False
 }
 
 from .observable import Observable
 from .anonymousobservable import AnonymousObservable
 from .observer import Observer
 
-from . import checkedobserver
 from . import linq
-from . import backpressure
 
 
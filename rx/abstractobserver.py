@@ -1,20 +1,60 @@
 from rx.internal import noop, default_error
 
+
+def send_batch(observer, values):
+    """Sends the batch of values to the observer. Observers may be any
+    object with on_next, on_error and on_completed, so observers without
+    on_next_batch get the values one by one through on_next."""
+
+    on_next_batch = getattr(observer, "on_next_batch", None)
+    if on_next_batch is None:
+        for value in values:
+            observer.on_next(value)
+    else:
+        on_next_batch(values)
+
+
 class AbstractObserver(object):
     """Abstract base class for implementations of the Observer class. This base
     class enforces the grammar of observers where OnError and OnCompleted are
     terminal messages.
     """
 
-    def __init__(self, on_next=None, on_error=None, on_completed=None):
+    # Subjects derive from both Observable and AbstractObserver, and only
+    # one base of a class can have slots. Concrete observers declare the
+    # slots of the observer state themselves, see AbstractObserver.slots.
+    __slots__ = ()
+    slots = ("is_stopped", "on_next", "_on_error", "_on_completed",
+             "_on_next_batch")
+
+    def __init__(self, on_next=None, on_error=None, on_completed=None,
+                 on_next_batch=None):
         self.is_stopped = False
 
         # on_next now uses fast path and will be noop'ed when stopped
         if not hasattr(self, "on_next"):
             self.on_next = on_next or noop
 
-        self._error = on_error or default_error
-        self._completed = on_completed or noop
+        self._on_error = on_error or default_error
+        self._on_completed = on_completed or noop
+        self._on_next_batch = on_next_batch
+
+    def on_next_batch(self, values):
+        """Notifies the observer of a batch of new elements in the sequence,
+        in order. Observers that do not handle batches receive the elements
+        one by one through on_next.
+
+        Keyword arguments:
+        values -- List of the new elements."""
+
+        # Observers created without a batch action, or that do not call
+        # AbstractObserver.__init__, get the elements one by one
+        on_next_batch = getattr(self, "_on_next_batch", None)
+        if on_next_batch is None:
+            for value in values:
+                self.on_next(value)
+        elif not self.is_stopped:
+            on_next_batch(values)
 
     def on_error(self, error):
         """Notifies the observer that an exception has occurred.
@@ -24,14 +64,14 @@ class AbstractObserver(object):
 
         if not self.is_stopped:
             AbstractObserver.dispose(self)
-            self._error(error)
+            self._on_error(error)
 
     def on_completed(self):
         """Notifies the observer of the end of the sequence."""
 
         if not self.is_stopped:
             AbstractObserver.dispose(self)
-            self._completed()
+            self._on_completed()
 
     def dispose(self):
         """Disposes the observer, causing it to transition to the stopped
@@ -43,7 +83,7 @@ class AbstractObserver(object):
     def fail(self, exn):
         if not self.is_stopped:
             AbstractObserver.dispose(self)
-            self._error(exn)
+            self._on_error(exn)
             return True
 
         return False
\ No newline at end of file
@@ -1,12 +1,26 @@
 from rx.concurrency import current_thread_scheduler
 from rx.disposables import Disposable
-from .autodetachobserver import AutoDetachObserver
+from .autodetachobserver import AutoDetachObserver, SubscribeScope, \
+    subscribing
 from .observable import Observable
 
+
+def fix_subscriber(subscriber):
+    """Fixes subscriber to make sure it returns a Disposable instead
+    of None or a dispose function"""
+
+    if not hasattr(subscriber, "dispose"):
+        subscriber = Disposable(subscriber)
+
+    return subscriber
+
+
 class AnonymousObservable(Observable):
     """Class to create an Observable instance from a delegate-based
     implementation of the Subscribe method."""
 
+    __slots__ = ("_subscribe_core",)
+
     def __init__(self, subscribe):
         """Creates an observable sequence object from the specified
         subscription function.
@@ -15,41 +29,47 @@ class AnonymousObservable(Observable):
         :param types.FunctionType subscribe: Subscribe method implementation.
         """
 
-        def _subscribe(observer):
-            """Decorator for subscribe. It wraps the observer in an
-            AutoDetachObserver and fixes the returned disposable"""
-
-            def fix_subscriber(subscriber):
-                """Fixes subscriber to make sure it returns a Disposable instead
-                of None or a dispose function"""
+        self._subscribe_core = subscribe
+        self._lock = None
 
-                if not hasattr(subscriber, "dispose"):
-                    subscriber = Disposable(subscriber)
+    def _subscribe(self, observer):
+        """Decorator for subscribe. It wraps the observer in an
+        AutoDetachObserver and fixes the returned disposable"""
 
-                return subscriber
+        def set_disposable(scheduler=None, value=None):
+            outer = subscribing.scope
+            subscribing.scope = SubscribeScope(auto_detach_observer, outer)
+            try:
+                auto_detach_observer.disposable = fix_subscriber(subscribe(auto_detach_observer))
+            except Exception as ex:
+                if not auto_detach_observer.fail(ex):
+                    raise ex
+            finally:
+                subscribing.scope = outer
 
-            def set_disposable(scheduler=None, value=None):
-                try:
-                    auto_detach_observer.disposable = fix_subscriber(subscribe(auto_detach_observer))
-                except Exception as ex:
-                    if not auto_detach_observer.fail(ex):
-                        raise ex
+        subscribe = self._subscribe_core
+        auto_detach_observer = AutoDetachObserver(observer)
 
-            auto_detach_observer = AutoDetachObserver(observer)
+        # Subscribe needs to set up the trampoline before for subscribing.
+        # Actually, the first call to Subscribe creates the trampoline so
+        # that it may assign its disposable before any observer executes
+        # OnNext over the CurrentThreadScheduler. This enables single-
+        # threaded cancellation
+        # https://social.msdn.microsoft.com/Forums/en-US/eb82f593-9684-4e27-
+        # 97b9-8b8886da5c33/whats-the-rationale-behind-how-currentthreadsche
+        # dulerschedulerequired-behaves?forum=rx
+        if current_thread_scheduler.schedule_required():
+            current_thread_scheduler.schedule(set_disposable)
+        else:
+            set_disposable()
 
-            # Subscribe needs to set up the trampoline before for subscribing.
-            # Actually, the first call to Subscribe creates the trampoline so
-            # that it may assign its disposable before any observer executes
-            # OnNext over the CurrentThreadScheduler. This enables single-
-            # threaded cancellation
-            # https://social.msdn.microsoft.com/Forums/en-US/eb82f593-9684-4e27-
-            # 97b9-8b8886da5c33/whats-the-rationale-behind-how-currentthreadsche
-            # dulerschedulerequired-behaves?forum=rx
-            if current_thread_scheduler.schedule_required():
-                current_thread_scheduler.schedule(set_disposable)
-            else:
-                set_disposable()
+        return auto_detach_observer
 
-            return auto_detach_observer
+    def _subscribe_internal(self, observer):
+        """Subscribes an observer of the library itself, see
+        Observable._subscribe_internal. Calls the subscription function
+        directly, without an AutoDetachObserver or trampoline check.
+        Exceptions propagate to the outer subscription, which passes them
+        to its observer."""
 
-        super(AnonymousObservable, self).__init__(_subscribe)
+        return fix_subscriber(self._subscribe_core(observer))
@@ -1,4 +1,4 @@
 from .abstractobserver import AbstractObserver
 
 class AnonymousObserver(AbstractObserver):
-    pass
\ No newline at end of file
+    __slots__ = AbstractObserver.slots
@@ -1,12 +1,60 @@
+import threading
+
 from rx.disposables import SingleAssignmentDisposable
 
-from .abstractobserver import AbstractObserver
+from .abstractobserver import AbstractObserver, send_batch
+
+
+class SubscribeScope(object):
+    """Subscription whose subscribe function is running on the calling
+    thread, linked to the scope of the subscription that subscribes to it,
+    if any. See current_subscription."""
+
+    __slots__ = ("observer", "outer")
+
+    def __init__(self, observer, outer):
+        self.observer = observer
+        self.outer = outer
+
+    def is_stopped(self):
+        """Returns True if this subscription, or a subscription it belongs
+        to, is disposed or terminated."""
+
+        scope = self
+        while scope is not None:
+            if scope.observer.is_stopped:
+                return True
+            scope = scope.outer
+        return False
+
+
+class Subscribing(threading.local):
+    scope = None
+
+subscribing = Subscribing()
+
+
+def current_subscription():
+    """Returns the SubscribeScope of the subscription whose subscribe
+    function is running on the calling thread, or None.
+
+    Work that loops on the calling thread, like a recursion on the
+    immediate scheduler, may run before subscribe returns its disposable,
+    so disposing the subscription cannot reach the loop. Such loops check
+    is_stopped on the scope instead, which returns True once the
+    subscription, or one it belongs to, is disposed or terminated."""
+
+    return subscribing.scope
 
 
 class AutoDetachObserver(AbstractObserver):
+    # The termination and batch actions are methods, so only on_next is
+    # kept per instance. There is one of these for every subscription.
+    __slots__ = ("is_stopped", "on_next", "observer", "m")
 
     def __init__(self, observer):
-        super(AutoDetachObserver, self).__init__(self._next, self._error, self._completed)
+        self.is_stopped = False
+        self.on_next = self._next
 
         self.observer = observer
         self.m = SingleAssignmentDisposable()
@@ -18,13 +66,20 @@ class AutoDetachObserver(AbstractObserver):
             self.dispose()
             raise ex
 
-    def _error(self, exn):
+    def _on_next_batch(self, values):
+        try:
+            send_batch(self.observer, values)
+        except Exception as ex:
+            self.dispose()
+            raise ex
+
+    def _on_error(self, exn):
         try:
             self.observer.on_error(exn)
         finally:
             self.dispose()
 
-    def _completed(self):
+    def _on_completed(self):
         try:
             self.observer.on_completed()
         finally:
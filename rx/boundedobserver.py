@@ -0,0 +1,163 @@
+from collections import deque
+
+from rx import config
+from rx.abstractobserver import AbstractObserver
+from rx.disposables import SingleAssignmentDisposable, SerialDisposable
+from rx.internal import ArgumentOutOfRangeException
+from rx.internal.exceptions import QueueOverflowException
+
+# Overflow policies for elements arriving at a full queue
+DROP_OLDEST = "drop_oldest"  # Drop the oldest queued element
+DROP_NEWEST = "drop_newest"  # Drop the arriving element
+LATEST = "latest"  # Replace the newest queued element with the arriving one
+ERROR = "error"  # Drop the queue and fail with QueueOverflowException
+
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, LATEST, ERROR)
+
+
+class BoundedObserver(AbstractObserver):
+    """Observer that queues the elements it receives in a bounded queue, and
+    sends them to the observer on a scheduler. Receiving an element never
+    waits for the observer, so a slow observer only delays itself. When the
+    queue is full the overflow policy decides which element to drop.
+
+    Also the subscription of the observer: disposing it unsubscribes from
+    the source and drops the queue."""
+
+    def __init__(self, scheduler, observer, max_size, overflow=DROP_OLDEST):
+        """
+        Keyword arguments:
+        scheduler -- Scheduler to send the elements to the observer on.
+        observer -- Observer to send the elements to.
+        max_size -- Maximum number of queued elements.
+        overflow -- Policy for elements arriving at a full queue, one of
+            "drop_oldest", "drop_newest", "latest" or "error"."""
+
+        if max_size < 1:
+            raise ArgumentOutOfRangeException("max_size must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ArgumentOutOfRangeException(
+                "overflow must be one of %s" % ", ".join(OVERFLOW_POLICIES))
+
+        super(BoundedObserver, self).__init__(self._next, self._error,
+                                              self._completed,
+                                              self._next_batch)
+
+        self.scheduler = scheduler
+        self.observer = observer
+        self.max_size = max_size
+        self.overflow = overflow
+
+        self.lock = config["Lock"]()
+        self.queue = deque()
+        self.terminal = None
+        self.is_acquired = False
+        self.has_faulted = False
+        self.is_disposed = False
+        self.dropped = 0
+
+        # Subscription to the source, assigned by the subscriber
+        self.subscription = SingleAssignmentDisposable()
+        self.disposable = SerialDisposable()
+
+    @property
+    def depth(self):
+        """Number of queued elements."""
+
+        return len(self.queue)
+
+    def _next(self, value):
+        self._next_batch((value,))
+
+    def _next_batch(self, values):
+        overflowed = False
+        with self.lock:
+            queue = self.queue
+            max_size = self.max_size
+            overflow = self.overflow
+            for value in values:
+                if len(queue) >= max_size:
+                    self.dropped += 1
+                    if overflow == DROP_NEWEST:
+                        continue
+                    elif overflow == DROP_OLDEST:
+                        queue.popleft()
+                    elif overflow == LATEST:
+                        queue.pop()
+                    else:
+                        self.dropped += len(queue)
+                        queue.clear()
+                        overflowed = True
+                        break
+                queue.append(value)
+
+        if overflowed:
+            self.subscription.dispose()
+            self.fail(QueueOverflowException())
+        else:
+            self.ensure_active()
+
+    def _error(self, error):
+        def terminal():
+            self.observer.on_error(error)
+        with self.lock:
+            self.terminal = terminal
+        self.ensure_active()
+
+    def _completed(self):
+        def terminal():
+            self.observer.on_completed()
+        with self.lock:
+            self.terminal = terminal
+        self.ensure_active()
+
+    def ensure_active(self):
+        with self.lock:
+            if self.is_acquired or self.has_faulted or self.is_disposed:
+                return
+            if not len(self.queue) and self.terminal is None:
+                return
+            self.is_acquired = True
+
+        self.disposable.disposable = self.scheduler.schedule_recursive(self.run)
+
+    def run(self, recurse, state):
+        # Sends at most the elements queued when the step starts, so that
+        # other work on the scheduler still runs while the source is busy
+        with self.lock:
+            count = len(self.queue)
+            terminal = None if count else self.terminal
+            if not count and terminal is None:
+                self.is_acquired = False
+                return
+
+        try:
+            if terminal is not None:
+                terminal()
+                return
+
+            observer = self.observer
+            queue = self.queue
+            for _ in range(count):
+                with self.lock:
+                    if self.is_disposed or not len(queue):
+                        break
+                    value = queue.popleft()
+                observer.on_next(value)
+        except Exception:
+            with self.lock:
+                self.queue.clear()
+                self.has_faulted = True
+            raise
+
+        if not self.is_disposed:
+            recurse()
+
+    def dispose(self):
+        super(BoundedObserver, self).dispose()
+        self.subscription.dispose()
+        self.disposable.dispose()
+        with self.lock:
+            self.is_disposed = True
+            self.queue.clear()
+            self.terminal = None
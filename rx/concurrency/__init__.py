@@ -8,6 +8,7 @@ from .currentthreadscheduler import CurrentThreadScheduler, \
 from .virtualtimescheduler import VirtualTimeScheduler
 from .timeoutscheduler import TimeoutScheduler, timeout_scheduler
 from .newthreadscheduler import NewThreadScheduler, new_thread_scheduler
+from .threadpoolscheduler import ThreadPoolScheduler, thread_pool_scheduler
 from .eventloopscheduler import EventLoopScheduler
 from .historicalscheduler import HistoricalScheduler
 from .catchscheduler import CatchScheduler
@@ -1,6 +1,7 @@
 from rx.disposables import Disposable, SingleAssignmentDisposable
 
 from .scheduler import Scheduler
+from .scheduleperiodic import COALESCE
 
 class CatchScheduler(Scheduler):
     def __init__(self, scheduler, handler):
@@ -56,7 +57,8 @@ class CatchScheduler(Scheduler):
 
         return self._recursive_wrapper
 
-    def schedule_periodic(self, period, action, state=None):
+    def schedule_periodic(self, period, action, state=None,
+                          catch_up=COALESCE, shared=False):
         d = SingleAssignmentDisposable()
         failed = [False]
 
@@ -72,6 +74,6 @@ class CatchScheduler(Scheduler):
                 d.dispose()
                 return None
 
-        d.disposable = self._scheduler.schedule_periodic(periodic_action,
-                                                         period, state)
+        d.disposable = self._scheduler.schedule_periodic(
+            period, periodic_action, state, catch_up, shared)
         return d
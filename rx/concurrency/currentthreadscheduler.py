@@ -1,91 +1,184 @@
 # Current Thread Scheduler
 
 import time
+import heapq
 import logging
-from datetime import timedelta
+import threading
 
-from rx.internal import PriorityQueue
+from rx.disposables import CompositeDisposable
 
-from .scheduler import Scheduler
+from .scheduler import Scheduler, to_batch, to_absolute_batch
+from .schedulerecursive import ScheduleRecursive
 from .scheduleditem import ScheduledItem
 
 log = logging.getLogger('Rx')
 
 class Trampoline(object):
+    """Work scheduled on the current thread. A trampoline is only used by
+    the thread that created it, so its queue is a plain heap of (duetime,
+    sequence, item) entries, without a lock. The sequence keeps items with
+    the same duetime in scheduling order."""
+
     def __init__(self, scheduler):
-        self.queue = PriorityQueue(4)
+        self.queue = []
+        self.count = 0
         self.scheduler = scheduler
 
     def enqueue(self, item):
-        return self.queue.enqueue(item)
+        heapq.heappush(self.queue, (item.duetime, self.count, item))
+        self.count += 1
+
+    def enqueue_many(self, items):
+        queue = self.queue
+        count = self.count
+        entries = []
+        for item in items:
+            entries.append((item.duetime, count, item))
+            count += 1
+        self.count = count
+
+        # Rebuilding the heap is cheaper than pushing when the batch is
+        # large compared to the queue
+        if len(entries) > len(queue):
+            queue.extend(entries)
+            heapq.heapify(queue)
+        else:
+            for entry in entries:
+                heapq.heappush(queue, entry)
 
     def dispose(self):
         self.queue = None
 
     def run(self):
-        while len(self.queue):
-            item = self.queue.dequeue()
+        queue = self.queue
+        while queue:
+            item = heapq.heappop(queue)[2]
             if not item.is_cancelled():
-                diff = item.duetime - self.scheduler.now()
-                while diff > timedelta(0):
-                    seconds = diff.seconds + diff.microseconds / 1E6 + diff.days * 86400
+                diff = item.duetime - self.scheduler.monotonic()
+                while diff > 0:
                     log.warning("Do not schedule blocking work!")
-                    time.sleep(seconds)
-                    diff = item.duetime - self.scheduler.now()
+                    time.sleep(diff)
+                    diff = item.duetime - self.scheduler.monotonic()
 
                 if not item.is_cancelled():
-                    item.invoke()
+                    stats = self.scheduler.stats
+                    if stats is None:
+                        item.invoke()
+                    else:
+                        stats.invoke(item, -diff, len(queue))
+
+class TrampolineLocal(threading.local):
+    queue = None
+
+
+class TrampolineScheduleRecursive(ScheduleRecursive):
+    """Runs the next recursion step right away if nothing else is waiting
+    on the trampoline. Otherwise the step is queued behind the waiting work
+    as any other scheduled action."""
+
+    def can_inline(self):
+        trampoline = self.scheduler.local.queue
+        return trampoline is None or not len(trampoline.queue)
+
 
 class CurrentThreadScheduler(Scheduler):
     """Represents an object that schedules units of work on the current
     thread. You never want to schedule timeouts using the CurrentThreadScheduler
-    since it will block the current thread while waiting."""
+    since it will block the current thread while waiting.
+
+    Each thread gets its own trampoline, so work scheduled from different
+    threads never runs on, or contends for, another thread's queue."""
 
     def __init__(self):
         """Gets a scheduler that schedules work as soon as possible on the
         current thread."""
 
-        self.queue = None
+        self.local = TrampolineLocal()
+
+    @property
+    def queue(self):
+        """The trampoline of the calling thread, or None if the trampoline
+        is not active on this thread."""
+
+        return self.local.queue
+
+    @queue.setter
+    def queue(self, value):
+        self.local.queue = value
 
     def schedule(self, action, state=None):
         """Schedules an action to be executed."""
 
         log.debug("CurrentThreadScheduler.schedule(state=%s)", state)
-        return self.schedule_relative(timedelta(0), action, state)
+        return self.schedule_relative(0, action, state)
 
     def schedule_relative(self, duetime, action, state=None):
         """Schedules an action to be executed after duetime."""
 
-        duetime = self.to_timedelta(duetime)
-
-        dt = self.now() + Scheduler.normalize(duetime)
+        dt = self.monotonic() + max(0, self.to_seconds(duetime))
         si = ScheduledItem(self, state, action, dt)
+        self._enqueue([si])
+        return si.disposable
 
-        if not self.queue:
-            self.queue = Trampoline(self)
+    def schedule_many(self, actions):
+        """Schedules a batch of actions to be executed, in order. The batch
+        is enqueued on the trampoline at once."""
+
+        dt = self.monotonic()
+        items = [ScheduledItem(self, state, action, dt)
+                 for action, state in to_batch(actions)]
+        self._enqueue(items)
+        return CompositeDisposable([si.disposable for si in items])
+
+    def schedule_absolute_many(self, pairs):
+        """Schedules a batch of actions to be executed at their duetimes.
+        The batch is enqueued on the trampoline at once."""
+
+        now = self.now()
+        monotonic = self.monotonic()
+        items = []
+        for duetime, action, state in to_absolute_batch(pairs):
+            seconds = self.to_seconds(self.to_datetime(duetime) - now)
+            items.append(ScheduledItem(self, state, action,
+                                       monotonic + max(0, seconds)))
+        self._enqueue(items)
+        return CompositeDisposable([si.disposable for si in items])
+
+    def _enqueue(self, items):
+        """Enqueues the items on the trampoline of the calling thread, and
+        runs the trampoline if it is not already running."""
+
+        local = self.local
+        queue = local.queue
+        if not queue:
+            queue = local.queue = Trampoline(self)
             try:
-                self.queue.enqueue(si)
-                self.queue.run()
+                queue.enqueue_many(items)
+                queue.run()
             finally:
-                self.queue.dispose()
-                self.queue = None
+                queue.dispose()
+                local.queue = None
         else:
-            self.queue.enqueue(si)
+            queue.enqueue_many(items)
 
-        return si.disposable
+    def schedule_recursive(self, action, state=None):
+        """Schedules an action to be executed recursively on the
+        trampoline."""
+
+        return TrampolineScheduleRecursive(self, action, state).start()
 
     def schedule_absolute(self, duetime, action, state=None):
         """Schedules an action to be executed at duetime."""
 
         duetime = self.to_datetime(duetime)
-        return self.schedule_relative(duetime - self.now(), action, state=None)
+        return self.schedule_relative(duetime - self.now(), action, state)
 
     def schedule_required(self):
         """Gets a value indicating whether the caller must call a schedule 
         method. If the trampoline is active, then it returns False; otherwise, 
         if  the trampoline is not active, then it returns True."""
         
-        return self.queue is None
+        return self.local.queue is None
 
     def ensure_trampoline(self, action):
         """Method for testing the CurrentThreadScheduler"""
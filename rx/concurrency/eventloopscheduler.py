@@ -1,13 +1,12 @@
 import logging
 import threading
-from threading import Timer
 
 from rx.concurrency import ScheduledItem
-from rx.disposables import Disposable
+from rx.disposables import Disposable, CompositeDisposable
 from rx.internal.exceptions import DisposedException
 from rx.internal.priorityqueue import PriorityQueue
 
-from .scheduler import Scheduler
+from .scheduler import Scheduler, to_batch, to_absolute_batch
 
 log = logging.getLogger('Rx')
 
@@ -24,11 +23,11 @@ class EventLoopScheduler(Scheduler, Disposable):
 
         self.thread_factory = thread_factory or default_factory
         self.thread = None
-        self.timer = None
+        # The loop thread always needs a real lock, whatever rx.config["Lock"]
+        self.lock = threading.Lock()
         self.condition = threading.Condition(self.lock)
         self.queue = PriorityQueue()
         self.ready_list = []
-        self.next_item = None
 
         self.exit_if_empty = exit_if_empty
 
@@ -38,8 +37,10 @@ class EventLoopScheduler(Scheduler, Disposable):
         if self.is_disposed:
             raise DisposedException()
 
-        si = ScheduledItem(self, state, action, None)
-        
+        # Ready items only need a duetime to record the lag in the stats
+        duetime = None if self.stats is None else self.monotonic()
+        si = ScheduledItem(self, state, action, duetime)
+
         with self.condition:
             self.ready_list.append(si)
             self.condition.notify()  # signal that a new item is available
@@ -50,19 +51,14 @@ class EventLoopScheduler(Scheduler, Disposable):
     def schedule_relative(self, duetime, action, state=None):
         """Schedules an action to be executed after duetime."""
 
-        return self.schedule_absolute(duetime + self.now(), action, state=None)
-
-    def schedule_absolute(self, duetime, action, state=None):
-        """Schedules an action to be executed at duetime."""
-
         if self.is_disposed:
             raise DisposedException()
 
-        dt = self.to_datetime(duetime)
-        si = ScheduledItem(self, state, action, dt)
+        seconds = self.to_seconds(duetime)
+        si = ScheduledItem(self, state, action, self.monotonic() + seconds)
 
         with self.condition:
-            if dt < self.now():
+            if seconds <= 0:
                 self.ready_list.append(si)
             else:
                 self.queue.enqueue(si)
@@ -71,6 +67,57 @@ class EventLoopScheduler(Scheduler, Disposable):
 
         return Disposable(si.cancel)
 
+    def schedule_absolute(self, duetime, action, state=None):
+        """Schedules an action to be executed at duetime."""
+
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now(), action, state)
+
+    def schedule_many(self, actions):
+        """Schedules a batch of actions to be executed, in order. The batch
+        is enqueued under a single lock with a single wakeup of the event
+        loop thread."""
+
+        if self.is_disposed:
+            raise DisposedException()
+
+        duetime = None if self.stats is None else self.monotonic()
+        items = [ScheduledItem(self, state, action, duetime)
+                 for action, state in to_batch(actions)]
+
+        with self.condition:
+            self.ready_list.extend(items)
+            self.condition.notify()
+            self.ensure_thread()
+
+        return CompositeDisposable([si.disposable for si in items])
+
+    def schedule_absolute_many(self, pairs):
+        """Schedules a batch of actions to be executed at their duetimes.
+        The batch is enqueued under a single lock with a single wakeup of
+        the event loop thread."""
+
+        if self.is_disposed:
+            raise DisposedException()
+
+        now = self.now()
+        monotonic = self.monotonic()
+        ready = []
+        timed = []
+        for duetime, action, state in to_absolute_batch(pairs):
+            seconds = self.to_seconds(self.to_datetime(duetime) - now)
+            si = ScheduledItem(self, state, action, monotonic + seconds)
+            (ready if seconds <= 0 else timed).append(si)
+
+        with self.condition:
+            self.ready_list.extend(ready)
+            if timed:
+                self.queue.enqueue_many(timed)
+            self.condition.notify()
+            self.ensure_thread()
+
+        return CompositeDisposable([si.disposable for si in ready + timed])
+
     def ensure_thread(self):
         """Ensures there is an event loop thread running. Should be called
         under the gate."""
@@ -81,8 +128,9 @@ class EventLoopScheduler(Scheduler, Disposable):
 
     def run(self):
         """Event loop scheduled on the designated event loop thread. The loop is
-        suspended/resumed using the event which gets set by calls to Schedule,
-        the next item timer, or calls to dispose."""
+        suspended/resumed using the condition which gets notified by calls to
+        Schedule or calls to dispose. Timed work is waited for on the same
+        condition, so no helper threads are needed."""
 
         while True:
             ready = []
@@ -96,30 +144,28 @@ class EventLoopScheduler(Scheduler, Disposable):
                 if self.is_disposed:
                     return
 
-                while len(self.queue) and self.queue.peek().duetime <= self.now():
+                now = self.monotonic()
+                while len(self.queue) and self.queue.peek().duetime <= now:
                     item = self.queue.dequeue()
                     self.ready_list.append(item)
 
-                if len(self.queue):
-                    _next = self.queue.peek()
-                    if self.next_item is None or _next != self.next_item:
-                        self.next_item = _next
-                        due = _next.duetime - self.now()
-                        seconds = due.total_seconds()
-                        log.debug("timeout: %s", seconds)
-
-                        self.timer = Timer(seconds, self.tick, args=(_next,))
-                        self.timer.start()
-
                 if len(self.ready_list):
-                    ready = self.ready_list[:]
+                    ready = self.ready_list
                     self.ready_list = []
+                elif len(self.queue):
+                    seconds = self.queue.peek().duetime - now
+                    log.debug("timeout: %s", seconds)
+                    self.condition.wait(seconds)
                 else:
                     self.condition.wait()
-                    
-            for item in ready:
-                if not item.is_cancelled():
-                    item.invoke()
+
+            stats = self.stats
+            if stats is None:
+                for item in ready:
+                    if not item.is_cancelled():
+                        item.invoke()
+            else:
+                self.invoke_with_stats(ready, stats)
 
             if self.exit_if_empty:
                 with self.condition:
@@ -127,7 +173,17 @@ class EventLoopScheduler(Scheduler, Disposable):
                         self.thread = None
                         return
 
-    def dipose(self):
+    def invoke_with_stats(self, ready, stats):
+        """Runs the ready items, recording them in the stats."""
+
+        for index, item in enumerate(ready):
+            if not item.is_cancelled():
+                depth = len(ready) - index - 1 + len(self.ready_list) + \
+                    len(self.queue)
+                lag = self.monotonic() - item.duetime if item.duetime else 0
+                stats.invoke(item, lag, depth)
+
+    def dispose(self):
         """Ends the thread associated with this scheduler. All remaining work
         in the scheduler queue is abandoned.
         """
@@ -135,14 +191,6 @@ class EventLoopScheduler(Scheduler, Disposable):
         with self.condition:
             if not self.is_disposed:
                 self.is_disposed = True
-
-    def tick(self, item):
-        with self.condition:
-
-            if not self.is_disposed:
-                if self.queue.remove(item):
-                    self.ready_list.append(item)
-
-            self.condition.notify()  # signal that a new item is available
+                self.condition.notify()
 
 Scheduler.event_loop = event_loop_scheduler = EventLoopScheduler()
\ No newline at end of file
@@ -1,17 +1,42 @@
 from datetime import timedelta
 
+from rx.autodetachobserver import current_subscription
+
 from .scheduler import Scheduler
+from .schedulerecursive import ScheduleRecursive
 
 # Immediate Scheduler
 SCHEDULER_NO_BLOCK_ERROR = "Scheduler is not allowed to block the thread"
 
 
+class ImmediateScheduleRecursive(ScheduleRecursive):
+    """Runs recursive work in a loop on the calling thread instead of
+    nesting a call per recursion step.
+
+    The loop runs every step before schedule_recursive returns. Inside a
+    subscribe function, the loop also stops once the subscription is
+    disposed, since its disposable does not exist before the loop ends."""
+
+    def can_inline(self):
+        return True
+
+    def start(self):
+        self.subscription = current_subscription()
+        return super(ImmediateScheduleRecursive, self).start()
+
+
 class ImmediateScheduler(Scheduler):
     def schedule(self, action, state=None):
         """Schedules an action to be executed."""
 
         return self.invoke_action(action, state)
 
+    def schedule_recursive(self, action, state=None):
+        """Schedules an action to be executed recursively. The recursion
+        steps run in a loop, so the stack does not grow per step."""
+
+        return ImmediateScheduleRecursive(self, action, state).start()
+
     def schedule_relative(self, duetime, action, state=None):
         """Schedules an action to be executed after duetime."""
 
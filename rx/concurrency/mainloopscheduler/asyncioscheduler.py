@@ -2,12 +2,13 @@
 # and the AsyncIOScheduler
 
 import logging
+from collections import deque
 from datetime import datetime, timedelta
 asyncio = None
 
-from rx.disposables import Disposable, SingleAssignmentDisposable, \
-    CompositeDisposable
-from rx.concurrency.scheduler import Scheduler
+from rx.disposables import Disposable, CompositeDisposable
+from rx.concurrency.scheduler import Scheduler, to_batch, to_absolute_batch
+from rx.concurrency.scheduleditem import ScheduledItem
 
 log = logging.getLogger("Rx")
 
@@ -22,11 +23,10 @@ class AsyncIOScheduler(Scheduler):
     def schedule(self, action, state=None):
         """Schedules an action to be executed."""
 
-        scheduler = self
-        disposable = SingleAssignmentDisposable()
+        si = ScheduledItem(self, state, action, self.loop.time())
 
         def interval():
-            disposable.disposable = action(scheduler, state)
+            self._invoke(si)
 
         handle = [self.loop.call_soon(interval)]
 
@@ -34,7 +34,7 @@ class AsyncIOScheduler(Scheduler):
             # nonlocal handle
             handle[0].cancel()
 
-        return CompositeDisposable(disposable, Disposable(dispose))
+        return CompositeDisposable(si.disposable, Disposable(dispose))
 
     def schedule_relative(self, duetime, action, state=None):
         """Schedules an action to be executed at duetime.
@@ -47,14 +47,14 @@ class AsyncIOScheduler(Scheduler):
         action (best effort)."""
 
         scheduler = self
-        seconds = self.to_relative(duetime)/1000.0
+        seconds = self.to_seconds(duetime)
         if seconds == 0:
             return scheduler.schedule(action, state)
 
-        disposable = SingleAssignmentDisposable()
+        si = ScheduledItem(self, state, action, self.loop.time() + seconds)
 
         def interval():
-            disposable.disposable = action(scheduler, state)
+            self._invoke(si)
 
         handle = [self.loop.call_later(seconds, interval)]
 
@@ -62,7 +62,7 @@ class AsyncIOScheduler(Scheduler):
             # nonlocal handle
             handle[0].cancel()
 
-        return CompositeDisposable(disposable, Disposable(dispose))
+        return CompositeDisposable(si.disposable, Disposable(dispose))
 
     def schedule_absolute(self, duetime, action, state=None):
         """Schedules an action to be executed at duetime.
@@ -81,6 +81,111 @@ class AsyncIOScheduler(Scheduler):
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now(), action, state)
 
+    def schedule_many(self, actions):
+        """Schedules a batch of actions to be executed, in order. The whole
+        batch runs from a single callback of the event loop.
+
+        Keyword arguments:
+        :param list actions: Iterable of actions, or of (action, state)
+            tuples.
+
+        :returns: The disposable object used to cancel all the scheduled
+            actions (best effort).
+        :rtype: Disposable
+        """
+
+        duetime = self.loop.time()
+        items = [ScheduledItem(self, state, action, duetime)
+                 for action, state in to_batch(actions)]
+
+        pending = deque(items)
+        handle = [None]
+
+        def interval():
+            # An action that raises leaves the rest of the batch to another
+            # callback, instead of dropping it
+            try:
+                while pending:
+                    item = pending.popleft()
+                    if not item.is_cancelled():
+                        self._invoke(item)
+            finally:
+                if pending:
+                    handle[0] = self.loop.call_soon(interval)
+
+        handle[0] = self.loop.call_soon(interval)
+
+        def dispose():
+            pending.clear()
+            handle[0].cancel()
+
+        return CompositeDisposable([si.disposable for si in items] +
+                                   [Disposable(dispose)])
+
+    def schedule_absolute_many(self, pairs):
+        """Schedules a batch of actions to be executed at their duetimes.
+        The batch holds a single timer on the event loop at a time, set for
+        the earliest pending duetime.
+
+        Keyword arguments:
+        :param list pairs: Iterable of (duetime, action) or
+            (duetime, action, state) tuples.
+
+        :returns: The disposable object used to cancel all the scheduled
+            actions (best effort).
+        :rtype: Disposable
+        """
+
+        now = self.now()
+        loop_time = self.loop.time()
+        items = []
+        for duetime, action, state in to_absolute_batch(pairs):
+            seconds = self.to_seconds(self.to_datetime(duetime) - now)
+            items.append(ScheduledItem(self, state, action,
+                                       loop_time + max(0, seconds)))
+
+        # Stable sort keeps the order of items with equal duetimes
+        pending = sorted(items, key=lambda item: item.duetime)
+        pending.reverse()
+        handle = [None]
+
+        def interval():
+            # The timer is set again even if an action raises, so that the
+            # rest of the batch still runs
+            try:
+                now = self.loop.time()
+                while pending and pending[-1].duetime <= now:
+                    item = pending.pop()
+                    if not item.is_cancelled():
+                        self._invoke(item)
+            finally:
+                set_timer()
+
+        def set_timer():
+            if pending:
+                handle[0] = self.loop.call_at(pending[-1].duetime, interval)
+
+        set_timer()
+
+        def dispose():
+            del pending[:]
+            if handle[0]:
+                handle[0].cancel()
+
+        return CompositeDisposable([si.disposable for si in items] +
+                                   [Disposable(dispose)])
+
+    def _invoke(self, item):
+        stats = self.stats
+        if stats is None:
+            item.invoke()
+        else:
+            # Callbacks waiting on the event loop, if the loop exposes them
+            loop = self.loop
+            depth = len(getattr(loop, "_ready", ())) + \
+                len(getattr(loop, "_scheduled", ()))
+            stats.invoke(item, loop.time() - item.duetime, depth)
+
     def now(self):
         """Represents a notion of time for this scheduler. Tasks being
         scheduled on a scheduler will adhere to the time denoted by this
@@ -88,3 +193,10 @@ class AsyncIOScheduler(Scheduler):
         """
         
         return self.to_datetime(self.loop.time())
+
+    def monotonic(self):
+        """Represents a monotonic notion of time for this scheduler as float
+        seconds, using the clock of the event loop.
+        """
+
+        return self.loop.time()
@@ -48,7 +48,7 @@ class GEventScheduler(Scheduler):
         action (best effort)."""
 
         scheduler = self
-        seconds = self.to_relative(duetime)/1000.0
+        seconds = self.to_seconds(duetime)
         if not seconds:
             return scheduler.schedule(action, state)
 
@@ -46,7 +46,7 @@ class IOLoopScheduler(Scheduler):
         action (best effort)."""
 
         scheduler = self
-        seconds = scheduler.to_relative(duetime)/1000.0
+        seconds = scheduler.to_seconds(duetime)
         if not seconds:
             return scheduler.schedule(action, state)
 
@@ -29,7 +29,7 @@ class TwistedScheduler(Scheduler):
         action (best effort)."""
 
         scheduler = self
-        seconds = self.to_relative(duetime)/1000.0
+        seconds = self.to_seconds(duetime)
 
         disposable = SingleAssignmentDisposable()
         def interval():
@@ -1,7 +1,6 @@
 import logging
 import threading
 from threading import Timer
-from datetime import timedelta
 
 from rx.disposables import Disposable, SingleAssignmentDisposable, \
     CompositeDisposable
@@ -38,15 +37,14 @@ class NewThreadScheduler(Scheduler):
         """Schedules an action to be executed after duetime."""
 
         scheduler = self
-        timespan = self.to_timedelta(duetime)
-        if timespan == timedelta(0):
+        seconds = self.to_seconds(duetime)
+        if seconds <= 0:
             return scheduler.schedule(action, state)
 
         disposable = SingleAssignmentDisposable()
         def interval():
             disposable.disposable = action(scheduler, state)
 
-        seconds = timespan.total_seconds()
         log.debug("timeout: %s", seconds)
         timer = Timer(seconds, interval)
         timer.start()
@@ -59,6 +57,7 @@ class NewThreadScheduler(Scheduler):
     def schedule_absolute(self, duetime, action, state=None):
         """Schedules an action to be executed at duetime."""
 
-        return self.schedule_relative(duetime - self.now(), action, state=None)
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now(), action, state)
 
 Scheduler.new_thread = new_thread_scheduler = NewThreadScheduler()
\ No newline at end of file
@@ -6,6 +6,9 @@ def default_sub_comparer(x, y):
 
 
 class ScheduledItem(object):
+    __slots__ = ("scheduler", "state", "action", "duetime", "comparer",
+                 "disposable")
+
     def __init__(self, scheduler, state, action, duetime, comparer=None):
         self.scheduler = scheduler
         self.state = state
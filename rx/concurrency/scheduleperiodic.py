@@ -0,0 +1,134 @@
+import math
+
+from rx import config
+from rx.disposables import Disposable, SerialDisposable
+from rx.internal import ArgumentOutOfRangeException
+
+# Catch-up policies for ticks that are late by more than a period
+SKIP = "skip"  # Drop the missed ticks and wait for the next deadline
+BURST = "burst"  # Run every missed tick, back to back
+COALESCE = "coalesce"  # Run the missed ticks once, then resume on schedule
+
+CATCH_UP_POLICIES = (SKIP, BURST, COALESCE)
+
+
+class SchedulePeriodic(object):
+    """Drift free periodic scheduling. Every deadline is computed from the
+    start time, so the execution time of the action does not accumulate.
+    Works for any scheduler that can schedule relative work."""
+
+    def __init__(self, scheduler, period, action, state=None,
+                 catch_up=COALESCE):
+        """
+        Keyword arguments:
+        scheduler -- Scheduler to run the ticks on.
+        period -- Period for running the work periodically.
+        action -- Action to be executed, potentially updating the state.
+        state -- Initial state passed to the action upon the first iteration.
+        catch_up -- Policy for ticks that are late by more than a period,
+            one of "skip", "burst" or "coalesce"."""
+
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ArgumentOutOfRangeException(
+                "catch_up must be one of %s" % ", ".join(CATCH_UP_POLICIES))
+
+        self._scheduler = scheduler
+        self._period = max(0.0, scheduler.to_seconds(period))
+        self._action = action
+        self._state = state
+        self._catch_up = catch_up
+        self._due = None
+        self._cancel = SerialDisposable()
+
+    def tick(self, scheduler, state):
+        new_state = self._action(self._state)
+        if new_state is not None:  # Update state if other than None
+            self._state = new_state
+
+        period = self._period
+        now = self._scheduler.monotonic()
+        due = self._due + period
+
+        if due < now and period:
+            missed = math.floor((now - due) / period) * period
+            if self._catch_up == SKIP:
+                due += missed + period
+            elif self._catch_up == COALESCE:
+                due += missed
+
+        self._due = due
+        self._cancel.disposable = self._scheduler.schedule_relative(
+            max(0.0, due - now), self.tick)
+
+    def start(self):
+        """Returns the disposable object used to cancel the scheduled recurring
+        action (best effort).
+        """
+
+        self._due = self._scheduler.monotonic() + self._period
+        self._cancel.disposable = self._scheduler.schedule_relative(
+            self._period, self.tick)
+        return self._cancel
+
+
+class SharedSchedulePeriodic(object):
+    """A single periodic tick source multicast to all actions scheduled with
+    the same period on a scheduler. The ticks start with the first action.
+    When the last action is disposed, the ticks stop and the ticker retires:
+    it accepts no more actions and is removed from its scheduler."""
+
+    def __init__(self, scheduler, period, catch_up=COALESCE, remove=None):
+        """
+        Keyword arguments:
+        scheduler -- Scheduler to run the ticks on.
+        period -- Period for running the work periodically.
+        catch_up -- Policy for ticks that are late by more than a period.
+        remove -- [Optional] Function called with the ticker once it
+            retires."""
+
+        self._scheduler = scheduler
+        self._period = period
+        self._catch_up = catch_up
+        self._remove = remove
+        self._entries = []
+        self._subscription = None
+        self.is_retired = False
+
+        self.lock = config["Lock"]()
+
+    def add(self, action, state=None):
+        """Adds an action to run on every tick. Returns the disposable used
+        to remove the action again, or None if the ticker has retired."""
+
+        entry = [action, state]
+        with self.lock:
+            if self.is_retired:
+                return None
+            self._entries = self._entries + [entry]
+            if len(self._entries) == 1:
+                self._subscription = SchedulePeriodic(
+                    self._scheduler, self._period, self.tick, None,
+                    self._catch_up).start()
+
+        def dispose():
+            subscription = None
+            with self.lock:
+                entries = [e for e in self._entries if e is not entry]
+                if len(entries) < len(self._entries):
+                    self._entries = entries
+                    if not entries:
+                        subscription = self._subscription
+                        self._subscription = None
+                        self.is_retired = True
+
+            if subscription:
+                subscription.dispose()
+                if self._remove:
+                    self._remove(self)
+        return Disposable(dispose)
+
+    def tick(self, state):
+        for entry in self._entries:
+            new_state = entry[0](entry[1])
+            if new_state is not None:
+                entry[1] = new_state
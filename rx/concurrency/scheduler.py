@@ -1,8 +1,30 @@
-from threading import Timer
+from threading import Lock
 from datetime import datetime, timedelta
 
 from rx.disposables import Disposable, CompositeDisposable
-from rx.internal.basic import default_now
+from rx.internal.basic import default_now, default_clock
+
+from .schedulerecursive import ScheduleRecursive
+from .schedulerstats import SchedulerStats
+from .scheduleperiodic import SchedulePeriodic, SharedSchedulePeriodic, \
+    COALESCE
+
+shared_periodic_lock = Lock()
+
+
+def to_batch(actions):
+    """Returns a list of (action, state) tuples for a batch of actions."""
+
+    return [item if isinstance(item, tuple) else (item, None)
+            for item in actions]
+
+
+def to_absolute_batch(pairs):
+    """Returns a list of (duetime, action, state) tuples for a batch of
+    (duetime, action) or (duetime, action, state) tuples."""
+
+    return [item if len(item) == 3 else (item[0], item[1], None)
+            for item in pairs]
 
 
 class Scheduler(object):
@@ -10,6 +32,9 @@ class Scheduler(object):
     schedulers.
     """
 
+    # Instrumentation, see enable_stats
+    stats = None
+
     def schedule(self, action, state=None):
         raise NotImplementedError
 
@@ -19,42 +44,90 @@ class Scheduler(object):
     def schedule_absolute(self, duetime, action, state=None):
         raise NotImplementedError
 
+    def schedule_many(self, actions):
+        """Schedules a batch of actions to be executed, in order. Schedulers
+        override this to enqueue the whole batch at once.
+
+        Keyword arguments:
+        actions -- Iterable of actions, or of (action, state) tuples.
+
+        Returns a single disposable object used to cancel all the scheduled
+        actions (best effort)."""
+
+        return CompositeDisposable([self.schedule(action, state)
+                                    for action, state in to_batch(actions)])
+
+    def schedule_absolute_many(self, pairs):
+        """Schedules a batch of actions to be executed at their duetimes.
+        Schedulers override this to enqueue the whole batch at once.
+
+        Keyword arguments:
+        pairs -- Iterable of (duetime, action) or (duetime, action, state)
+            tuples.
+
+        Returns a single disposable object used to cancel all the scheduled
+        actions (best effort)."""
+
+        return CompositeDisposable([
+            self.schedule_absolute(duetime, action, state)
+            for duetime, action, state in to_absolute_batch(pairs)])
+
     def invoke_action(self, action, state=None):
         action(self, state)
         return Disposable.empty()
 
-    def schedule_periodic(self, period, action, state=None):
-        """Schedules a periodic piece of work by dynamically discovering the
-        schedulers capabilities.
+    def schedule_periodic(self, period, action, state=None,
+                          catch_up=COALESCE, shared=False):
+        """Schedules a periodic piece of work. Each deadline is computed from
+        the start time so the period does not drift with the execution time
+        of the action.
 
         Keyword arguments:
         period -- Period for running the work periodically.
         action -- Action to be executed.
         state -- [Optional] Initial state passed to the action upon the first
             iteration.
+        catch_up -- [Optional] Policy for ticks that are late by more than a
+            period. "skip" drops the missed ticks, "burst" runs all of them
+            back to back and "coalesce" runs them once. Defaults to
+            "coalesce".
+        shared -- [Optional] If True, the action is run by a single tick
+            source shared by all shared periodic actions with the same
+            period on this scheduler. The first tick may then come sooner
+            than a full period. Defaults to False.
 
         Returns the disposable object used to cancel the scheduled recurring
         action (best effort)."""
 
-        period /= 1000.0
-        timer = [None]
-        s = [state]
+        if shared:
+            return self._schedule_shared_periodic(period, action, state,
+                                                  catch_up)
 
-        def interval():
-            new_state = action(s[0])
-            if new_state is not None:  # Update state if other than None
-                s[0] = new_state
+        return SchedulePeriodic(self, period, action, state, catch_up).start()
 
-            timer[0] = Timer(period, interval)
-            timer[0].start()
+    def _schedule_shared_periodic(self, period, action, state, catch_up):
+        key = (self.to_seconds(period), catch_up)
 
-        timer[0] = Timer(period, interval)
-        timer[0].start()
+        def remove(ticker):
+            with shared_periodic_lock:
+                tickers = self.__dict__.get("_shared_periodic", {})
+                if tickers.get(key) is ticker:
+                    del tickers[key]
 
-        def dispose():
-            timer[0].cancel()
+        while True:
+            with shared_periodic_lock:
+                tickers = self.__dict__.setdefault("_shared_periodic", {})
+                ticker = tickers.get(key)
+                if ticker is None or ticker.is_retired:
+                    ticker = SharedSchedulePeriodic(self, period, catch_up,
+                                                    remove)
+                    tickers[key] = ticker
 
-        return Disposable(dispose)
+            # A ticker retires once its last action is disposed, which may
+            # happen between the lookup and adding the action
+            disposable = ticker.add(action, state)
+            if disposable is not None:
+                return disposable
 
     @staticmethod
     def invoke_rec_immediate(scheduler, pair):
@@ -131,10 +204,7 @@ class Scheduler(object):
         :rtype: Disposable
         """
 
-        def scheduled_action(scheduler, pair):
-            return self.invoke_rec_immediate(scheduler, pair)
-
-        return self.schedule(scheduled_action, dict(state=state, action=action))
+        return ScheduleRecursive(self, action, state).start()
 
     def schedule_recursive_with_relative(self, duetime, action):
         """Schedules an action to be executed recursively after a specified
@@ -224,6 +294,23 @@ class Scheduler(object):
             duetime=duetime, action=action2,
             state={"first": state, "second": action})
 
+    def enable_stats(self):
+        """Starts recording queue depth, scheduling lag and run time
+        histograms for the actions run by this scheduler. Schedulers that
+        are not instrumented leave the stats empty.
+
+        Returns the SchedulerStats, see SchedulerStats.snapshot() and
+        SchedulerStats.to_observable()."""
+
+        if self.stats is None:
+            self.stats = SchedulerStats()
+        return self.stats
+
+    def disable_stats(self):
+        """Stops recording statistics."""
+
+        self.stats = None
+
     def now(self):
         """Represents a notion of time for this scheduler. Tasks being
         scheduled on a scheduler will adhere to the time denoted by this
@@ -235,6 +322,14 @@ class Scheduler(object):
     def default_now(self):
         return default_now()
 
+    def monotonic(self):
+        """Represents a monotonic notion of time for this scheduler as float
+        seconds. Unlike now() it is not affected by changes of the system
+        clock, and is what schedulers use internally to track due times.
+        """
+
+        return default_clock()
+
     @classmethod
     def to_relative(cls, timespan):
         """Converts time value to milliseconds"""
@@ -249,6 +344,19 @@ class Scheduler(object):
 
         return int(timespan)
 
+    @classmethod
+    def to_seconds(cls, timespan):
+        """Converts time value to float seconds"""
+
+        if isinstance(timespan, int):
+            return timespan / 1000.0
+        elif isinstance(timespan, float):
+            return timespan
+        elif isinstance(timespan, datetime):
+            timespan = timespan - datetime.fromtimestamp(0)
+
+        return timespan.total_seconds()
+
     @classmethod
     def to_datetime(cls, duetime):
         """Converts time value to datetime"""
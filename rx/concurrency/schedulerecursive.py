@@ -0,0 +1,111 @@
+from collections import deque
+
+try:
+    from threading import get_ident
+except ImportError:
+    from thread import get_ident
+
+from rx import config
+
+
+class ScheduleRecursive(object):
+    """Recursion engine for Scheduler.schedule_recursive. One work item is
+    reused for every recursion step, and disposing it sets a single flag
+    that stops the recursion.
+
+    Schedulers that may run the next step on the calling thread override
+    can_inline. A step requested while the action runs is then queued on
+    the work item and run by a loop once the action returns, so synchronous
+    sources neither allocate nor grow the stack per element."""
+
+    def __init__(self, scheduler, action, state=None):
+        """
+        Keyword arguments:
+        scheduler -- Scheduler to run the recursion steps on.
+        action -- Action to execute recursively. The first parameter passed
+            to the action is used to trigger recursive scheduling of the
+            action.
+        state -- State to be given to the action function."""
+
+        self.scheduler = scheduler
+        self.action = action
+        self.state = state
+        self.pending = deque()
+        self.is_running = False
+        self.is_disposed = False
+        self.thread = None  # Identity of the thread running the loop
+        self.handle = None
+
+        # Scope of the subscription that owns a loop running before its
+        # subscribe function returns, see current_subscription
+        self.subscription = None
+
+        self.lock = config["Lock"]()
+
+    def can_inline(self):
+        """Returns True if a step requested while the action runs may be run
+        by the loop of the running step instead of being scheduled."""
+
+        return False
+
+    def start(self):
+        """Schedules the first step. Returns the work item, which is the
+        disposable used to cancel the recursion (best effort)."""
+
+        self.handle = self.scheduler.schedule(self.invoke, self.state)
+        return self
+
+    def recurse(self, state=None):
+        # Only the thread running the loop calls recurse while the loop is
+        # running, so this path needs no lock
+        if self.thread == get_ident() and self.can_inline():
+            self.pending.append(state)
+        else:
+            self.handle = self.scheduler.schedule(self.invoke, state)
+
+    def invoke(self, scheduler, state):
+        with self.lock:
+            if self.is_disposed:
+                return
+            if self.is_running:
+                self.pending.append(state)
+                return
+            self.is_running = True
+            self.thread = get_ident()
+
+        action = self.action
+        recurse = self.recurse
+        pending = self.pending
+        subscription = self.subscription
+        try:
+            while True:
+                action(recurse, state)
+
+                if subscription is not None and subscription.is_stopped():
+                    self.dispose()
+
+                if pending and not self.is_disposed:
+                    state = pending.popleft()
+                    continue
+
+                with self.lock:
+                    if self.is_disposed or not pending:
+                        self.is_running = False
+                        self.thread = None
+                        return
+                    state = pending.popleft()
+        except Exception:
+            with self.lock:
+                pending.clear()
+                self.is_running = False
+                self.thread = None
+            raise
+
+    def dispose(self):
+        with self.lock:
+            self.is_disposed = True
+            self.pending.clear()
+            handle = self.handle
+
+        if handle is not None:
+            handle.dispose()
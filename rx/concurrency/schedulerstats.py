@@ -0,0 +1,134 @@
+import math
+
+from rx import config
+from rx.internal.basic import default_clock
+
+
+class Histogram(object):
+    """Histogram with power of two buckets. Recording a value is a few
+    arithmetic operations, regardless of the number of values recorded."""
+
+    def __init__(self, min_exponent=-20, max_exponent=20):
+        """
+        Keyword arguments:
+        min_exponent -- Exponent of the upper bound of the first bucket.
+            Smaller values are counted in the first bucket. Defaults to
+            -20, about one microsecond for values in seconds.
+        max_exponent -- Exponent of the upper bound of the last bucket.
+            Larger values are counted in the last bucket."""
+
+        self.min_exponent = min_exponent
+        self.max_exponent = max_exponent
+        self.buckets = [0] * (max_exponent - min_exponent + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+        if value > 0:
+            mantissa, exponent = math.frexp(value)
+            if mantissa == 0.5:
+                exponent -= 1  # Exact powers of two are the bucket bound
+            index = min(max(exponent, self.min_exponent),
+                        self.max_exponent) - self.min_exponent
+        else:
+            index = 0
+        self.buckets[index] += 1
+
+    def percentile(self, percent):
+        """Returns the upper bound of the bucket holding the given
+        percentile of the recorded values, or 0 if nothing was recorded."""
+
+        if not self.count:
+            return 0
+
+        rank = self.count * percent / 100.0
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(2.0 ** (index + self.min_exponent), self.max)
+        return self.max
+
+    def snapshot(self):
+        """Returns the histogram as a dictionary with count, mean, max,
+        p50, p99 and the non empty (upper bound, count) buckets."""
+
+        return {
+            "count": self.count,
+            "mean": self.total / float(self.count) if self.count else 0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": [(2.0 ** (index + self.min_exponent), count)
+                        for index, count in enumerate(self.buckets) if count]
+        }
+
+
+class SchedulerStats(object):
+    """Instrumentation of a scheduler. Records, for every action run, the
+    queue depth seen when it starts, the scheduling lag (actual start minus
+    due time, in seconds) and the run time of the action (in seconds).
+
+    Enabled with Scheduler.enable_stats(). Schedulers only check whether
+    stats are enabled on their hot path, so a disabled hook costs a single
+    attribute lookup."""
+
+    def __init__(self):
+        self.queue_depth = Histogram(0, 20)
+        self.lag = Histogram()
+        self.run_time = Histogram()
+        self.errors = 0
+
+        self.lock = config["Lock"]()
+
+    def invoke(self, item, lag, depth):
+        """Invokes the scheduled item, recording its lag, run time and the
+        queue depth."""
+
+        start = default_clock()
+        try:
+            item.invoke()
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            self.record(lag, default_clock() - start, depth)
+
+    def record(self, lag, run_time, depth):
+        with self.lock:
+            self.queue_depth.record(depth)
+            self.lag.record(max(0, lag))
+            self.run_time.record(run_time)
+
+    def snapshot(self):
+        """Returns the recorded statistics as a dictionary."""
+
+        with self.lock:
+            return {
+                "queue_depth": self.queue_depth.snapshot(),
+                "lag": self.lag.snapshot(),
+                "run_time": self.run_time.snapshot(),
+                "errors": self.errors
+            }
+
+    def to_observable(self, period, scheduler=None):
+        """Returns an observable sequence of snapshots of the statistics,
+        produced every period.
+
+        Keyword arguments:
+        period -- Period for producing the snapshots (specified as an
+            integer denoting milliseconds).
+        scheduler -- [Optional] Scheduler to run the timer on. If not
+            specified, rx.Scheduler.timeout is used."""
+
+        from rx import Observable
+
+        return Observable.interval(period, scheduler).select(
+            lambda _: self.snapshot())
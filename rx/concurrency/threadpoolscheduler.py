@@ -0,0 +1,109 @@
+import logging
+import threading
+from collections import deque
+try:
+    from os import cpu_count
+except ImportError:
+    from multiprocessing import cpu_count
+
+from rx.disposables import SingleAssignmentDisposable, CompositeDisposable
+
+from .scheduler import Scheduler
+from .scheduleditem import ScheduledItem
+from .timeoutscheduler import timeout_scheduler
+
+log = logging.getLogger('Rx')
+
+
+class ThreadPoolScheduler(Scheduler):
+    """A scheduler that schedules work on a bounded pool of reusable worker
+    threads. Timed work waits on a shared timer queue and is handed to the
+    pool when due."""
+
+    def __init__(self, max_workers=None, timer=None):
+        """Creates a new thread pool scheduler.
+
+        Keyword arguments:
+        :param int max_workers: [Optional] Maximum number of worker threads.
+            Defaults to five times the number of processors.
+        :param Scheduler timer: [Optional] Scheduler used to wait for timed
+            work. Defaults to the timeout scheduler.
+        """
+
+        self.max_workers = max_workers or (cpu_count() or 1) * 5
+        self.timer = timer or timeout_scheduler
+        self.condition = threading.Condition(threading.Lock())
+        self.queue = deque()
+        self.workers = 0
+        self.idle = 0
+
+    @property
+    def queue_depth(self):
+        """Number of actions waiting for a worker thread."""
+
+        return len(self.queue)
+
+    def schedule(self, action, state=None):
+        """Schedules an action to be executed."""
+
+        si = ScheduledItem(self, state, action, None)
+
+        with self.condition:
+            self.queue.append(si)
+            if self.idle:
+                self.condition.notify()
+
+            # Workers that were notified count as idle until they wake up,
+            # so a new worker is needed once the queue outgrows them
+            if self.idle < len(self.queue) and \
+                    self.workers < self.max_workers:
+                self.workers += 1
+                thread = threading.Thread(target=self.run)
+                thread.daemon = True
+                thread.start()
+
+        return si.disposable
+
+    def schedule_relative(self, duetime, action, state=None):
+        """Schedules an action to be executed after duetime."""
+
+        seconds = self.to_seconds(duetime)
+        if seconds <= 0:
+            return self.schedule(action, state)
+
+        timer = SingleAssignmentDisposable()
+        work = SingleAssignmentDisposable()
+
+        def interval(scheduler, state):
+            work.disposable = self.schedule(action, state)
+
+        timer.disposable = self.timer.schedule_relative(seconds, interval,
+                                                        state)
+        return CompositeDisposable(timer, work)
+
+    def schedule_absolute(self, duetime, action, state=None):
+        """Schedules an action to be executed at duetime."""
+
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now(), action, state)
+
+    def run(self):
+        """Worker loop. Runs queued actions until the process exits."""
+
+        while True:
+            with self.condition:
+                while not self.queue:
+                    self.idle += 1
+                    try:
+                        self.condition.wait()
+                    finally:
+                        self.idle -= 1
+                item = self.queue.popleft()
+
+            if not item.is_cancelled():
+                try:
+                    item.invoke()
+                except Exception:
+                    log.exception("ThreadPoolScheduler: unhandled exception")
+
+Scheduler.thread_pool = thread_pool_scheduler = ThreadPoolScheduler()
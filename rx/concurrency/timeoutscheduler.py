@@ -1,53 +1,58 @@
+import heapq
 import logging
-from threading import Timer
-from datetime import timedelta
+import threading
 
-from rx.disposables import Disposable, SingleAssignmentDisposable, \
-    CompositeDisposable
+from rx.disposables import Disposable
+from rx.internal.basic import default_clock
 
 from .scheduler import Scheduler
+from .scheduleditem import ScheduledItem
 
 log = logging.getLogger("Rx")
 
+
 class TimeoutScheduler(Scheduler):
-    """A scheduler that schedules work via a timed callback based upon platform."""
+    """A scheduler that schedules work via a timed callback based upon platform.
+
+    All pending actions are kept in a single heap ordered by due time and
+    are driven by one timer thread per scheduler. The thread is started on
+    demand and exits again when there is no more pending work, so tens of
+    thousands of pending timers cost memory instead of threads. Actions are
+    invoked on the timer thread and should not block.
+    """
+
+    def __init__(self, slack=0):
+        """Creates a new timeout scheduler.
+
+        Keyword arguments:
+        :param int|float|timedelta slack: [Optional] Timer coalescing slack.
+            The earliest due action may be delayed by up to slack, and fires
+            together with all actions that are due by then, saving wakeups
+            of the timer thread. Actions never fire before their due time.
+            Defaults to 0.
+        """
+
+        self.slack = self.to_seconds(slack)
+        self.condition = threading.Condition(threading.Lock())
+        self.timers = []
+        self.count = 0  # Monotonic increasing for sort stability
+        self.cancelled = 0
+        self.thread = None
 
     def schedule(self, action, state=None):
         """Schedules an action to be executed."""
 
-        scheduler = self
-        disposable = SingleAssignmentDisposable()
-
-        def interval():
-            disposable.disposable = action(scheduler, state)
-        timer = Timer(0, interval)
-        timer.start()
-
-        def dispose():
-            timer.cancel()
-        return CompositeDisposable(disposable, Disposable(dispose))
+        return self._enqueue(default_clock(), action, state)
 
     def schedule_relative(self, duetime, action, state=None):
         """Schedules an action to be executed after duetime."""
 
-        scheduler = self
-        timespan = self.to_timedelta(duetime)
-        if timespan == timedelta(0):
-            return scheduler.schedule(action, state)
+        seconds = self.to_seconds(duetime)
+        if seconds <= 0:
+            return self.schedule(action, state)
 
-        disposable = SingleAssignmentDisposable()
-        def interval():
-            disposable.disposable = action(scheduler, state)
-
-        seconds = timespan.total_seconds()
         log.debug("timeout: %s", seconds)
-        timer = Timer(seconds, interval)
-        timer.start()
-
-        def dispose():
-            timer.cancel()
-
-        return CompositeDisposable(disposable, Disposable(dispose))
+        return self._enqueue(default_clock() + seconds, action, state)
 
     def schedule_absolute(self, duetime, action, state=None):
         """Schedules an action to be executed after duetime."""
@@ -55,4 +60,85 @@ class TimeoutScheduler(Scheduler):
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now(), action, state)
 
+    def _enqueue(self, duetime, action, state):
+        si = ScheduledItem(self, state, action, duetime)
+
+        with self.condition:
+            heapq.heappush(self.timers, (duetime, self.count, si))
+            self.count += 1
+
+            if self.timers[0][2] is si:
+                self.condition.notify()
+            self.ensure_thread()
+
+        def dispose():
+            self._cancel(si)
+        return Disposable(dispose)
+
+    def _cancel(self, item):
+        if item.is_cancelled():
+            return
+
+        item.cancel()
+
+        # Cancelled timers are removed lazily. Compact the heap once at
+        # least half of it is garbage, keeping cancel amortized O(1).
+        with self.condition:
+            self.cancelled += 1
+            if self.cancelled * 2 >= len(self.timers):
+                self.timers = [t for t in self.timers
+                               if not t[2].is_cancelled()]
+                heapq.heapify(self.timers)
+                self.cancelled = 0
+                self.condition.notify()
+
+    def ensure_thread(self):
+        """Ensures there is a timer thread running. Should be called under
+        the gate."""
+
+        if not self.thread:
+            self.thread = threading.Thread(target=self.run)
+            self.thread.start()
+
+    def run(self):
+        """Timer loop. Waits until slack after the earliest due action, and
+        invokes all actions that are due by then. Exits when there is no more
+        pending work."""
+
+        while True:
+            ready = []
+
+            with self.condition:
+                while True:
+                    timers = self.timers
+                    while timers and timers[0][2].is_cancelled():
+                        heapq.heappop(timers)
+
+                    if not timers:
+                        self.thread = None
+                        return
+
+                    now = default_clock()
+                    wakeup = timers[0][0] + self.slack
+                    if wakeup <= now:
+                        break
+
+                    self.condition.wait(wakeup - now)
+
+                while timers and timers[0][0] <= now:
+                    ready.append(heapq.heappop(timers)[2])
+
+            stats = self.stats
+            for index, item in enumerate(ready):
+                if not item.is_cancelled():
+                    try:
+                        if stats is None:
+                            item.invoke()
+                        else:
+                            depth = len(ready) - index - 1 + len(self.timers)
+                            stats.invoke(item, default_clock() - item.duetime,
+                                         depth)
+                    except Exception:
+                        log.exception("TimeoutScheduler: unhandled exception")
+
 Scheduler.timeout = timeout_scheduler = TimeoutScheduler()
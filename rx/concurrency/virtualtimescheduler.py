@@ -2,7 +2,9 @@ import logging
 
 from rx.internal import PriorityQueue, ArgumentOutOfRangeException
 
-from .scheduler import Scheduler
+from rx.disposables import CompositeDisposable
+
+from .scheduler import Scheduler, to_batch, to_absolute_batch
 from .scheduleditem import ScheduledItem
 from .scheduleperiodicrecursive import SchedulePeriodicRecursive
 
@@ -34,6 +36,11 @@ class VirtualTimeScheduler(Scheduler):
 
         return self.to_datetime(self.clock)
 
+    def monotonic(self):
+        """Gets the schedulers absolute time clock value as float seconds."""
+
+        return self.to_seconds(self.clock)
+
     def schedule(self, action, state=None):
         """Schedules an action to be executed."""
 
@@ -56,15 +63,39 @@ class VirtualTimeScheduler(Scheduler):
     def schedule_absolute(self, duetime, action, state=None):
         """Schedules an action to be executed at duetime."""
 
+        si = self._scheduled_item(duetime, action, state)
+        self.queue.enqueue(si)
+        return si.disposable
+
+    def schedule_many(self, actions):
+        """Schedules a batch of actions to be executed, in order."""
+
+        clock = self.clock
+        return self.schedule_absolute_many([(clock, action, state) for
+                                            action, state in to_batch(actions)])
+
+    def schedule_absolute_many(self, pairs):
+        """Schedules a batch of actions to be executed at their duetimes.
+        The batch is enqueued under a single lock of the queue."""
+
+        items = [self._scheduled_item(duetime, action, state)
+                 for duetime, action, state in to_absolute_batch(pairs)]
+        self.queue.enqueue_many(items)
+        return CompositeDisposable([si.disposable for si in items])
+
+    def _scheduled_item(self, duetime, action, state):
         def run(scheduler, state1):
             self.queue.remove(si)
             return action(scheduler, state1)
 
         si = ScheduledItem(self, state, run, duetime, self.comparer)
-        self.queue.enqueue(si)
-        return si.disposable
+        return si
+
+    def schedule_periodic(self, period, action, state=None, catch_up=None,
+                          shared=False):
+        """Schedules a periodic piece of work. Virtual time never runs late,
+        so the catch-up policy and tick sharing do not apply."""
 
-    def schedule_periodic(self, period, action, state=None):
         scheduler = SchedulePeriodicRecursive(self, period, action, state)
         return scheduler.start()
 
@@ -80,7 +111,7 @@ class VirtualTimeScheduler(Scheduler):
                         self.clock = next.duetime
                         log.info("VirtualTimeScheduler.start(), clock: %s",
                                  self.clock)
-                    next.invoke()
+                    self._invoke(next)
                 else:
                     self.is_enabled = False
 
@@ -111,7 +142,7 @@ class VirtualTimeScheduler(Scheduler):
                     if self.comparer(next.duetime, self.clock) > 0:
                         self.clock = next.duetime
 
-                    next.invoke()
+                    self._invoke(next)
                 else:
                     self.is_enabled = False
 
@@ -144,6 +175,16 @@ class VirtualTimeScheduler(Scheduler):
 
         self.clock = dt
 
+    def _invoke(self, item):
+        stats = self.stats
+        if stats is None:
+            item.invoke()
+        else:
+            # Lag is in virtual time, run time in real time. The item stays
+            # queued until it runs
+            lag = self.monotonic() - self.to_seconds(item.duetime)
+            stats.invoke(item, lag, len(self.queue) - 1)
+
     def get_next(self):
         """Returns the next scheduled item to be executed."""
 
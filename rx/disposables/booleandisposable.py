@@ -3,6 +3,8 @@ from .disposable import Disposable
 class BooleanDisposable(Disposable):
     """Represents a Disposable that can be checked for status."""
 
+    __slots__ = ("is_single", "current")
+
     def __init__(self, is_single=True):
         """Initializes a new instance of the BooleanDisposable class."""
 
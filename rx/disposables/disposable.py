@@ -1,9 +1,13 @@
-from rx import Lock
 from rx.internal import noop
+from rx.internal.lazylock import LazyLock
 
 class Disposable(object):
     """Main disposable class"""
-    
+
+    __slots__ = ("is_disposed", "action", "_lock")
+
+    lock = LazyLock()
+
     def __init__(self, action=None):
         """Creates a disposable object that invokes the specified action when
         disposed.
@@ -18,7 +22,7 @@ class Disposable(object):
         self.is_disposed = False
         self.action = action or noop
 
-        self.lock = Lock()
+        self._lock = None
 
     def dispose(self):
         """Performs the task of cleaning up resources."""
@@ -1,4 +1,3 @@
-from rx import Lock
 from .disposable import Disposable
 
 
@@ -7,10 +6,14 @@ class RefCountDisposable(Disposable):
     disposable resource when all dependent disposable objects have been
     disposed."""
 
+    __slots__ = ("underlying_disposable", "is_primary_disposed", "count")
+
     class InnerDisposable(Disposable):
+        __slots__ = ("parent",)
+
         def __init__(self, parent):
             self.parent = parent
-            self.lock = Lock()
+            self._lock = None
             
         def dispose(self):
             with self.lock:
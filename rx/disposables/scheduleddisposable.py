@@ -5,6 +5,8 @@ class ScheduledDisposable(Disposable):
     """Represents a disposable resource whose disposal invocation will be
     scheduled on the specified Scheduler"""
 
+    __slots__ = ("scheduler", "disposable")
+
     def __init__(self, scheduler, disposable):
         """Initializes a new instance of the ScheduledDisposable class that
         uses a Scheduler on which to dispose the disposable."""
@@ -6,6 +6,8 @@ class SerialDisposable(Disposable):
     be replaced by another disposable resource, causing automatic disposal of
     the previous underlying disposable resource."""
 
+    __slots__ = ("current",)
+
     def __init__(self):
         self.current = None
 
@@ -7,5 +7,7 @@ class SingleAssignmentDisposable(BooleanDisposable):
     has already been set, future attempts to set the underlying disposable 
     resource will throw an Error."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(SingleAssignmentDisposable, self).__init__(True)
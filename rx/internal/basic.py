@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 
 # Defaults
@@ -12,6 +13,9 @@ def identity(x):
 def default_now():
     return datetime.utcnow()
 
+# Monotonic clock in float seconds, falls back to the wall clock on Python 2
+default_clock = getattr(time, "monotonic", time.time)
+
 def default_comparer(x, y):
     return x == y
 
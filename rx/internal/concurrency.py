@@ -1,3 +1,8 @@
+try:
+    from threading import get_ident
+except ImportError:
+    from thread import get_ident
+
 
 class NoLock(object):
     """Dummy lock object for schedulers that don't need locking"""
@@ -11,4 +16,38 @@ class NoLock(object):
 
     def __exit__(self, type, value, traceback):
         """Context management protocol"""
-        pass
\ No newline at end of file
+        pass
+
+
+class SingleThreadLock(NoLock):
+    """Dummy lock object for pipelines that run on a single thread, e.g. an
+    asyncio event loop. Enable the single-threaded mode before constructing
+    the pipeline:
+
+        rx.config["Lock"] = SingleThreadLock
+
+    Observables, observers and subjects then skip their locking. Unless
+    Python runs optimized (-O), entering the lock asserts that it is always
+    entered from the thread that entered it first."""
+
+    __slots__ = ("thread",)
+
+    def __init__(self):
+        self.thread = None
+
+    if __debug__:
+        def __enter__(self):
+            """Context management protocol"""
+
+            assert self.is_owner(), \
+                "Single-threaded lock entered from more than one thread"
+
+    def is_owner(self):
+        """Returns True if the calling thread is the thread that entered the
+        lock first. Code that skips the lock, like the lock-free notification
+        of subjects, asserts this to get the same debug check."""
+
+        thread = get_ident()
+        if self.thread is None:
+            self.thread = thread
+        return self.thread == thread
@@ -23,11 +23,9 @@ class Enumerable(object):
 
             for value in self:
                 if n <= 0:
-                    raise StopIteration
+                    return
                 n -= 1
                 yield value
-            
-            raise StopIteration
         return Enumerable(next())
 
     @classmethod
@@ -39,18 +37,27 @@ class Enumerable(object):
                 yield value
                 value += 1
                 n -= 1
-
-            raise StopIteration
         return Enumerable(next())
 
     @classmethod
     def repeat(cls, value, count=None):
         if not count is None:
-            return Enumerable(value for _ in range(count))
-        return Enumerable(itertools.repeat(value))
+            return AnonymousEnumerable(lambda: itertools.repeat(value, count))
+        return AnonymousEnumerable(lambda: itertools.repeat(value))
 
     @classmethod
     def for_each(cls, source, selector=None):
         selector = selector or identity
         return Enumerable(selector(value) for value in source)
 
+
+class AnonymousEnumerable(Enumerable):
+    """Enumerable that creates a new iterator every time it is iterated, so
+    that it can be iterated more than once, e.g. by every subscription to
+    a repeated observable."""
+
+    def __init__(self, iterator_factory):
+        self.iterator_factory = iterator_factory
+
+    def __iter__(self):
+        return self.iterator_factory()
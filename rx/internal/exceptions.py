@@ -24,3 +24,8 @@ class ReEntracyException(Exception):
 class CompletedException(Exception):
     def __init__(self, msg=None):
         super(CompletedException, self).__init__(msg or 'Observer completed')
+
+
+class QueueOverflowException(Exception):
+    def __init__(self, msg=None):
+        super(QueueOverflowException, self).__init__(msg or 'Queue overflow')
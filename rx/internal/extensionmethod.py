@@ -1,3 +1,72 @@
+from importlib import import_module
+
+
+class dualmethod(object):
+    """Descriptor for a method that has both an instance and a class method
+    implementation under the same name. Accessing it on an instance binds
+    the instance method, accessing it on the class binds the class method,
+    e.g. xs.merge(ys) and Observable.merge(xs, ys). Binding happens on
+    attribute access, so instances carry no per instance state."""
+
+    def __init__(self, instancemethod, classmethod=None):
+        self.instancemethod = instancemethod
+        self.classmethod = classmethod
+
+    def __get__(self, instance, owner=None):
+        if instance is not None:
+            return self.instancemethod.__get__(instance, owner)
+
+        if self.classmethod is None:
+            raise AttributeError("'%s' has no class method '%s'" % (
+                owner.__name__, self.instancemethod.__name__))
+        return self.classmethod.__get__(None, owner)
+
+
+class lazymethod(object):
+    """Placeholder for an extension method whose module has not been
+    imported yet. The first access imports the modules implementing the
+    method, which replace the placeholder when they register it, and then
+    returns the registered method. Unused extension methods are never
+    imported."""
+
+    def __init__(self, base, name, modules):
+        self.base = base
+        self.name = name
+        self.modules = modules
+
+    def __get__(self, instance, owner=None):
+        for module in self.modules:
+            import_module(module)
+
+        if self.base.__dict__.get(self.name) is self:
+            raise AttributeError("'%s' was not registered by %s" % (
+                self.name, ", ".join(self.modules)))
+        return getattr(owner if instance is None else instance, self.name)
+
+
+def lazyextensions(base, extensions, package=None):
+    """Adds lazy placeholders for extension methods to base, for names
+    that are not set yet.
+
+    Keyword arguments:
+    :param T base: Base class to extend
+    :param list extensions: List of (module, names) pairs, with the module
+        implementing each of the names
+    :param str package: Package of relative module names
+    """
+
+    modules = {}
+    for module, names in extensions:
+        if package and module.startswith("."):
+            module = package + module
+        for name in names:
+            modules.setdefault(name, []).append(module)
+
+    for name, names_modules in modules.items():
+        if name not in base.__dict__:
+            setattr(base, name, lazymethod(base, name, names_modules))
+
+
 def extensionmethod(base, name=None, decorator=None, instancemethod=False,
     alias=None):
     """Function decorator that extends base with the decorated
@@ -6,6 +75,8 @@ def extensionmethod(base, name=None, decorator=None, instancemethod=False,
     Keyword arguments:
     :param T base: Base class to extend with method
     :param string name: Name of method to set
+    :param bool instancemethod: Set as the instance method of a dualmethod,
+        sharing the name with a class method
     
     :returns: A function that takes the class to be decorated.
     :rtype: func -> func
@@ -25,8 +96,20 @@ def extensionmethod(base, name=None, decorator=None, instancemethod=False,
         func = decorator(func) if decorator else func
         
         for func_name in func_names:
+            existing = base.__dict__.get(func_name)
+            if isinstance(existing, lazymethod):
+                existing = None
             if instancemethod:
-                base._methods.append((func_name, func))
+                if isinstance(existing, classmethod):
+                    existing = dualmethod(func, existing)
+                elif isinstance(existing, dualmethod):
+                    existing.instancemethod = func
+                else:
+                    existing = dualmethod(func)
+                setattr(base, func_name, existing)
+            elif isinstance(existing, dualmethod) and \
+                    isinstance(func, classmethod):
+                existing.classmethod = func
             else:
                 setattr(base, func_name, func)
         return func
@@ -0,0 +1,29 @@
+from rx import Lock, config
+
+
+class LazyLock(object):
+    """Descriptor for an instance lock that is only allocated on first use.
+    The lock is kept in the _lock attribute of the instance, which may be a
+    slot. Objects that are never locked, like most subscriptions that are
+    only ever used from a single thread until they are disposed, then never
+    allocate a lock.
+
+    Assigning the attribute replaces the lock."""
+
+    # Guards allocation, so that racing threads get the same lock
+    allocation_lock = Lock()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        lock = getattr(instance, "_lock", None)
+        if lock is None:
+            with self.allocation_lock:
+                lock = getattr(instance, "_lock", None)
+                if lock is None:
+                    lock = instance._lock = config["Lock"]()
+        return lock
+
+    def __set__(self, instance, value):
+        instance._lock = value
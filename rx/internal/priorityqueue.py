@@ -9,48 +9,130 @@ class PriorityQueue(object):
         self.items = []
         self.count = 0 # Monotonic increasing for sort stability
 
+        # Removed items are only marked as such and dropped lazily when they
+        # reach the head of the heap. The index maps item identity to heap
+        # entry so that remove does not have to search the heap.
+        self.index = {}
+        self.removed = 0
+
         self.lock = rx.config.get("Lock")()
 
     def __len__(self):
         """Returns length of queue"""
 
-        return len(self.items)
+        return len(self.items) - self.removed
+
+    def _prune(self):
+        """Drops removed items from the head of the heap. Should be called
+        under the lock."""
+
+        items = self.items
+        while items and not items[0][2]:
+            heapq.heappop(items)
+            self.removed -= 1
+
+    def _unindex(self, entry):
+        item = entry[0]
+        if self.index.get(id(item)) is entry:
+            del self.index[id(item)]
 
     def peek(self):
         """Returns first item in queue without removing it"""
 
-        return self.items[0][0]
+        with self.lock:
+            self._prune()
+            return self.items[0][0]
+
+    def _compact(self):
+        """Drops all removed items from the heap. Should be called under the
+        lock."""
+
+        self.items = [e for e in self.items if e[2]]
+        heapq.heapify(self.items)
+        self.removed = 0
 
     def remove_at(self, index):
         """Removes item at given index"""
 
         with self.lock:
-            item = self.items.pop(index)[0]
-            heapq.heapify(self.items)
-        return item
+            # Indexes refer to items still in the queue
+            if self.removed:
+                self._compact()
+
+            items = self.items
+            entry = items[index]
+            last = items.pop()
+            if index < len(items):
+                items[index] = last
+                heapq._siftup(items, index)
+                heapq._siftdown(items, 0, index)
+
+            self._unindex(entry)
+        return entry[0]
 
     def dequeue(self):
         """Returns and removes item with lowest priority from queue"""
 
         with self.lock:
-            item = heapq.heappop(self.items)[0]
-        return item
+            self._prune()
+            entry = heapq.heappop(self.items)
+            self._unindex(entry)
+        return entry[0]
 
     def enqueue(self, item):
         """Adds item to queue"""
 
         with self.lock:
-            heapq.heappush(self.items, (item, self.count))
+            entry = [item, self.count, True]
+            heapq.heappush(self.items, entry)
+            self.index[id(item)] = entry
             self.count += 1
 
+    def enqueue_many(self, items):
+        """Adds all given items to queue under a single lock"""
+
+        with self.lock:
+            heap = self.items
+            index = self.index
+            count = self.count
+            entries = []
+            for item in items:
+                entry = [item, count, True]
+                entries.append(entry)
+                index[id(item)] = entry
+                count += 1
+            self.count = count
+
+            # Rebuilding the heap is cheaper than pushing when the batch is
+            # large compared to the queue
+            if len(entries) > len(heap):
+                heap.extend(entries)
+                heapq.heapify(heap)
+            else:
+                for entry in entries:
+                    heapq.heappush(heap, entry)
+
     def remove(self, item):
         """Remove given item from queue"""
 
         with self.lock:
-            for index, _item in enumerate(self.items):
-                if _item[0] == item:
-                    self.items.pop(index)
-                    heapq.heapify(self.items)
-                    return True
-
-        return False
+            entry = self.index.get(id(item))
+            if entry is None or entry[0] is not item:
+                # Not enqueued by identity, fall back to equality
+                entry = None
+                for _entry in self.items:
+                    if _entry[2] and _entry[0] == item:
+                        entry = _entry
+                        break
+                else:
+                    return False
+
+            entry[2] = False
+            self._unindex(entry)
+            self.removed += 1
+
+            # Compact once at least half of the heap has been removed
+            if self.removed * 2 > len(self.items):
+                self._compact()
+
+        return True
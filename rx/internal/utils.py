@@ -1,33 +1,122 @@
-from inspect import getargspec
+from functools import partial
+from itertools import takewhile
+from types import FunctionType, BuiltinFunctionType, ModuleType
+
+try:
+    from inspect import signature, Parameter
+except ImportError:  # Python 2
+    signature = None
 
 from rx import AnonymousObservable
 from rx.disposables import CompositeDisposable
 
 from .exceptions import DisposedException
 
+CO_VARARGS = 0x04
+
+# Positional parameters of code objects, builtins and types, see parameters
+parameters_cache = {}
+
 def add_ref(xs, r):
     def subscribe(observer):
         return CompositeDisposable(r.disposable, xs.subscribe(observer))
 
     return AnonymousObservable(subscribe)
 
+def code_parameters(code):
+    try:
+        return parameters_cache[code]
+    except KeyError:
+        pass
+
+    names = code.co_varnames[:code.co_argcount]
+    result = parameters_cache[code] = names, bool(code.co_flags & CO_VARARGS)
+    return result
+
+def signature_parameters(func):
+    if signature is None:
+        init = getattr(func, "__init__", None) if isinstance(func, type) else None
+        init = getattr(init, "__func__", init)
+        if hasattr(init, "__code__"):
+            names, varargs = code_parameters(init.__code__)
+            return names[1:], varargs
+        raise ValueError("no signature found for %r" % func)
+
+    names = []
+    varargs = False
+    for param in signature(func).parameters.values():
+        if param.kind == Parameter.VAR_POSITIONAL:
+            varargs = True
+        elif param.kind in (Parameter.POSITIONAL_ONLY,
+                            Parameter.POSITIONAL_OR_KEYWORD):
+            names.append(param.name)
+    return tuple(names), varargs
+
+def parameters(func):
+    """Returns the names of the positional parameters of func, and whether
+    it takes variable positional arguments. Keyword-only parameters are
+    left out. Raises ValueError if the signature of func is unknown.
+
+    The parameters are cached by code object, so looking up a function,
+    method or partial only costs a few attribute lookups. Builtins and
+    types are cached by themselves."""
+
+    if isinstance(func, FunctionType):
+        return code_parameters(func.__code__)
+
+    inner = getattr(func, "__func__", None)
+    if inner is not None:  # Method, only unbound in Python 2
+        names, varargs = parameters(inner)
+        if func.__self__ is not None:
+            names = names[1:]
+        return names, varargs
+
+    if isinstance(func, partial):
+        names, varargs = parameters(func.func)
+        names = names[len(func.args):]
+        if func.keywords:
+            # Arguments after the first keyword argument must be keywords
+            names = tuple(takewhile(lambda name: name not in func.keywords,
+                                    names))
+        return names, varargs
+
+    cached = isinstance(func, type) or (
+        isinstance(func, BuiltinFunctionType) and
+        isinstance(getattr(func, "__self__", None), (ModuleType, type(None))))
+    if not cached:
+        call = getattr(type(func), "__call__", None)
+        if hasattr(getattr(call, "__func__", call), "__code__"):
+            names, varargs = parameters(call)
+            return names[1:], varargs
+        return signature_parameters(func)
+
+    try:
+        return parameters_cache[func]
+    except KeyError:
+        pass
+    result = parameters_cache[func] = signature_parameters(func)
+    return result
+
 def adapt_call(func):
-    """Adapts func from taking 3 params to only taking 1 or 2 params"""
-    
+    """Adapts func, taking 1 or 2 params, to be called with 2 params, e.g.
+    with a value and its index.
+
+    Functions that take 2 or more, or variable, positional params are
+    returned as they are. Functions that take 1 param are wrapped so that
+    the second argument is dropped. Callables without a known signature,
+    like some builtins and types, are assumed to take 1 param."""
+
+    try:
+        names, varargs = parameters(func)
+    except (TypeError, ValueError):
+        names, varargs = (None,), False
+
+    if varargs or len(names) != 1:
+        return func
+
     def func1(arg1, *_):
         return func(arg1)
-    def func2(arg1, arg2=None, *_):
-        return func(arg1, arg2)
-
-    func_wrapped = func
-    argnames, varargs, kwargs = getargspec(func)[:3]
-    if not varargs and not kwargs:
-        if len(argnames) == 1: 
-            func_wrapped = func1
-        elif len(argnames) == 2:
-            func_wrapped = func2
-    
-    return func_wrapped
+    return func1
 
 def check_disposed(this):
     if this.is_disposed:
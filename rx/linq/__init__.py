@@ -1,3 +1,29 @@
+"""Extension methods of the core classes. The modules implementing them are
+imported on first use, see lazyextensions."""
+
+from rx.observable import Observable
+from rx.observer import Observer
+from rx.blockingobservable import BlockingObservable
+from rx.internal import Enumerable
+from rx.internal.extensionmethod import lazyextensions
+
 from . import observable
-from . import enumerable
 
+lazyextensions(Observable, [
+    ("rx.backpressure.pausable", ["pausable"]),
+    ("rx.backpressure.pausablebuffered", ["pausable_buffered"])
+])
+
+lazyextensions(BlockingObservable, [
+    (".foreach", ["for_each"]),
+    (".toiterable", ["__iter__", "to_iterable"])
+], "rx.linq.observable.blocking")
+
+lazyextensions(Observer, [
+    ("rx.checkedobserver", ["checked"]),
+    ("rx.notification", ["from_notifier"])
+])
+
+lazyextensions(Enumerable, [
+    ("rx.linq.enumerable.whiledo", ["while_do"])
+])
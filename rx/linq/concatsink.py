@@ -0,0 +1,137 @@
+from rx import config
+from rx.observable import Observable
+from rx.disposables import Disposable, SingleAssignmentDisposable, \
+    CompositeDisposable, SerialDisposable
+from rx.autodetachobserver import current_subscription
+from rx.linq.sink import Sink
+
+# What ends the sequence of a ConcatSink, see ConcatSink.__init__
+CONCAT = 0  # The first error
+CATCH = 1  # The first completion
+RESUME = 2  # The end of the sources
+
+
+class ConcatSink(object):
+    """Subscribes to a sequence of sources one after the other, for concat,
+    catch_exception and on_error_resume_next.
+
+    The next source is subscribed by a loop, not by the termination of the
+    previous one. Sources that terminate while being subscribed only ask the
+    loop for another step, so any number of them run in constant stack
+    depth, and a step only allocates the subscription of its source."""
+
+    __slots__ = ("observer", "scope", "sources", "mode", "subscription",
+                 "lock", "is_running", "is_requested", "is_disposed", "state",
+                 "last_exception")
+
+    def __init__(self, observer, sources, mode=CONCAT):
+        """
+        Keyword arguments:
+        observer -- Observer to forward the elements to.
+        sources -- Iterable of the sources to subscribe to.
+        mode -- CONCAT to continue with the next source when a source
+            completes, CATCH to continue when a source fails, and RESUME to
+            continue in both cases. With RESUME, sources may also be
+            factories that take the exception of the previous source, or
+            None if it completed."""
+
+        self.observer = observer
+        self.scope = current_subscription()
+        self.sources = iter(sources)
+        self.mode = mode
+        self.subscription = SerialDisposable()
+        self.lock = config["Lock"]()
+
+        self.is_running = False
+        self.is_requested = False
+        self.is_disposed = False
+        self.state = None
+        self.last_exception = None
+
+    def run(self):
+        """Subscribes to the first source. Returns the disposable of the
+        whole concatenation."""
+
+        self.move_next()
+        return CompositeDisposable(self.subscription, Disposable(self.dispose))
+
+    def move_next(self, state=None):
+        with self.lock:
+            self.is_requested = True
+            self.state = state
+            if self.is_running:
+                return
+            self.is_running = True
+
+        while True:
+            with self.lock:
+                # The loop may run before run returns the subscription, so it
+                # also stops once the outer subscription is disposed
+                if not self.is_requested or self.is_disposed or \
+                        (self.scope is not None and self.scope.is_stopped()):
+                    self.is_running = False
+                    return
+                self.is_requested = False
+                state = self.state
+
+            try:
+                self.subscribe_next(state)
+            except Exception:
+                with self.lock:
+                    self.is_running = False
+                raise
+
+    def subscribe_next(self, state):
+        try:
+            source = next(self.sources)
+            if self.mode == RESUME:
+                # Allow source to be a factory method taking an error
+                source = source(state) if callable(source) else source
+                source = Observable.from_future(source)
+        except StopIteration:
+            if self.last_exception is not None:
+                self.observer.on_error(self.last_exception)
+            else:
+                self.observer.on_completed()
+            return
+        except Exception as ex:
+            self.observer.on_error(ex)
+            return
+
+        d = SingleAssignmentDisposable()
+        self.subscription.disposable = d
+        d.disposable = source.subscribe(ConcatObserver(self))
+
+    def on_error(self, exception):
+        if self.mode == CONCAT:
+            self.observer.on_error(exception)
+        else:
+            if self.mode == CATCH:
+                self.last_exception = exception
+            self.move_next(exception)
+
+    def on_completed(self):
+        if self.mode == CATCH:
+            self.observer.on_completed()
+        else:
+            self.move_next()
+
+    def dispose(self):
+        with self.lock:
+            self.is_disposed = True
+
+
+class ConcatObserver(Sink):
+    """Observer of the current source of a ConcatSink"""
+
+    __slots__ = ("parent",)
+
+    def __init__(self, parent):
+        super(ConcatObserver, self).__init__(parent.observer)
+        self.parent = parent
+
+    def _on_error(self, exception):
+        self.parent.on_error(exception)
+
+    def _on_completed(self):
+        self.parent.on_completed()
@@ -1,5 +1,8 @@
 from rx import AnonymousObservable, Observable
 from rx.disposables import Disposable, CompositeDisposable
+from rx.abstractobserver import AbstractObserver
+from rx.observer import Observer
+from rx.boundedobserver import BoundedObserver, DROP_OLDEST
 
 
 class ConnectableObservable(Observable):
@@ -29,6 +32,42 @@ class ConnectableObservable(Observable):
 
         return self.subscription
 
+    def subscribe_key(self, key, on_next=None, on_error=None,
+                      on_completed=None, observer=None):
+        """Subscribes an observer to the elements of the key. Only available
+        when the subject is a RoutingSubject, see publish with a key
+        selector.
+
+        Returns {Disposable} the subscription of the observer."""
+
+        return self.subject.subscribe_key(key, on_next, on_error,
+                                          on_completed, observer)
+
+    def subscribe_bounded(self, observer, scheduler, max_size,
+                          overflow=DROP_OLDEST):
+        """Subscribes an observer through its own bounded queue, drained on
+        the given scheduler, so that a slow observer does not hold up the
+        source or the other observers.
+
+        Keyword arguments:
+        observer -- Observer, or action to invoke for each element.
+        scheduler -- Scheduler to notify the observer on.
+        max_size -- Maximum number of elements queued for the observer.
+        overflow -- [Optional] Policy for elements arriving at a full queue,
+            one of "drop_oldest" (the default), "drop_newest", "latest" or
+            "error", see rx.boundedobserver.
+
+        Returns {BoundedObserver} the subscription of the observer, which
+        also exposes the depth of its queue and the count of dropped
+        elements."""
+
+        if not isinstance(observer, AbstractObserver):
+            observer = Observer(observer)
+
+        bounded = BoundedObserver(scheduler, observer, max_size, overflow)
+        bounded.subscription.disposable = self.subject.subscribe(bounded)
+        return bounded
+
     def ref_count(self):
         """Returns an observable sequence that stays connected to the source as 
         long as there is at least one subscription to the observable sequence.
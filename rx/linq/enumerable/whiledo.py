@@ -1,5 +1,6 @@
 from rx.internal import Enumerable, Enumerator
 from rx.internal import extensionclassmethod
+from rx.internal.enumerable import AnonymousEnumerable
 
 @extensionclassmethod(Enumerable)
 def while_do(cls, condition, source):
@@ -7,6 +8,4 @@ def while_do(cls, condition, source):
         while condition(source):
             yield source
 
-        raise StopIteration()
-    return Enumerable(next())
-
+    return AnonymousEnumerable(next)
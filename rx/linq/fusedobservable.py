@@ -0,0 +1,144 @@
+import rx
+from rx.anonymousobservable import AnonymousObservable
+from rx.observer import Observer
+
+# Signals a stage can return instead of a value
+SKIP = object()  # Drop the element
+COMPLETE = object()  # Drop the element and complete the sequence
+
+
+def is_fusion_enabled():
+    """Returns True if operator fusion is enabled, i.e.
+    rx.config["fusion"] is set."""
+
+    return bool(rx.config.get("fusion"))
+
+
+class FusedObservable(AnonymousObservable):
+    """An observable for a stateless, or per subscription stateful, operator
+    that can be fused with adjacent fusible operators. Enable with:
+
+        rx.config["fusion"] = True
+
+    On subscribe, the chain of adjacent fused observables is collapsed
+    into a single observer that runs the stages of all operators in one
+    loop per element. Errors raised by a stage, and completion from a
+    stage, are passed through the termination handlers of the stages after
+    it, just like they would be through the chain of operators.
+
+    A stage is a function that is called once per subscription and returns
+    a tuple (step, on_error, on_completed). The step is called with every
+    element and returns the element for the next stage, SKIP or COMPLETE.
+    The optional on_error and on_completed are called upon termination of
+    the preceding stages."""
+
+    __slots__ = ("source", "stage")
+
+    def __init__(self, source, stage):
+        """Creates a fused observable.
+
+        Keyword arguments:
+        source -- Source observable sequence, possibly fused itself.
+        stage -- Function returning the (step, on_error, on_completed) tuple
+            of the operator for a new subscription."""
+
+        self.source = source
+        self.stage = stage
+
+        super(FusedObservable, self).__init__(self._subscribe_fused)
+
+    def _subscribe_fused(self, observer):
+        stages = []
+        source = self
+        while isinstance(source, FusedObservable):
+            stages.append(source.stage())
+            source = source.source
+        stages.reverse()
+
+        steps = [stage[0] for stage in stages]
+        stopped = [False]
+
+        def error(exception, start):
+            stopped[0] = True
+            for _, on_error, _ in stages[start:]:
+                if on_error:
+                    try:
+                        on_error(exception)
+                    except Exception as ex:
+                        exception = ex
+            observer.on_error(exception)
+
+        def completed(start):
+            stopped[0] = True
+            for index in range(start, len(stages)):
+                on_completed = stages[index][2]
+                if on_completed:
+                    try:
+                        on_completed()
+                    except Exception as ex:
+                        error(ex, index + 1)
+                        return
+            observer.on_completed()
+
+        def on_next(value):
+            if stopped[0]:
+                return
+
+            index = 0
+            try:
+                for step in steps:
+                    value = step(value)
+                    if value is SKIP:
+                        return
+                    if value is COMPLETE:
+                        break
+                    index += 1
+            except Exception as ex:
+                error(ex, index + 1)
+                return
+
+            if value is COMPLETE:
+                completed(index + 1)
+            else:
+                observer.on_next(value)
+
+        def on_next_batch(values):
+            if stopped[0]:
+                return
+
+            results = []
+            for value in values:
+                index = 0
+                try:
+                    for step in steps:
+                        value = step(value)
+                        if value is SKIP or value is COMPLETE:
+                            break
+                        index += 1
+                except Exception as ex:
+                    if results:
+                        observer.on_next_batch(results)
+                    error(ex, index + 1)
+                    return
+
+                if value is COMPLETE:
+                    if results:
+                        observer.on_next_batch(results)
+                    completed(index + 1)
+                    return
+                if value is not SKIP:
+                    results.append(value)
+
+            if results:
+                observer.on_next_batch(results)
+
+        def on_error(exception):
+            if not stopped[0]:
+                error(exception, 0)
+
+        def on_completed():
+            if not stopped[0]:
+                completed(0)
+
+        return source._subscribe_internal(Observer(on_next, on_error,
+                                                   on_completed, on_next_batch))
@@ -1,136 +1,142 @@
-"""Import all the LINQ observable extension methods"""
+"""Operators of Observable, by implementing module. Operator modules are
+imported on first use of one of their operators, see lazyextensions."""
 
-from . import all
-from . import amb
-from . import and_
-from . import some
-from . import asobservable
-from . import average
-from . import buffer
-from . import bufferwithtime
-from . import bufferwithtimeorcount
-from . import case
-from . import catch
-from . import concat
-from . import contains
-from . import combinelatest
-from . import count
-from . import create
-from . import debounce
-from . import defaultifempty
-from . import defer
-from . import delay
-from . import delaysubscription
-from . import delaywithselector
-from . import dematerialize
-from . import distinct
-from . import distinctuntilchanged
-from . import doaction
-from . import dowhile
-from . import elementat
-from . import elementatordefault
-from . import empty
-from . import exclusive
-from . import expand
-from . import finallyaction
-from . import find
-from . import findindex
-from . import first
-from . import firstordefault
-from . import forin
-from . import fromiterable
-from . import fromcallback
-from . import fromfuture
-from . import generate
-from . import generatewithrelativetime
-from . import groupby
-from . import groupbyuntil
-from . import groupjoin
-from . import ifthen
-from . import ignoreelements
-from . import interval
-from . import isempty
-from . import join
-from . import last
-from . import let
-from . import lastordefault
-from . import manyselect
-from . import materialize
-from . import merge
-from . import max
-from . import maxby
-from . import min
-from . import minby
-from . import multicast
-from . import never
-from . import observeon
-from . import onerrorresumenext
-from . import of
-from . import pairwise
-from . import partition
-from . import pluck
-from . import publish
-from . import publishvalue
-from . import range
-from . import reduce
-from . import repeat
-from . import replay
-from . import retry
-from . import returnvalue
-from . import scan
-from . import sample
-from . import select
-from . import selectswitch
-from . import selectmany
-from . import sequenceequal
-from . import single
-from . import singleordefault
-from . import skip
-from . import skiplast
-from . import skiplastwithtime
-from . import skipuntil
-from . import skipuntilwithtime
-from . import skipwhile
-from . import skipwithtime
-from . import slice
-from . import start
-from . import startasync
-from . import startswith
-from . import subscribeon
-from . import sum
-from . import switchlatest
-from . import take
-from . import takelast
-from . import takelastbuffer
-from . import takelastwithtime
-from . import takeuntil
-from . import takeuntilwithtime
-from . import takewhile
-from . import takewithtime
-from . import thendo
-from . import throttlefirst
-from . import throw
-from . import timeinterval
-from . import timer
-from . import timeout
-from . import timeoutwithselector
-from . import timestamp
-from . import toasync
-from . import toblocking
-from . import todict
-from . import tofuture
-from . import toiterable
-from . import tolist
-from . import toset
-from . import using
-from . import when
-from . import where
-from . import whiledo
-from . import window
-from . import windowwithcount
-from . import windowwithtime
-from . import windowwithtimeorcount
-from . import zip
-from . import ziparray
+from rx.observable import Observable
+from rx.internal.extensionmethod import lazyextensions
 
-from . import blocking
\ No newline at end of file
+operators = [
+    (".all", ["all", "every"]),
+    (".amb", ["amb"]),
+    (".and_", ["and_"]),
+    (".asobservable", ["as_observable"]),
+    (".average", ["average"]),
+    (".buffer", ["buffer", "buffer_with_count"]),
+    (".bufferwithtime", ["buffer_with_time"]),
+    (".bufferwithtimeorcount", ["buffer_with_time_or_count"]),
+    (".case", ["case", "switch_case"]),
+    (".catch", ["catch_exception"]),
+    (".combinelatest", ["combine_latest"]),
+    (".concat", ["__add__", "__iadd__", "concat", "concat_all"]),
+    (".contains", ["contains"]),
+    (".count", ["count"]),
+    (".create", ["create", "create_with_disposable"]),
+    (".debounce", ["debounce", "throttle_with_selector",
+                    "throttle_with_timeout"]),
+    (".defaultifempty", ["default_if_empty"]),
+    (".defer", ["defer"]),
+    (".delay", ["delay"]),
+    (".delaysubscription", ["delay_subscription"]),
+    (".delaywithselector", ["delay_with_selector"]),
+    (".dematerialize", ["dematerialize"]),
+    (".distinct", ["distinct"]),
+    (".distinctuntilchanged", ["distinct_until_changed"]),
+    (".doaction", ["do_action", "tap"]),
+    (".dowhile", ["do_while"]),
+    (".elementat", ["element_at"]),
+    (".elementatordefault", ["element_at_or_default"]),
+    (".empty", ["empty"]),
+    (".exclusive", ["exclusive"]),
+    (".expand", ["expand"]),
+    (".finallyaction", ["finally_action"]),
+    (".find", ["find"]),
+    (".findindex", ["find_index"]),
+    (".first", ["first"]),
+    (".firstordefault", ["first_or_default"]),
+    (".forin", ["for_in"]),
+    (".fromcallback", ["from_callback"]),
+    (".fromfuture", ["from_future"]),
+    (".fromiterable", ["from_", "from_iterable", "from_list"]),
+    (".generate", ["generate"]),
+    (".generatewithrelativetime", ["generate_with_relative_time"]),
+    (".groupby", ["group_by"]),
+    (".groupbyuntil", ["group_by_until"]),
+    (".groupjoin", ["group_join"]),
+    (".ifthen", ["if_then"]),
+    (".ignoreelements", ["ignore_elements"]),
+    (".interval", ["interval"]),
+    (".isempty", ["is_empty"]),
+    (".join", ["join"]),
+    (".last", ["last"]),
+    (".lastordefault", ["last_or_default"]),
+    (".let", ["let", "let_bind"]),
+    (".manyselect", ["many_select"]),
+    (".materialize", ["materialize"]),
+    (".max", ["max"]),
+    (".maxby", ["max_by"]),
+    (".merge", ["merge", "merge_all", "merge_observable"]),
+    (".min", ["min"]),
+    (".minby", ["min_by"]),
+    (".multicast", ["multicast"]),
+    (".never", ["never"]),
+    (".observeon", ["observe_on"]),
+    (".of", ["of"]),
+    (".onerrorresumenext", ["on_error_resume_next"]),
+    (".pairwise", ["pairwise"]),
+    (".partition", ["partition"]),
+    (".pluck", ["pluck"]),
+    (".publish", ["publish"]),
+    (".publishvalue", ["publish_value"]),
+    (".range", ["range"]),
+    (".reduce", ["aggregate", "reduce"]),
+    (".repeat", ["__mul__", "repeat"]),
+    (".replay", ["replay"]),
+    (".retry", ["retry"]),
+    (".returnvalue", ["just", "return_value"]),
+    (".sample", ["sample", "throttle_last"]),
+    (".scan", ["scan"]),
+    (".select", ["map", "select"]),
+    (".selectmany", ["flat_map", "select_many"]),
+    (".selectswitch", ["flat_map_latest", "select_switch", "switch_map"]),
+    (".sequenceequal", ["sequence_equal"]),
+    (".single", ["single"]),
+    (".singleordefault", ["single_or_default"]),
+    (".skip", ["skip"]),
+    (".skiplast", ["skip_last"]),
+    (".skiplastwithtime", ["skip_last_with_time"]),
+    (".skipuntil", ["skip_until"]),
+    (".skipuntilwithtime", ["skip_until_with_time"]),
+    (".skipwhile", ["skip_while"]),
+    (".skipwithtime", ["skip_with_time"]),
+    (".slice", ["__getitem__", "slice"]),
+    (".some", ["some"]),
+    (".start", ["start"]),
+    (".startasync", ["start_async"]),
+    (".startswith", ["start_with"]),
+    (".subscribeon", ["subscribe_on"]),
+    (".sum", ["sum"]),
+    (".switchlatest", ["switch_latest"]),
+    (".take", ["take"]),
+    (".takelast", ["take_last"]),
+    (".takelastbuffer", ["take_last_buffer"]),
+    (".takelastwithtime", ["take_last_with_time"]),
+    (".takeuntil", ["take_until"]),
+    (".takeuntilwithtime", ["take_until_with_time"]),
+    (".takewhile", ["take_while"]),
+    (".takewithtime", ["take_with_time"]),
+    (".thendo", ["then", "then_do"]),
+    (".throttlefirst", ["throttle_first"]),
+    (".throw", ["throw", "throw_exception"]),
+    (".timeinterval", ["time_interval"]),
+    (".timeout", ["timeout"]),
+    (".timeoutwithselector", ["timeout_with_selector"]),
+    (".timer", ["timer"]),
+    (".timestamp", ["timestamp"]),
+    (".toasync", ["to_async"]),
+    (".toblocking", ["to_blocking"]),
+    (".todict", ["to_dict"]),
+    (".tofuture", ["to_future"]),
+    (".tolist", ["to_iterable", "to_list"]),
+    (".toset", ["to_set"]),
+    (".using", ["using"]),
+    (".when", ["when"]),
+    (".where", ["filter", "where"]),
+    (".whiledo", ["while_do"]),
+    (".window", ["window"]),
+    (".windowwithcount", ["window_with_count"]),
+    (".windowwithtime", ["window_with_time"]),
+    (".windowwithtimeorcount", ["window_with_time_or_count"]),
+    (".zip", ["zip"]),
+    (".ziparray", ["zip_array"]),
+]
+
+lazyextensions(Observable, operators, __name__)
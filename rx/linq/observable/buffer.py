@@ -1,5 +1,6 @@
-from rx import Observable
+from rx import Observable, AnonymousObservable, Observer
 from rx.internal import extensionmethod
+from rx.internal.exceptions import ArgumentOutOfRangeException
 
 @extensionmethod(Observable)
 def buffer(self, buffer_openings=None, closing_selector=None, buffer_closing_selector=None):
@@ -44,13 +45,53 @@ def buffer_with_count(self, count, skip=None):
     Returns an observable {Observable} sequence of buffers.
     """
 
+    source = self
+    if count <= 0:
+        raise ArgumentOutOfRangeException()
+
     if skip is None:
         skip = count
 
-    def selector(x):
-        return x.to_iterable()
+    if skip <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def subscribe(observer):
+        # Open buffers, oldest first, and number of elements seen
+        buffers = [[]]
+        n = [0]
+
+        def push(x, completed):
+            for buffer in buffers:
+                buffer.append(x)
+
+            c = n[0] - count + 1
+            if c >= 0 and c % skip == 0:
+                completed.append(buffers.pop(0))
+
+            n[0] += 1
+            if n[0] % skip == 0:
+                buffers.append([])
+
+        def on_next(x):
+            completed = []
+            push(x, completed)
+            if completed:
+                observer.on_next(completed[0])
+
+        def on_next_batch(values):
+            completed = []
+            for x in values:
+                push(x, completed)
+            if completed:
+                observer.on_next_batch(completed)
 
-    def predicate(x):
-        return len(x) > 0
+        def on_completed():
+            remaining = [buffer for buffer in buffers if buffer]
+            del buffers[:]
+            if remaining:
+                observer.on_next_batch(remaining)
+            observer.on_completed()
 
-    return self.window_with_count(count, skip).select_many(selector).filter(predicate)
+        return source.subscribe(Observer(on_next, observer.on_error,
+                                         on_completed, on_next_batch))
+    return AnonymousObservable(subscribe)
@@ -1,10 +1,9 @@
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
-from rx.disposables import Disposable, SingleAssignmentDisposable, \
-    CompositeDisposable, SerialDisposable
-from rx.concurrency import immediate_scheduler
+from rx.disposables import SingleAssignmentDisposable, SerialDisposable
 from rx.internal import Enumerable
 from rx.internal import extensionmethod, extensionclassmethod
+from rx.linq.concatsink import ConcatSink, CATCH
 
 def catch_handler(source, handler):
     def subscribe(observer):
@@ -78,40 +77,5 @@ def catch_exception(cls, *args):
     #return Enumerable.catch_exception(Enumerable.for_each(sources))
 
     def subscribe(observer):
-        e = iter(sources)
-        is_disposed = [False]
-        last_exception = [None]
-        subscription = SerialDisposable()
-
-        def action(action1, state=None):
-            def on_error(exn):
-                last_exception[0] = exn
-                action1()
-
-            if is_disposed[0]:
-                return
-            try:
-                current = next(e)
-            except StopIteration:
-                if last_exception[0]:
-                    observer.on_error(last_exception[0])
-                else:
-                    observer.on_completed()
-            except Exception as ex:
-                observer.on_error(ex)
-            else:
-                d = SingleAssignmentDisposable()
-                subscription.disposable = d
-
-                d.disposable = current.subscribe(
-                    observer.on_next,
-                    on_error,
-                    observer.on_completed
-                )
-
-        cancelable = immediate_scheduler.schedule_recursive(action)
-
-        def dispose():
-            is_disposed[0] = True
-        return CompositeDisposable(subscription, cancelable, Disposable(dispose))
+        return ConcatSink(observer, sources, CATCH).run()
     return AnonymousObservable(subscribe)
@@ -2,6 +2,68 @@ from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
 from rx.internal import extensionmethod, extensionclassmethod
+from rx.linq.sink import Sink
+
+
+class CombineLatestSink(object):
+    """Latest values of the sources of a combine_latest subscription"""
+
+    __slots__ = ("observer", "result_selector", "lock", "values",
+                 "has_value", "has_value_count", "is_done", "done_count")
+
+    def __init__(self, observer, result_selector, lock, n):
+        self.observer = observer
+        self.result_selector = result_selector
+        self.lock = lock
+        self.values = [None] * n
+        self.has_value = [False] * n
+        self.has_value_count = 0
+        self.is_done = [False] * n
+        self.done_count = 0
+
+    def next(self, i, value):
+        values = self.values
+        values[i] = value
+        if not self.has_value[i]:
+            self.has_value[i] = True
+            self.has_value_count += 1
+
+        if self.has_value_count == len(values):
+            try:
+                res = self.result_selector(*values)
+            except Exception as ex:
+                self.observer.on_error(ex)
+                return
+
+            self.observer.on_next(res)
+        elif self.done_count - self.is_done[i] == len(values) - 1:
+            self.observer.on_completed()
+
+    def done(self, i):
+        if not self.is_done[i]:
+            self.is_done[i] = True
+            self.done_count += 1
+        if self.done_count == len(self.is_done):
+            self.observer.on_completed()
+
+
+class CombineLatestObserver(Sink):
+    __slots__ = ("sink", "index")
+
+    def __init__(self, sink, index):
+        super(CombineLatestObserver, self).__init__(sink.observer)
+        self.sink = sink
+        self.index = index
+
+    def _next(self, value):
+        sink = self.sink
+        with sink.lock:
+            sink.next(self.index, value)
+
+    def _on_completed(self):
+        sink = self.sink
+        with sink.lock:
+            sink.done(self.index)
 
 @extensionmethod(Observable, instancemethod=True)
 def combine_latest(self, *args):
@@ -51,49 +113,13 @@ def combine_latest(cls, *args):
     parent = args[0]
 
     def subscribe(observer):
-        n = len(args)
-        has_value = [False] * n
-        has_value_all = [False]
-        is_done = [False] * n
-        values = [None] * n
-
-        def next(i):
-            has_value[i] = True
-
-            if has_value_all[0] or all(has_value):
-                try:
-                    res = result_selector(*values)
-                except Exception as ex:
-                    observer.on_error(ex)
-                    return
-
-                observer.on_next(res)
-            elif all([x for j, x in enumerate(is_done) if j != i]):
-                observer.on_completed()
-
-            has_value_all[0] = all(has_value)
-
-        def done(i):
-            is_done[i] = True
-            if all(is_done):
-                observer.on_completed()
-
-        subscriptions = [None] * n
-        def func(i):
-            subscriptions[i] = SingleAssignmentDisposable()
-
-            def on_next(x):
-                with parent.lock:
-                    values[i] = x
-                    next(i)
-
-            def on_completed():
-                with parent.lock:
-                    done(i)
-
-            subscriptions[i].disposable = args[i].subscribe(on_next, observer.on_error, on_completed)
-
-        for idx in range(n):
-            func(idx)
+        sink = CombineLatestSink(observer, result_selector, parent.lock,
+                                 len(args))
+        subscriptions = []
+        for i, source in enumerate(args):
+            subscription = SingleAssignmentDisposable()
+            subscriptions.append(subscription)
+            subscription.disposable = source.subscribe(
+                CombineLatestObserver(sink, i))
         return CompositeDisposable(subscriptions)
     return AnonymousObservable(subscribe)
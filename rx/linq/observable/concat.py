@@ -1,9 +1,8 @@
 from rx import AnonymousObservable
-from rx.disposables import Disposable, SingleAssignmentDisposable, CompositeDisposable, SerialDisposable
-from rx.concurrency import immediate_scheduler
 from rx.observable import Observable
 from rx.internal import extensionmethod, extensionclassmethod
-from rx.internal import Enumerable, Enumerator
+from rx.internal import Enumerable
+from rx.linq.concatsink import ConcatSink
 
 
 @extensionmethod(Observable, instancemethod=True)
@@ -64,33 +63,7 @@ def concat(cls, *args):
         sources = list(args)
 
     def subscribe(observer):
-        enum = iter(sources)
-        is_disposed = [False]
-        subscription = SerialDisposable()
-
-        def action(action1, state=None):
-            if is_disposed[0]:
-                return
-            try:
-                current = next(enum)
-            except StopIteration:
-                observer.on_completed()
-            except Exception as ex:
-                observer.on_error(ex)
-            else:
-                d = SingleAssignmentDisposable()
-                subscription.disposable = d
-                d.disposable = current.subscribe(
-                    observer.on_next,
-                    observer.on_error,
-                    lambda: action1()
-                )
-
-        cancelable = immediate_scheduler.schedule_recursive(action)
-
-        def dispose():
-            is_disposed[0] = True
-        return CompositeDisposable(subscription, cancelable, Disposable(dispose))
+        return ConcatSink(observer, sources).run()
     return AnonymousObservable(subscribe)
 
 @extensionmethod(Observable)
@@ -6,6 +6,100 @@ from rx.disposables import CompositeDisposable, \
     SingleAssignmentDisposable, SerialDisposable
 from rx.concurrency import timeout_scheduler
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+
+
+class DebounceSink(Sink):
+    """Keeps the latest value of a debounced subscription. Each value gets
+    an id, and only the timer or throttle of the latest id sends it."""
+
+    __slots__ = ("scheduler", "duetime", "cancelable", "has_value", "value",
+                 "id")
+
+    def __init__(self, observer, scheduler, duetime, cancelable):
+        super(DebounceSink, self).__init__(observer)
+        self.scheduler = scheduler
+        self.duetime = duetime
+        self.cancelable = cancelable
+        self.has_value = False
+        self.value = None
+        self.id = 0
+
+    def _next(self, value):
+        self.has_value = True
+        self.value = value
+        self.id += 1
+        d = SingleAssignmentDisposable()
+        self.cancelable.disposable = d
+        d.disposable = self.scheduler.schedule_relative(self.duetime,
+                                                        self._timer, self.id)
+
+    def _timer(self, scheduler, current_id):
+        self.emit(current_id)
+
+    def emit(self, current_id):
+        if self.has_value and self.id == current_id:
+            self.observer.on_next(self.value)
+        self.has_value = False
+
+    def _on_error(self, exception):
+        self.cancelable.dispose()
+        self.observer.on_error(exception)
+        self.has_value = False
+        self.id += 1
+
+    def _on_completed(self):
+        self.cancelable.dispose()
+        if self.has_value:
+            self.observer.on_next(self.value)
+
+        self.observer.on_completed()
+        self.has_value = False
+        self.id += 1
+
+
+class ThrottleSink(DebounceSink):
+    """Debounces with a throttle sequence per value instead of a timer"""
+
+    __slots__ = ("throttle_duration_selector",)
+
+    def __init__(self, observer, throttle_duration_selector, cancelable):
+        super(ThrottleSink, self).__init__(observer, None, None, cancelable)
+        self.throttle_duration_selector = throttle_duration_selector
+
+    def _next(self, value):
+        try:
+            throttle = self.throttle_duration_selector(value)
+        except Exception as e:
+            self.observer.on_error(e)
+            return
+
+        self.has_value = True
+        self.value = value
+        self.id += 1
+        d = SingleAssignmentDisposable()
+        self.cancelable.disposable = d
+        d.disposable = throttle.subscribe(ThrottleObserver(self, self.id, d))
+
+
+class ThrottleObserver(Sink):
+    """Observer of the throttle sequence of a value of throttle_with_selector"""
+
+    __slots__ = ("parent", "id", "subscription")
+
+    def __init__(self, parent, current_id, subscription):
+        super(ThrottleObserver, self).__init__(parent.observer)
+        self.parent = parent
+        self.id = current_id
+        self.subscription = subscription
+
+    def _next(self, value):
+        self.parent.emit(self.id)
+        self.subscription.dispose()
+
+    def _on_completed(self):
+        self.parent.emit(self.id)
+        self.subscription.dispose()
 
 
 @extensionmethod(Observable, alias="throttle_with_timeout")
@@ -31,41 +125,8 @@ def debounce(self, duetime, scheduler=None):
 
     def subscribe(observer):
         cancelable = SerialDisposable()
-        has_value = [False]
-        value = [None]
-        _id = [0]
-
-        def on_next(x):
-            has_value[0] = True
-            value[0] = x
-            _id[0] += 1
-            current_id = _id[0]
-            d = SingleAssignmentDisposable()
-            cancelable.disposable = d
-
-            def action(scheduler, state=None):
-                if has_value[0] and _id[0] == current_id:
-                    observer.on_next(value[0])
-                has_value[0] = False
-
-            d.disposable = scheduler.schedule_relative(duetime, action)
-
-        def on_error(exception):
-            cancelable.dispose()
-            observer.on_error(exception)
-            has_value[0] = False
-            _id[0] += 1
-
-        def on_completed():
-            cancelable.dispose()
-            if has_value[0]:
-                observer.on_next(value[0])
-
-            observer.on_completed()
-            has_value[0] = False
-            _id[0] += 1
-
-        subscription = source.subscribe(on_next, on_error, on_completed)
+        sink = DebounceSink(observer, scheduler, duetime, cancelable)
+        subscription = source.subscribe(sink)
         return CompositeDisposable(subscription, cancelable)
     return AnonymousObservable(subscribe)
 
@@ -87,56 +148,7 @@ def throttle_with_selector(self, throttle_duration_selector):
 
     def subscribe(observer):
         cancelable = SerialDisposable()
-        has_value = [False]
-        value = [None]
-        _id = [0]
-
-        def on_next(x):
-            throttle = None
-            try:
-                throttle = throttle_duration_selector(x)
-            except Exception as e:
-                observer.on_error(e)
-                return
-
-            has_value[0] = True
-            value[0] = x
-            _id[0] += 1
-            current_id = _id[0]
-            d = SingleAssignmentDisposable()
-            cancelable.disposable = d
-
-            def on_next(x):
-                if has_value[0] and _id[0] == current_id:
-                    observer.on_next(value[0])
-
-                has_value[0] = False
-                d.dispose()
-
-            def on_completed():
-                if has_value[0] and _id[0] == current_id:
-                    observer.on_next(value[0])
-
-                has_value[0] = False
-                d.dispose()
-
-            d.disposable = throttle.subscribe(on_next, observer.on_error, on_completed)
-
-        def on_error(e):
-            cancelable.dispose()
-            observer.on_error(e)
-            has_value[0] = False
-            _id[0] += 1
-
-        def on_completed():
-            cancelable.dispose()
-            if has_value[0]:
-                observer.on_next(value[0])
-
-            observer.on_completed()
-            has_value[0] = False
-            _id[0] += 1
-
-        subscription = source.subscribe(on_next, on_error, on_completed)
+        sink = ThrottleSink(observer, throttle_duration_selector, cancelable)
+        subscription = source.subscribe(sink)
         return CompositeDisposable(subscription, cancelable)
     return AnonymousObservable(subscribe)
@@ -27,5 +27,5 @@ def defer(cls, observable_factory):
             return Observable.throw_exception(ex).subscribe(observer)
 
         result = Observable.from_future(result)
-        return result.subscribe(observer)
+        return result._subscribe_internal(observer)
     return AnonymousObservable(subscribe)
\ No newline at end of file
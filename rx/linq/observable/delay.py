@@ -1,5 +1,6 @@
 import logging
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
@@ -7,6 +8,7 @@ from rx.disposables import CompositeDisposable, \
     SingleAssignmentDisposable, SerialDisposable
 from rx.concurrency import timeout_scheduler
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
 
 log = logging.getLogger("Rx")
 
@@ -15,77 +17,104 @@ class Timestamp(object):
         self.value = value
         self.timestamp = timestamp
 
+class DelaySink(Sink):
+    """Queues the materialized notifications of a delayed subscription with
+    their due times, and drains the due ones on the scheduler."""
+
+    __slots__ = ("scheduler", "duetime", "seconds", "cancelable", "lock",
+                 "queue", "exception", "active", "running")
+
+    def __init__(self, observer, scheduler, duetime, cancelable, lock):
+        super(DelaySink, self).__init__(observer)
+        self.scheduler = scheduler
+        self.duetime = duetime
+        self.seconds = scheduler.to_seconds(duetime)
+        self.cancelable = cancelable
+        self.lock = lock
+        self.queue = deque()
+        self.exception = None
+        self.active = False
+        self.running = False
+
+    def _next(self, notification):
+        log.debug("observable_delay_timespan:subscribe:on_next()")
+        should_run = False
+        queue = self.queue
+
+        with self.lock:
+            if notification.kind == 'E':
+                queue.clear()
+                queue.append(Timestamp(value=notification,
+                                       timestamp=self.scheduler.monotonic()))
+                self.exception = notification.exception
+                should_run = not self.running
+            else:
+                timestamp = self.scheduler.monotonic() + self.seconds
+                queue.append(Timestamp(value=notification, timestamp=timestamp))
+                should_run = not self.active
+                self.active = True
+
+        if should_run:
+            if self.exception:
+                log.error("*** Exception: %s", self.exception)
+                self.observer.on_error(self.exception)
+            else:
+                d = SingleAssignmentDisposable()
+                self.cancelable.disposable = d
+                d.disposable = self.scheduler.schedule_recursive_with_relative(
+                    self.duetime, self._drain)
+
+    def _on_completed(self):
+        # Completion arrives as a materialized notification
+        pass
+
+    def _drain(self, this):
+        if self.exception:
+            log.error("observable_delay_timespan:subscribe:on_next:action(), exception: %s", self.exception)
+            return
+
+        scheduler = self.scheduler
+        queue = self.queue
+        with self.lock:
+            self.running = True
+            while True:
+                result = None
+                # Due within the microsecond resolution of
+                # timedelta, i.e. ignoring float rounding
+                if len(queue) and queue[0].timestamp - scheduler.monotonic() < 1e-6:
+                    result = queue.popleft().value
+
+                if result:
+                    result.accept(self.observer)
+
+                if not result:
+                    break
+
+            should_recurse = False
+            recurse_duetime = 0
+            if len(queue):
+                should_recurse = True
+                diff = queue[0].timestamp - scheduler.monotonic()
+                recurse_duetime = scheduler.to_timedelta(max(0.0, diff))
+            else:
+                self.active = False
+
+            ex = self.exception
+            self.running = False
+
+        if ex:
+            self.observer.on_error(ex)
+        elif should_recurse:
+            this(recurse_duetime)
+
+
 def observable_delay_timespan(source, duetime, scheduler):
     duetime = scheduler.to_timedelta(duetime)
 
     def subscribe(observer):
         cancelable = SerialDisposable()
-        exception = [None]
-        active = [False]
-        running = [False]
-        queue = []
-
-        def on_next(notification):
-            log.debug("observable_delay_timespan:subscribe:on_next()")
-            should_run = False
-
-            with source.lock:
-                if notification.value.kind == 'E':
-                    del queue[:]
-                    queue.append(notification)
-                    exception[0] = notification.value.exception
-                    should_run = not running[0]
-                else:
-                    queue.append(Timestamp(value=notification.value, timestamp=notification.timestamp + duetime))
-                    should_run = not active[0]
-                    active[0] = True
-
-            if should_run:
-                if exception[0]:
-                    log.error("*** Exception: %s", exception[0])
-                    observer.on_error(exception[0])
-                else:
-                    d = SingleAssignmentDisposable()
-                    cancelable.disposable = d
-
-                    def action(this):
-                        if exception[0]:
-                            log.error("observable_delay_timespan:subscribe:on_next:action(), exception: %s", exception[0])
-                            return
-
-                        with source.lock:
-                            running[0] = True
-                            while True:
-                                result = None
-                                if len(queue) and queue[0].timestamp <= scheduler.now():
-                                    result = queue.pop(0).value
-
-                                if result:
-                                    result.accept(observer)
-
-                                if not result:
-                                    break
-
-                            should_recurse = False
-                            recurse_duetime = 0
-                            if len(queue) :
-                                should_recurse = True
-                                diff = queue[0].timestamp - scheduler.now()
-                                zero = timedelta(0) if isinstance(diff, timedelta) else 0
-                                recurse_duetime = max(zero, diff)
-                            else:
-                                active[0] = False
-
-                            ex = exception[0]
-                            running[0] = False
-
-                        if ex:
-                            observer.on_error(ex)
-                        elif should_recurse:
-                            this(recurse_duetime)
-
-                    d.disposable = scheduler.schedule_recursive_with_relative(duetime, action)
-        subscription = source.materialize().timestamp(scheduler).subscribe(on_next)
+        sink = DelaySink(observer, scheduler, duetime, cancelable, source.lock)
+        subscription = source.materialize().subscribe(sink)
         return CompositeDisposable(subscription, cancelable)
     return AnonymousObservable(subscribe)
 
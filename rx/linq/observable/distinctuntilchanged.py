@@ -1,7 +1,41 @@
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
+from rx.linq.sink import Sink
 from rx.internal.basic import identity, default_comparer
 from rx.internal import extensionmethod
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled, \
+    SKIP
+
+
+class DistinctUntilChangedSink(Sink):
+    __slots__ = ("key_selector", "comparer", "has_current_key", "current_key")
+
+    def __init__(self, observer, key_selector, comparer):
+        super(DistinctUntilChangedSink, self).__init__(observer)
+        self.key_selector = key_selector
+        self.comparer = comparer
+        self.has_current_key = False
+        self.current_key = None
+
+    def _next(self, value):
+        comparer_equals = False
+        try:
+            key = self.key_selector(value)
+        except Exception as exception:
+            self.observer.on_error(exception)
+            return
+
+        if self.has_current_key:
+            try:
+                comparer_equals = self.comparer(self.current_key, key)
+            except Exception as exception:
+                self.observer.on_error(exception)
+                return
+
+        if not self.has_current_key or not comparer_equals:
+            self.has_current_key = True
+            self.current_key = key
+            self.observer.on_next(value)
 
 
 @extensionmethod(Observable)
@@ -27,29 +61,23 @@ def distinct_until_changed(self, key_selector=None, comparer=None):
     key_selector = key_selector or identity
     comparer = comparer or default_comparer
 
-    def subscribe(observer):
-        has_current_key = [False]
-        current_key = [None]
+    if is_fusion_enabled():
+        def stage():
+            has_current_key = [False]
+            current_key = [None]
 
-        def on_next(value):
-            comparer_equals = False
-            try:
+            def step(value):
                 key = key_selector(value)
-            except Exception as exception:
-                observer.on_error(exception)
-                return
-
-            if has_current_key[0]:
-                try:
-                    comparer_equals = comparer(current_key[0], key)
-                except Exception as exception:
-                    observer.on_error(exception)
-                    return
+                if has_current_key[0] and comparer(current_key[0], key):
+                    return SKIP
 
-            if not has_current_key[0] or not comparer_equals:
                 has_current_key[0] = True
                 current_key[0] = key
-                observer.on_next(value)
+                return value
+            return step, None, None
+        return FusedObservable(self, stage)
 
-        return source.subscribe(on_next, observer.on_error, observer.on_completed)
+    def subscribe(observer):
+        return source._subscribe_internal(
+            DistinctUntilChangedSink(observer, key_selector, comparer))
     return AnonymousObservable(subscribe)
@@ -1,7 +1,8 @@
 from rx import Observable
-from rx.observer import AbstractObserver
+from rx.observer import Observer, AbstractObserver
 from rx.anonymousobservable import AnonymousObservable
 from rx.internal import extensionmethod
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled
 
 
 @extensionmethod(Observable, alias="tap")
@@ -40,6 +41,15 @@ def do_action(self, on_next=None, on_error=None, on_completed=None,
         on_completed = on_next.on_completed
         on_next = on_next.on_next
 
+    if is_fusion_enabled():
+        def stage():
+            def step(value):
+                if on_next:
+                    on_next(value)
+                return value
+            return step, on_error, on_completed
+        return FusedObservable(self, stage)
+
     def subscribe(observer):
         def _on_next(x):
             try:
@@ -70,5 +80,5 @@ def do_action(self, on_next=None, on_error=None, on_completed=None,
                     observer.on_error(e)
 
                 observer.on_completed()
-        return source.subscribe(_on_next, _on_error, _on_completed)
+        return source._subscribe_internal(Observer(_on_next, _on_error, _on_completed))
     return AnonymousObservable(subscribe)
@@ -1,21 +1,28 @@
+from itertools import islice
+
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.concurrency import current_thread_scheduler
 from rx.internal import extensionclassmethod
+from rx.internal.exceptions import ArgumentOutOfRangeException
 
 
 @extensionclassmethod(Observable, alias=["from_", "from_list"])
-def from_iterable(cls, iterable, scheduler=None):
+def from_iterable(cls, iterable, scheduler=None, batch_size=None):
     """Converts an array to an observable sequence, using an optional
     scheduler to enumerate the array.
 
     1 - res = rx.Observable.from_iterable([1,2,3])
     2 - res = rx.Observable.from_iterable([1,2,3], rx.Scheduler.timeout)
+    3 - res = rx.Observable.from_iterable(range(10000), batch_size=1000)
 
     Keyword arguments:
     :param Observable cls: Observable class
     :param Scheduler scheduler: [Optional] Scheduler to run the enumeration of the input
         sequence on.
+    :param int batch_size: [Optional] Number of elements to pull from the
+        iterable per scheduled step and send as a single batch to observers
+        supporting on_next_batch.
 
     :returns: The observable sequence whose elements are pulled from the
         given enumerable sequence.
@@ -23,9 +30,30 @@ def from_iterable(cls, iterable, scheduler=None):
     """
 
     scheduler = scheduler or current_thread_scheduler
-    iterator = iter(iterable)
+
+    if batch_size is not None:
+        if batch_size <= 0:
+            raise ArgumentOutOfRangeException()
+
+        def subscribe(observer):
+            iterator = iter(iterable)
+
+            def action(action1, state=None):
+                batch = list(islice(iterator, batch_size))
+                if batch:
+                    observer.on_next_batch(batch)
+
+                if len(batch) < batch_size:
+                    observer.on_completed()
+                else:
+                    action1(action)
+
+            return scheduler.schedule_recursive(action)
+        return AnonymousObservable(subscribe)
 
     def subscribe(observer):
+        iterator = iter(iterable)
+
         def action(action1, state=None):
             try:
                 item = next(iterator)
@@ -7,6 +7,103 @@ from rx.disposables import CompositeDisposable, RefCountDisposable, \
 from rx.internal.basic import default_comparer, identity
 from rx.linq.groupedobservable import GroupedObservable
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+
+
+class GroupByUntilSink(Sink):
+    """Keeps the writer subject of each group of a group_by_until
+    subscription, by key"""
+
+    __slots__ = ("key_selector", "element_selector", "duration_selector",
+                 "mapping", "group_disposable", "ref_count_disposable")
+
+    def __init__(self, observer, key_selector, element_selector,
+                 duration_selector, group_disposable, ref_count_disposable):
+        super(GroupByUntilSink, self).__init__(observer)
+        self.key_selector = key_selector
+        self.element_selector = element_selector
+        self.duration_selector = duration_selector
+        self.mapping = OrderedDict()
+        self.group_disposable = group_disposable
+        self.ref_count_disposable = ref_count_disposable
+
+    def _next(self, x):
+        try:
+            key = self.key_selector(x)
+        except Exception as e:
+            self.error(e)
+            return
+
+        writer = self.mapping.get(key)
+        if not writer:
+            writer = Subject()
+            self.mapping[key] = writer
+
+            group = GroupedObservable(key, writer, self.ref_count_disposable)
+            duration_group = GroupedObservable(key, writer)
+            try:
+                duration = self.duration_selector(duration_group)
+            except Exception as e:
+                self.error(e)
+                return
+
+            self.observer.on_next(group)
+            md = SingleAssignmentDisposable()
+            self.group_disposable.add(md)
+            md.disposable = duration.take(1).subscribe(
+                DurationObserver(self, key, writer, md))
+
+        try:
+            element = self.element_selector(x)
+        except Exception as e:
+            self.error(e)
+            return
+
+        writer.on_next(element)
+
+    def error(self, exception):
+        for writer in self.mapping.values():
+            writer.on_error(exception)
+
+        self.observer.on_error(exception)
+
+    _on_error = error
+
+    def _on_completed(self):
+        for writer in self.mapping.values():
+            writer.on_completed()
+
+        self.observer.on_completed()
+
+    def expire(self, key, writer, subscription):
+        if self.mapping[key]:
+            del self.mapping[key]
+            writer.on_completed()
+
+        self.group_disposable.remove(subscription)
+
+
+class DurationObserver(Sink):
+    """Observer of the duration sequence of a group, expiring the group
+    once the duration ends"""
+
+    __slots__ = ("parent", "key", "writer", "subscription")
+
+    def __init__(self, parent, key, writer, subscription):
+        super(DurationObserver, self).__init__(parent.observer)
+        self.parent = parent
+        self.key = key
+        self.writer = writer
+        self.subscription = subscription
+
+    def _next(self, value):
+        pass
+
+    def _on_error(self, exception):
+        self.parent.error(exception)
+
+    def _on_completed(self):
+        self.parent.expire(self.key, self.writer, self.subscription)
 
 
 @extensionmethod(Observable)
@@ -55,89 +152,11 @@ def group_by_until(self, key_selector, element_selector, duration_selector,
     comparer = comparer or default_comparer
 
     def subscribe(observer):
-        mapping = OrderedDict()
         group_disposable = CompositeDisposable()
         ref_count_disposable = RefCountDisposable(group_disposable)
-
-        def on_next(x):
-            writer = None
-            key = None
-
-            try:
-                key = key_selector(x)
-            except Exception as e:
-                for w in mapping.values():
-                    w.on_error(e)
-
-                observer.on_error(e)
-                return
-
-            fire_new_map_entry = False
-            writer = mapping.get(key)
-            if not writer:
-                writer = Subject()
-                mapping[key] = writer
-                fire_new_map_entry = True
-
-            if fire_new_map_entry:
-                group = GroupedObservable(key, writer, ref_count_disposable)
-                duration_group = GroupedObservable(key, writer)
-                try:
-                    duration = duration_selector(duration_group)
-                except Exception as e:
-                    for w in mapping.values():
-                        w.on_error(e)
-
-                    observer.on_error(e)
-                    return
-
-                observer.on_next(group)
-                md = SingleAssignmentDisposable()
-                group_disposable.add(md)
-
-                def expire():
-                    if mapping[key]:
-                        del mapping[key]
-                        writer.on_completed()
-
-                    group_disposable.remove(md)
-
-                def on_next(value):
-                    pass
-
-                def on_error(exn):
-                    for wr in mapping.values():
-                        wr.on_error(exn)
-                    observer.on_error(exn)
-
-                def on_completed():
-                    expire()
-
-                md.disposable = duration.take(1).subscribe(on_next, on_error, on_completed)
-
-            try:
-                element = element_selector(x)
-            except Exception as e:
-                for w in mapping.values():
-                    w.on_error(e)
-
-                observer.on_error(e)
-                return
-
-            writer.on_next(element)
-
-        def on_error(ex):
-            for w in mapping.values():
-                w.on_error(ex)
-
-            observer.on_error(ex)
-
-        def on_completed():
-            for w in mapping.values():
-                w.on_completed()
-
-            observer.on_completed()
-
-        group_disposable.add(source.subscribe(on_next, on_error, on_completed))
+        sink = GroupByUntilSink(observer, key_selector, element_selector,
+                                duration_selector, group_disposable,
+                                ref_count_disposable)
+        group_disposable.add(source.subscribe(sink))
         return ref_count_disposable
     return AnonymousObservable(subscribe)
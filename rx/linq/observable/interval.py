@@ -1,24 +1,39 @@
 from rx.observable import Observable
-from rx.concurrency import TimeoutScheduler
+from rx.anonymousobservable import AnonymousObservable
+from rx.concurrency import timeout_scheduler
 from rx.internal import extensionclassmethod
 
 @extensionclassmethod(Observable)
-def interval(cls, period, scheduler=None):
+def interval(cls, period, scheduler=None, shared=False):
     """Returns an observable sequence that produces a value after each
     period.
 
     Example:
     1 - res = rx.Observable.interval(1000)
     2 - res = rx.Observable.interval(1000, rx.Scheduler.timeout)
+    3 - res = rx.Observable.interval(1000, shared=True)
 
     Keyword arguments:
     period -- Period for producing the values in the resulting sequence
         (specified as an integer denoting milliseconds).
     scheduler -- [Optional] Scheduler to run the timer on. If not specified,
         rx.Scheduler.timeout is used.
+    shared -- [Optional] If True, all shared intervals with the same period
+        on the scheduler are driven by a single tick source. A subscriber
+        then gets its first value on the next shared tick, which may come
+        sooner than a full period after subscribing. Defaults to False.
 
     Returns an observable sequence that produces a value after each period.
     """
 
-    scheduler = scheduler or TimeoutScheduler()
-    return Observable.timer(period, period, scheduler)
+    scheduler = scheduler or timeout_scheduler
+    if not shared:
+        return Observable.timer(period, period, scheduler)
+
+    def subscribe(observer):
+        def action(count):
+            observer.on_next(count)
+            return count + 1
+
+        return scheduler.schedule_periodic(period, action, 0, shared=True)
+    return AnonymousObservable(subscribe)
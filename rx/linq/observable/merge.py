@@ -1,8 +1,100 @@
+from collections import deque
+
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
 from rx.concurrency import Scheduler, immediate_scheduler
 from rx.internal import extensionmethod, extensionclassmethod
+from rx.linq.sink import Sink
+
+
+class MergeSink(Sink):
+    """Observer of the outer sequence of merge_observable, subscribing to
+    each inner sequence as it arrives. The group holds the subscription of
+    the outer sequence and of each active inner sequence."""
+
+    __slots__ = ("group", "is_done")
+
+    def __init__(self, observer, group):
+        super(MergeSink, self).__init__(observer)
+        self.group = group
+        self.is_done = False
+
+    def _next(self, inner_source):
+        inner_subscription = SingleAssignmentDisposable()
+        self.group.add(inner_subscription)
+
+        inner_source = Observable.from_future(inner_source)
+        inner_subscription.disposable = inner_source.subscribe(
+            MergeInnerObserver(self, inner_subscription))
+
+    def _on_completed(self):
+        self.is_done = True
+        if len(self.group) == 1:
+            self.observer.on_completed()
+
+    def inner_completed(self, inner_subscription):
+        self.group.remove(inner_subscription)
+        if self.is_done and len(self.group) == 1:
+            self.observer.on_completed()
+
+
+class MergeConcurrentSink(Sink):
+    """Observer of the outer sequence of merge with a maximum number of
+    concurrent inner subscriptions. Inner sequences beyond the maximum wait
+    in a queue until an active one completes."""
+
+    __slots__ = ("group", "max_concurrent", "active_count", "is_done",
+                 "queue")
+
+    def __init__(self, observer, group, max_concurrent):
+        super(MergeConcurrentSink, self).__init__(observer)
+        self.group = group
+        self.max_concurrent = max_concurrent
+        self.active_count = 0
+        self.is_done = False
+        self.queue = deque()
+
+    def _next(self, inner_source):
+        if self.active_count < self.max_concurrent:
+            self.active_count += 1
+            self.subscribe_inner(inner_source)
+        else:
+            self.queue.append(inner_source)
+
+    def _on_completed(self):
+        self.is_done = True
+        if not self.active_count:
+            self.observer.on_completed()
+
+    def subscribe_inner(self, inner_source):
+        inner_subscription = SingleAssignmentDisposable()
+        self.group.add(inner_subscription)
+        inner_subscription.disposable = inner_source.subscribe(
+            MergeInnerObserver(self, inner_subscription))
+
+    def inner_completed(self, inner_subscription):
+        self.group.remove(inner_subscription)
+        if self.queue:
+            self.subscribe_inner(self.queue.popleft())
+        else:
+            self.active_count -= 1
+            if self.is_done and not self.active_count:
+                self.observer.on_completed()
+
+
+class MergeInnerObserver(Sink):
+    """Observer of an inner sequence of a merge"""
+
+    __slots__ = ("parent", "subscription")
+
+    def __init__(self, parent, subscription):
+        super(MergeInnerObserver, self).__init__(parent.observer)
+        self.parent = parent
+        self.subscription = subscription
+
+    def _on_completed(self):
+        self.parent.inner_completed(self.subscription)
 
 
 @extensionmethod(Observable, instancemethod=True)
@@ -31,43 +123,9 @@ def merge(self, *args, **kwargs):
     sources = self
 
     def subscribe(observer):
-        active_count = [0]
         group = CompositeDisposable()
-        is_stopped = [False]
-        q = []
-
-        def subscribe(xs):
-            subscription = SingleAssignmentDisposable()
-            group.add(subscription)
-
-            def on_completed():
-                group.remove(subscription)
-                if len(q):
-                    s = q.pop(0)
-                    subscribe(s)
-                else:
-                    active_count[0] -= 1
-                    if is_stopped[0] and active_count[0] == 0:
-                        observer.on_completed()
-
-            subscription.disposable = xs.subscribe(observer.on_next,
-                                                   observer.on_error,
-                                                   on_completed)
-
-        def on_next(inner_source):
-            if active_count[0] < max_concurrent:
-                active_count[0] += 1
-                subscribe(inner_source)
-            else:
-                q.append(inner_source)
-
-        def on_completed():
-            is_stopped[0] = True
-            if active_count[0] == 0:
-                observer.on_completed()
-
-        group.add(sources.subscribe(on_next, observer.on_error,
-                                    on_completed))
+        sink = MergeConcurrentSink(observer, group, max_concurrent)
+        group.add(sources.subscribe(sink))
         return group
     return AnonymousObservable(subscribe)
 
@@ -110,42 +168,7 @@ def merge_all(self):
     sequences.
     """
 
-    sources = self
-
-    def subscribe(observer):
-        group = CompositeDisposable()
-        is_stopped = [False]
-        m = SingleAssignmentDisposable()
-        group.add(m)
-
-        def on_next(inner_source):
-            inner_subscription = SingleAssignmentDisposable()
-            group.add(inner_subscription)
-
-            inner_source = Observable.from_future(inner_source)
-
-            def on_next(x):
-                observer.on_next(x)
-
-            def on_completed():
-                group.remove(inner_subscription)
-                if is_stopped[0] and len(group) == 1:
-                    observer.on_completed()
-
-            disposable = inner_source.subscribe(on_next, observer.on_error,
-                                                on_completed)
-            inner_subscription.disposable = disposable
-
-        def on_completed():
-            is_stopped[0] = True
-            if len(group) == 1:
-                observer.on_completed()
-
-        m.disposable = sources.subscribe(on_next, observer.on_error,
-                                         on_completed)
-        return group
-
-    return AnonymousObservable(subscribe)
+    return self.merge_observable()
 
 @extensionmethod(Observable)
 def merge_observable(self):
@@ -160,34 +183,7 @@ def merge_observable(self):
 
     def subscribe(observer):
         m = SingleAssignmentDisposable()
-        group = CompositeDisposable()
-        is_stopped = [False]
-        group.add(m)
-
-        def on_next(inner_source):
-            inner_subscription = SingleAssignmentDisposable()
-            group.add(inner_subscription)
-
-            inner_source = Observable.from_future(inner_source)
-
-            def on_complete():
-                group.remove(inner_subscription)
-                if is_stopped[0] and len(group) == 1:
-                    observer.on_completed()
-
-            disposable = inner_source.subscribe(
-                observer.on_next,
-                observer.on_error,
-                on_complete)
-
-            inner_subscription.disposable = disposable
-
-        def on_complete():
-            is_stopped[0] = True
-            if group.length == 1:
-                observer.on_completed()
-
-        m.disposable = sources.subscribe(on_next, observer.on_error,
-                                         on_complete)
+        group = CompositeDisposable(m)
+        m.disposable = sources.subscribe(MergeSink(observer, group))
         return group
     return AnonymousObservable(subscribe)
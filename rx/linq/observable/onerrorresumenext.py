@@ -1,9 +1,7 @@
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
-from rx.disposables import CompositeDisposable, SingleAssignmentDisposable, \
-    SerialDisposable
-from rx.concurrency import immediate_scheduler
 from rx.internal import extensionmethod, extensionclassmethod
+from rx.linq.concatsink import ConcatSink, RESUME
 
 
 @extensionmethod(Observable, instancemethod=True)
@@ -38,31 +36,10 @@ def on_error_resume_next(cls, *args):
     """
 
     if args and isinstance(args[0], list):
-        sources = iter(args[0])
+        sources = args[0]
     else:
-        sources = iter(args)
+        sources = args
 
     def subscribe(observer):
-        subscription = SerialDisposable()
-
-        def action(this, state=None):
-            try:
-                source = next(sources)
-            except StopIteration:
-                observer.on_completed()
-                return
-
-            # Allow source to be a factory method taking an error
-            source = source(state) if callable(source) else source
-            current = Observable.from_future(source)
-
-            d = SingleAssignmentDisposable()
-            subscription.disposable = d
-            d.disposable = current.subscribe(
-                    observer.on_next,
-                    lambda ex: this(ex),
-                    this)
-
-        cancelable = immediate_scheduler.schedule_recursive(action)
-        return CompositeDisposable(subscription, cancelable)
+        return ConcatSink(observer, sources, RESUME).run()
     return AnonymousObservable(subscribe)
@@ -22,8 +22,9 @@ def partition(self, predicate):
     """
 
     published = self.publish().ref_count()
+    adapted = adapt_call(predicate)
     return [
         published.filter(predicate), # where does adapt_call itself
-        published.filter(lambda x, i: not adapt_call(predicate)(x, i))
+        published.filter(lambda x, i: not adapted(x, i))
     ]
 
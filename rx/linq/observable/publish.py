@@ -1,30 +1,42 @@
 from rx import Observable
-from rx.subjects import Subject
+from rx.subjects import Subject, RoutingSubject
 from rx.internal import extensionmethod
 
 
 @extensionmethod(Observable)
-def publish(self, selector=None):
+def publish(self, selector=None, key_selector=None):
     """Returns an observable sequence that is the result of invoking the
     selector on a connectable observable sequence that shares a single
     subscription to the underlying sequence. This operator is a
-    specialization of Multicast using a regular Subject.
+    specialization of Multicast using a regular Subject, or a RoutingSubject
+    when a key selector is given.
 
     Example:
     res = source.publish()
     res = source.publish(lambda x: x)
+    res = source.publish(key_selector=lambda e: e.topic)
+    res.subscribe_key("prices", observer)
 
     selector -- {Function} [Optional] Selector function which can use the
         multicasted source sequence as many times as needed, without causing
         multiple subscriptions to the source sequence. Subscribers to the
         given source will receive all notifications of the source from the
         time of the subscription on.
+    key_selector -- {Function} [Optional] Function returning the key of an
+        element. The connectable sequence then routes each element to the
+        observers subscribed to its key with subscribe_key, and to the
+        observers subscribed with subscribe.
 
     Returns an observable {Observable} sequence that contains the elements
     of a sequence produced by multicasting the source sequence within a
     selector function."""
 
+    def subject_selector():
+        if key_selector is not None:
+            return RoutingSubject(key_selector)
+        return Subject()
+
     if selector:
-        return self.multicast(subject_selector=lambda: Subject(), selector=selector)
+        return self.multicast(subject_selector=subject_selector, selector=selector)
     else:
-        return self.multicast(subject=Subject())
+        return self.multicast(subject=subject_selector())
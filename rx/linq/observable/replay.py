@@ -1,22 +1,25 @@
 from rx.observable import Observable
-from rx.subjects import ReplaySubject
+from rx.subjects import ReplaySubject, CompactedReplaySubject
 from rx.internal import extensionmethod
 
 
 @extensionmethod(Observable)
-def replay(self, selector, buffer_size=None, window=None, scheduler=None):
+def replay(self, selector, buffer_size=None, window=None, scheduler=None,
+           key_selector=None, max_keys=None):
     """Returns an observable sequence that is the result of invoking the
     selector on a connectable observable sequence that shares a single
     subscription to the underlying sequence replaying notifications subject
     to a maximum time length for the replay buffer.
 
-    This operator is a specialization of Multicast using a ReplaySubject.
+    This operator is a specialization of Multicast using a ReplaySubject, or
+    a CompactedReplaySubject when a key selector is given.
 
     Example:
     res = source.replay(buffer_size=3)
     res = source.replay(buffer_size=3, window=500)
     res = source.replay(None, 3, 500, scheduler)
     res = source.replay(lambda x: x.take(6).repeat(), 3, 500, scheduler)
+    res = source.replay(None, key_selector=lambda quote: quote.symbol)
 
     Keyword arguments:
     selector -- [Optional] Selector function which can use the multicasted
@@ -28,17 +31,25 @@ def replay(self, selector, buffer_size=None, window=None, scheduler=None):
     window -- [Optional] Maximum time length of the replay buffer.
     scheduler -- [Optional] Scheduler where connected observers within the
         selector function will be invoked on.
+    key_selector -- [Optional] Function returning the key of an element.
+        When given, only the latest element of each key is replayed, and
+        buffer_size and window are not used.
+    max_keys -- [Optional] Maximum number of keys to replay when a key
+        selector is given. The least recently updated key is evicted first.
 
     Returns {Observable} An observable sequence that contains the elements
     of a sequence produced by multicasting the source sequence within a
     selector function.
     """
 
+    def subject_selector():
+        if key_selector is not None:
+            return CompactedReplaySubject(key_selector, max_keys, scheduler)
+        return ReplaySubject(buffer_size, window, scheduler)
+
     if callable(selector):
-        def subject_selector():
-            return ReplaySubject(buffer_size, window, scheduler)
         return self.multicast(subject_selector=subject_selector,
                              selector=selector)
     else:
-        return self.multicast(ReplaySubject(buffer_size, window, scheduler))
+        return self.multicast(subject_selector())
 
@@ -1,5 +1,6 @@
 from rx import Observable
 from rx.internal import extensionmethod
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled
 
 
 @extensionmethod(Observable)
@@ -25,6 +26,22 @@ def scan(self, accumulator, seed=None):
 
     source = self
 
+    if is_fusion_enabled():
+        def stage():
+            has_accumulation = [False]
+            accumulation = [None]
+
+            def step(x):
+                if has_accumulation[0]:
+                    accumulation[0] = accumulator(accumulation[0], x)
+                else:
+                    accumulation[0] = accumulator(seed, x) if has_seed else x
+                    has_accumulation[0] = True
+
+                return accumulation[0]
+            return step, None, None
+        return FusedObservable(self, stage)
+
     def defer():
         has_accumulation = [False]
         accumulation = [None]
@@ -1,6 +1,44 @@
 from rx import Observable, AnonymousObservable
 from rx.internal.utils import adapt_call
 from rx.internal import extensionmethod
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled
+from rx.linq.sink import Sink
+
+
+class SelectSink(Sink):
+    __slots__ = ("selector", "count")
+
+    def __init__(self, observer, selector):
+        super(SelectSink, self).__init__(observer)
+        self.selector = selector
+        self.count = 0
+
+    def _next(self, value):
+        try:
+            result = self.selector(value, self.count)
+        except Exception as err:
+            self.observer.on_error(err)
+        else:
+            self.count += 1
+            self.observer.on_next(result)
+
+    def _on_next_batch(self, values):
+        selector = self.selector
+        results = []
+        index = self.count
+        try:
+            for value in values:
+                results.append(selector(value, index))
+                index += 1
+        except Exception as err:
+            self.count = index
+            if results:
+                self.observer.on_next_batch(results)
+            self.observer.on_error(err)
+        else:
+            self.count = index
+            self.observer.on_next_batch(results)
+
 
 @extensionmethod(Observable, alias="map")
 def select(self, selector):
@@ -21,18 +59,17 @@ def select(self, selector):
 
     selector = adapt_call(selector)
 
-    def subscribe(observer):
-        count = [0]
+    if is_fusion_enabled():
+        def stage():
+            count = [0]
 
-        def on_next(value):
-            result = None
-            try:
+            def step(value):
                 result = selector(value, count[0])
-            except Exception as err:
-                observer.on_error(err)
-            else:
                 count[0] += 1
-                observer.on_next(result)
+                return result
+            return step, None, None
+        return FusedObservable(self, stage)
 
-        return self.subscribe(on_next, observer.on_error, observer.on_completed)
+    def subscribe(observer):
+        return self._subscribe_internal(SelectSink(observer, selector))
     return AnonymousObservable(subscribe)
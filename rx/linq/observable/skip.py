@@ -1,6 +1,21 @@
 from rx import Observable, AnonymousObservable
 from rx.internal import ArgumentOutOfRangeException
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+
+
+class SkipSink(Sink):
+    __slots__ = ("remaining",)
+
+    def __init__(self, observer, count):
+        super(SkipSink, self).__init__(observer)
+        self.remaining = count
+
+    def _next(self, value):
+        if self.remaining <= 0:
+            self.observer.on_next(value)
+        else:
+            self.remaining -= 1
 
 
 @extensionmethod(Observable)
@@ -22,13 +37,5 @@ def skip(self, count):
     observable = self
 
     def subscribe(observer):
-        remaining = [count]
-
-        def on_next(value):
-            if remaining[0] <= 0:
-                observer.on_next(value)
-            else:
-                remaining[0] -= 1
-
-        return observable.subscribe(on_next, observer.on_error, observer.on_completed)
+        return observable._subscribe_internal(SkipSink(observer, count))
     return AnonymousObservable(subscribe)
@@ -1,6 +1,32 @@
 from rx import Observable, AnonymousObservable
 from rx.internal.utils import adapt_call
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled, \
+    SKIP
+
+
+class SkipWhileSink(Sink):
+    __slots__ = ("predicate", "i", "running")
+
+    def __init__(self, observer, predicate):
+        super(SkipWhileSink, self).__init__(observer)
+        self.predicate = predicate
+        self.i = 0
+        self.running = False
+
+    def _next(self, value):
+        if not self.running:
+            try:
+                self.running = not self.predicate(value, self.i)
+            except Exception as exn:
+                self.observer.on_error(exn)
+                return
+            else:
+                self.i += 1
+
+        if self.running:
+            self.observer.on_next(value)
 
 
 @extensionmethod(Observable)
@@ -24,21 +50,18 @@ def skip_while(self, predicate):
     predicate = adapt_call(predicate)
     source = self
 
-    def subscribe(observer):
-        i, running = [0], [False]
+    if is_fusion_enabled():
+        def stage():
+            i, running = [0], [False]
 
-        def on_next(value):
-            if not running[0]:
-                try:
+            def step(value):
+                if not running[0]:
                     running[0] = not predicate(value, i[0])
-                except Exception as exn:
-                    observer.on_error(exn)
-                    return
-                else:
                     i[0] += 1
+                return value if running[0] else SKIP
+            return step, None, None
+        return FusedObservable(self, stage)
 
-            if running[0]:
-                observer.on_next(value)
-
-        return source.subscribe(on_next, observer.on_error, observer.on_completed)
+    def subscribe(observer):
+        return source._subscribe_internal(SkipWhileSink(observer, predicate))
     return AnonymousObservable(subscribe)
@@ -1,6 +1,22 @@
 from rx import Observable, AnonymousObservable
 from rx.internal import ArgumentOutOfRangeException
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+
+
+class TakeSink(Sink):
+    __slots__ = ("remaining",)
+
+    def __init__(self, observer, count):
+        super(TakeSink, self).__init__(observer)
+        self.remaining = count
+
+    def _next(self, value):
+        if self.remaining > 0:
+            self.remaining -= 1
+            self.observer.on_next(value)
+            if not self.remaining:
+                self.observer.on_completed()
 
 
 @extensionmethod(Observable)
@@ -29,14 +45,5 @@ def take(self, count, scheduler=None):
 
     observable = self
     def subscribe(observer):
-        remaining = [count]
-
-        def on_next(value):
-            if remaining[0] > 0:
-                remaining[0] -= 1
-                observer.on_next(value)
-                if not remaining[0]:
-                    observer.on_completed()
-
-        return observable.subscribe(on_next, observer.on_error, observer.on_completed)
+        return observable._subscribe_internal(TakeSink(observer, count))
     return AnonymousObservable(subscribe)
@@ -1,6 +1,38 @@
 from rx import Observable, AnonymousObservable
 from rx.internal.utils import adapt_call
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled, \
+    COMPLETE
+
+
+class TakeWhileSink(Sink):
+    __slots__ = ("predicate", "lock", "running", "i")
+
+    def __init__(self, observer, predicate, lock):
+        super(TakeWhileSink, self).__init__(observer)
+        self.predicate = predicate
+        self.lock = lock
+        self.running = True
+        self.i = 0
+
+    def _next(self, value):
+        with self.lock:
+            if not self.running:
+                return
+
+            try:
+                self.running = self.predicate(value, self.i)
+            except Exception as exn:
+                self.observer.on_error(exn)
+                return
+            else:
+                self.i += 1
+
+        if self.running:
+            self.observer.on_next(value)
+        else:
+            self.observer.on_completed()
 
 
 @extensionmethod(Observable)
@@ -24,27 +56,20 @@ def take_while(self, predicate):
 
     predicate = adapt_call(predicate)
     observable = self
-    def subscribe(observer):
-        running, i = [True], [0]
-
-        def on_next(value):
-            with self.lock:
-                if not running[0]:
-                    return
-
-                try:
-                    running[0] = predicate(value, i[0])
-                except Exception as exn:
-                    observer.on_error(exn)
-                    return
-                else:
-                    i[0] += 1
-
-            if running[0]:
-                observer.on_next(value)
-            else:
-                observer.on_completed()
 
-        return observable.subscribe(on_next, observer.on_error, observer.on_completed)
+    if is_fusion_enabled():
+        def stage():
+            i = [0]
+
+            def step(value):
+                running = predicate(value, i[0])
+                i[0] += 1
+                return value if running else COMPLETE
+            return step, None, None
+        return FusedObservable(self, stage)
+
+    def subscribe(observer):
+        return observable._subscribe_internal(
+            TakeWhileSink(observer, predicate, self.lock))
     return AnonymousObservable(subscribe)
 
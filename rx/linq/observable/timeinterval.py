@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from rx.observable import Observable
 from rx.concurrency import timeout_scheduler
 from rx.internal.utils import TimeInterval
@@ -23,13 +25,13 @@ def time_interval(self, scheduler):
     scheduler = scheduler or timeout_scheduler
 
     def defer():
-        last = [scheduler.now()]
+        last = [scheduler.monotonic()]
 
         def selector(x):
-            now = scheduler.now()
+            now = scheduler.monotonic()
             span = now - last[0]
             last[0] = now
-            return TimeInterval(value=x, interval=span)
+            return TimeInterval(value=x, interval=timedelta(seconds=span))
 
         return source.map(selector)
     return Observable.defer(defer)
@@ -23,7 +23,10 @@ def to_future(self, future_ctor=None):
 
     future_ctor = future_ctor or rx.config.get("Future")
     if not future_ctor:
-        raise Exception('Future type not provided nor in rx.config.Future')
+        try:
+            from asyncio import Future as future_ctor
+        except ImportError:
+            raise Exception('Future type not provided nor in rx.config.Future')
 
     source = self
 
@@ -1,6 +1,49 @@
 from rx import Observable, AnonymousObservable
 from rx.internal.utils import adapt_call
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
+from rx.linq.fusedobservable import FusedObservable, is_fusion_enabled, \
+    SKIP
+
+
+class WhereSink(Sink):
+    __slots__ = ("predicate", "count")
+
+    def __init__(self, observer, predicate):
+        super(WhereSink, self).__init__(observer)
+        self.predicate = predicate
+        self.count = 0
+
+    def _next(self, value):
+        try:
+            should_run = self.predicate(value, self.count)
+        except Exception as ex:
+            self.observer.on_error(ex)
+            return
+        else:
+            self.count += 1
+
+        if should_run:
+            self.observer.on_next(value)
+
+    def _on_next_batch(self, values):
+        predicate = self.predicate
+        results = []
+        index = self.count
+        try:
+            for value in values:
+                if predicate(value, index):
+                    results.append(value)
+                index += 1
+        except Exception as ex:
+            self.count = index
+            if results:
+                self.observer.on_next_batch(results)
+            self.observer.on_error(ex)
+        else:
+            self.count = index
+            if results:
+                self.observer.on_next_batch(results)
 
 
 @extensionmethod(Observable, alias="filter")
@@ -26,20 +69,17 @@ def where(self, predicate):
     predicate = adapt_call(predicate)
     parent = self
 
-    def subscribe(observer):
-        count = [0]
+    if is_fusion_enabled():
+        def stage():
+            count = [0]
 
-        def on_next(value):
-            try:
+            def step(value):
                 should_run = predicate(value, count[0])
-            except Exception as ex:
-                observer.on_error(ex)
-                return
-            else:
                 count[0] += 1
+                return value if should_run else SKIP
+            return step, None, None
+        return FusedObservable(self, stage)
 
-            if should_run:
-                observer.on_next(value)
-
-        return parent.subscribe(on_next, observer.on_error, observer.on_completed)
+    def subscribe(observer):
+        return parent._subscribe_internal(WhereSink(observer, predicate))
     return AnonymousObservable(subscribe)
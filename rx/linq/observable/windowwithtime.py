@@ -1,3 +1,4 @@
+from collections import deque
 from datetime import timedelta
 
 from rx import AnonymousObservable, Observable
@@ -7,91 +8,110 @@ from rx.disposables import SingleAssignmentDisposable, CompositeDisposable, \
     RefCountDisposable, SerialDisposable
 from rx.subjects import Subject
 from rx.internal import extensionmethod
+from rx.linq.sink import Sink
 
 
-@extensionmethod(Observable)
-def window_with_time(self, timespan, timeshift=None, scheduler=None):
-    source = self
+class WindowWithTimeSink(Sink):
+    """Keeps the open windows of a window_with_time subscription, and the
+    timer that opens and closes them"""
 
-    if timeshift is None:
-        timeshift = timespan
+    __slots__ = ("scheduler", "timeshift", "timer_d", "ref_count_disposable",
+                 "next_shift", "next_span", "total_time", "queue")
 
-    if not isinstance(timespan, timedelta):
-        timespan = timedelta(milliseconds=timespan)
-    if not isinstance(timeshift, timedelta):
-        timeshift = timedelta(milliseconds=timeshift)
+    def __init__(self, observer, scheduler, timespan, timeshift, timer_d,
+                 ref_count_disposable):
+        super(WindowWithTimeSink, self).__init__(observer)
+        self.scheduler = scheduler
+        self.timeshift = timeshift
+        self.timer_d = timer_d
+        self.ref_count_disposable = ref_count_disposable
+        self.next_shift = timeshift
+        self.next_span = timespan
+        self.total_time = timedelta(0)
+        self.queue = deque()
 
-    scheduler = scheduler or timeout_scheduler
+    def open_window(self):
+        s = Subject()
+        self.queue.append(s)
+        self.observer.on_next(add_ref(s, self.ref_count_disposable))
 
-    def subscribe(observer):
-        timer_d = SerialDisposable()
-        next_shift = [timeshift]
-        next_span = [timespan]
-        total_time = [timedelta(0)]
-        q = []
+    def create_timer(self):
+        m = SingleAssignmentDisposable()
+        self.timer_d.disposable = m
+        is_span = False
+        is_shift = False
 
-        group_disposable = CompositeDisposable(timer_d)
-        ref_count_disposable = RefCountDisposable(group_disposable)
+        if self.next_span == self.next_shift:
+            is_span = True
+            is_shift = True
+        elif self.next_span < self.next_shift:
+            is_span = True
+        else:
+            is_shift = True
 
-        def create_timer():
-            m = SingleAssignmentDisposable()
-            timer_d.disposable = m
-            is_span = False
-            is_shift = False
+        new_total_time = self.next_span if is_span else self.next_shift
 
-            if next_span[0] == next_shift[0]:
-                is_span = True
-                is_shift = True
-            elif next_span[0] < next_shift[0]:
-                is_span = True
-            else:
-                is_shift = True
+        ts = new_total_time - self.total_time
+        self.total_time = new_total_time
+        if is_span:
+            self.next_span += self.timeshift
 
-            new_total_time = next_span[0] if is_span else next_shift[0]
+        if is_shift:
+            self.next_shift += self.timeshift
 
-            ts = new_total_time - total_time[0]
-            total_time[0] = new_total_time
-            if is_span:
-                next_span[0] += timeshift
+        m.disposable = self.scheduler.schedule_relative(
+            ts, self._timer, (is_span, is_shift))
 
-            if is_shift:
-                next_shift[0] += timeshift
+    def _timer(self, scheduler, state):
+        is_span, is_shift = state
+        if is_shift:
+            self.open_window()
 
-            def action(scheduler, state=None):
-                s = None
+        if is_span:
+            self.queue.popleft().on_completed()
 
-                if is_shift:
-                    s = Subject()
-                    q.append(s)
-                    observer.on_next(add_ref(s, ref_count_disposable))
+        self.create_timer()
 
-                if is_span:
-                    s = q.pop(0)
-                    s.on_completed()
+    def _next(self, x):
+        for s in self.queue:
+            s.on_next(x)
 
-                create_timer()
-            m.disposable = scheduler.schedule_relative(ts, action)
+    def _on_error(self, e):
+        for s in self.queue:
+            s.on_error(e)
 
-        q.append(Subject())
-        observer.on_next(add_ref(q[0], ref_count_disposable))
-        create_timer()
+        self.observer.on_error(e)
 
-        def on_next(x):
-            for s in q:
-                s.on_next(x)
+    def _on_completed(self):
+        for s in self.queue:
+            s.on_completed()
 
-        def on_error(e):
-            for s in q:
-                s.on_error(e)
+        self.observer.on_completed()
 
-            observer.on_error(e)
 
-        def on_completed():
-            for s in q:
-                s.on_completed()
+@extensionmethod(Observable)
+def window_with_time(self, timespan, timeshift=None, scheduler=None):
+    source = self
+
+    if timeshift is None:
+        timeshift = timespan
 
-            observer.on_completed()
+    if not isinstance(timespan, timedelta):
+        timespan = timedelta(milliseconds=timespan)
+    if not isinstance(timeshift, timedelta):
+        timeshift = timedelta(milliseconds=timeshift)
+
+    scheduler = scheduler or timeout_scheduler
+
+    def subscribe(observer):
+        timer_d = SerialDisposable()
+        group_disposable = CompositeDisposable(timer_d)
+        ref_count_disposable = RefCountDisposable(group_disposable)
+        sink = WindowWithTimeSink(observer, scheduler, timespan, timeshift,
+                                  timer_d, ref_count_disposable)
+        sink.open_window()
+        sink.create_timer()
 
-        group_disposable.add(source.subscribe(on_next, on_error, on_completed))
+        group_disposable.add(source.subscribe(sink))
         return ref_count_disposable
     return AnonymousObservable(subscribe)
@@ -1,7 +1,67 @@
+from collections import deque
+
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
 from rx.internal import extensionmethod, extensionclassmethod
+from rx.linq.sink import Sink
+
+
+class ZipSink(object):
+    """Queued values of the sources of a zip subscription"""
+
+    __slots__ = ("observer", "result_selector", "queues", "queued_count",
+                 "is_done", "done_count")
+
+    def __init__(self, observer, result_selector, n):
+        self.observer = observer
+        self.result_selector = result_selector
+        self.queues = [deque() for _ in range(n)]
+        self.queued_count = 0  # Number of non-empty queues
+        self.is_done = [False] * n
+        self.done_count = 0
+
+    def next(self, i, value):
+        queues = self.queues
+        queue = queues[i]
+        if not queue:
+            self.queued_count += 1
+        queue.append(value)
+
+        if self.queued_count == len(queues):
+            try:
+                queued_values = [queue.popleft() for queue in queues]
+                self.queued_count = sum(1 for queue in queues if queue)
+                res = self.result_selector(*queued_values)
+            except Exception as ex:
+                self.observer.on_error(ex)
+                return
+
+            self.observer.on_next(res)
+        elif self.done_count - self.is_done[i] == len(queues) - 1:
+            self.observer.on_completed()
+
+    def done(self, i):
+        if not self.is_done[i]:
+            self.is_done[i] = True
+            self.done_count += 1
+        if self.done_count == len(self.is_done):
+            self.observer.on_completed()
+
+
+class ZipObserver(Sink):
+    __slots__ = ("sink", "index")
+
+    def __init__(self, sink, index):
+        super(ZipObserver, self).__init__(sink.observer)
+        self.sink = sink
+        self.index = index
+
+    def _next(self, value):
+        self.sink.next(self.index, value)
+
+    def _on_completed(self):
+        self.sink.done(self.index)
 
 
 @extensionmethod(Observable, instancemethod=True)
@@ -29,43 +89,13 @@ def zip(self, *args):
         return self.zip_array(*args)
 
     def subscribe(observer):
-        n = len(sources)
-        queues = [[] for _ in range(n)]
-        is_done = [False] * n
-
-        def next(i):
-            if all([len(q) for q in queues]):
-                try:
-                    queued_values = [x.pop(0) for x in queues]
-                    res = result_selector(*queued_values)
-                except Exception as ex:
-                    observer.on_error(ex)
-                    return
-
-                observer.on_next(res)
-            elif all([x for j, x in enumerate(is_done) if j != i]):
-                observer.on_completed()
-
-        def done(i):
-            is_done[i] = True
-            if all(is_done):
-                observer.on_completed()
-
-        subscriptions = [None]*n
-
-        def func(i):
-            source = sources[i]
-            sad = SingleAssignmentDisposable()
+        sink = ZipSink(observer, result_selector, len(sources))
+        subscriptions = []
+        for i, source in enumerate(sources):
+            subscription = SingleAssignmentDisposable()
+            subscriptions.append(subscription)
             source = Observable.from_future(source)
-
-            def on_next(x):
-                queues[i].append(x)
-                next(i)
-
-            sad.disposable = source.subscribe(on_next, observer.on_error, lambda: done(i))
-            subscriptions[i] = sad
-        for idx in range(n):
-            func(idx)
+            subscription.disposable = source.subscribe(ZipObserver(sink, i))
         return CompositeDisposable(subscriptions)
     return AnonymousObservable(subscribe)
 
@@ -0,0 +1,30 @@
+from rx.abstractobserver import AbstractObserver
+
+
+class Sink(AbstractObserver):
+    """Base class for the observer an operator subscribes to its source
+    with. The state of the operator for a subscription lives in the slots of
+    the sink, instead of in one element lists captured by closures that are
+    created on every subscribe.
+
+    Subclasses implement _next, and may implement _on_next_batch. Errors and
+    completion are forwarded to the downstream observer."""
+
+    # Like AutoDetachObserver, only on_next is kept per instance, so that
+    # dispose can replace it
+    __slots__ = ("is_stopped", "on_next", "observer")
+
+    def __init__(self, observer):
+        self.is_stopped = False
+        self.on_next = self._next
+
+        self.observer = observer
+
+    def _next(self, value):
+        self.observer.on_next(value)
+
+    def _on_error(self, error):
+        self.observer.on_error(error)
+
+    def _on_completed(self):
+        self.observer.on_completed()
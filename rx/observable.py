@@ -1,21 +1,17 @@
-import types
-
-from rx import Lock
+from rx.internal.lazylock import LazyLock
 from .observer import Observer, AbstractObserver
 
 
 class Observable(object):
     """Represents a push-style collection."""
 
-    _methods = []
+    __slots__ = ("_subscribe", "_lock")
+
+    lock = LazyLock()
 
     def __init__(self, subscribe):
         self._subscribe = subscribe
-        self.lock = Lock()
-
-        # Deferred method assignment
-        for name, method in self._methods:
-            setattr(self, name, types.MethodType(method, self))
+        self._lock = None
 
     def subscribe(self, on_next=None, on_error=None, on_completed=None,
                   observer=None):
@@ -49,3 +45,20 @@ class Observable(object):
             observer = Observer(on_next, on_error, on_completed)
 
         return self._subscribe(observer)
+
+    def _subscribe_internal(self, observer):
+        """Subscribes an observer created by an operator of the library.
+
+        Operators that subscribe to their source from within their own
+        subscription function use this instead of subscribe. Such a
+        subscription always runs on the trampoline set up by the outer
+        subscription, and the library observer keeps to the observer grammar
+        and is detached by the outer subscription, so observables may skip
+        their safety wrappers. User observers must use subscribe.
+
+        Keyword arguments:
+        observer -- Library observer to subscribe.
+
+        Returns {Disposable} the subscription."""
+
+        return self._subscribe(observer)
@@ -8,6 +8,10 @@ class ObserveOnObserver(ScheduledObserver):
         super(ObserveOnObserver, self)._next(value);
         self.ensure_active()
     
+    def _next_batch(self, values):
+        super(ObserveOnObserver, self)._next_batch(values)
+        self.ensure_active()
+
     def _error(self, e):
         super(ObserveOnObserver, self)._error(e)
         self.ensure_active()
@@ -6,6 +6,8 @@ from .anonymousobserver import AnonymousObserver
 class Observer(AbstractObserver):
     """Supports push-style iteration over an observable sequence."""
 
+    __slots__ = AbstractObserver.slots
+
     def to_notifier(self):
         """Creates a notification callback from an observer.
 
@@ -1,18 +1,40 @@
-from rx import Lock
-from rx.abstractobserver import AbstractObserver
+from collections import deque
+
+from rx import config
+from rx.abstractobserver import AbstractObserver, send_batch
 from rx.disposables import SerialDisposable
 
+class ReplayAction(object):
+    """Queued work that sends the values to the observer one per call,
+    without an action per value. Returns True while values remain."""
+
+    __slots__ = ("observer", "values", "index")
+
+    def __init__(self, observer, values):
+        self.observer = observer
+        self.values = values
+        self.index = 0
+
+    def __call__(self):
+        index = self.index
+        self.index = index + 1
+        self.observer.on_next(self.values[index])
+        return self.index < len(self.values)
+
+
 class ScheduledObserver(AbstractObserver):
     def __init__(self, scheduler, observer):
-        super(ScheduledObserver, self).__init__(self._next, self._error, self._completed)
+        super(ScheduledObserver, self).__init__(self._next, self._error,
+                                                self._completed,
+                                                self._next_batch)
 
         self.scheduler = scheduler
         self.observer = observer
 
-        self.lock = Lock()
+        self.lock = config["Lock"]()
         self.is_acquired = False
         self.has_faulted = False
-        self.queue = []
+        self.queue = deque()
         self.disposable = SerialDisposable()
 
         # Note to self: list append is thread safe
@@ -23,6 +45,19 @@ class ScheduledObserver(AbstractObserver):
             self.observer.on_next(value)
         self.queue.append(func)
 
+    def _next_batch(self, values):
+        def func():
+            send_batch(self.observer, values)
+        self.queue.append(func)
+
+    def replay(self, values):
+        """Queues the values to be sent one at a time, each in its own
+        scheduled step as if by on_next. The values are not copied, and must
+        not be modified until they have been sent."""
+
+        if not self.is_stopped and len(values):
+            self.queue.append(ReplayAction(self.observer, values))
+
     def _error(self, exception):
         def func():
             self.observer.on_error(exception)
@@ -49,19 +84,23 @@ class ScheduledObserver(AbstractObserver):
 
         with self.lock:
             if len(parent.queue):
-                work = parent.queue.pop(0)
+                work = parent.queue.popleft()
             else:
                 parent.is_acquired = False
                 return
 
         try:
-            work()
+            remaining = work()
         except Exception as ex:
             with self.lock:
-                parent.queue = []
+                parent.queue = deque()
                 parent.has_faulted = True
             raise ex
 
+        if remaining:
+            with self.lock:
+                parent.queue.appendleft(work)
+
         recurse()
 
     def dispose(self):
@@ -1,4 +1,6 @@
 from .subject import Subject
 from .behaviorsubject import BehaviorSubject
 from .replaysubject import ReplaySubject
-from .asyncsubject import AsyncSubject
\ No newline at end of file
+from .asyncsubject import AsyncSubject
+from .compactedreplaysubject import CompactedReplaySubject
+from .routingsubject import RoutingSubject
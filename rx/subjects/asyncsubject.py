@@ -1,10 +1,11 @@
-from rx import Lock
+from rx import config
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.disposables import Disposable
 from rx.abstractobserver import AbstractObserver
 
 from .innersubscription import InnerSubscription
+from .subjectobservers import SubjectObservers
 
 
 class AsyncSubject(Observable, AbstractObserver):
@@ -22,10 +23,10 @@ class AsyncSubject(Observable, AbstractObserver):
         self.is_stopped = False
         self.value = None
         self.has_value = False
-        self.observers = []
         self.exception = None
 
-        self.lock = Lock()
+        self.lock = config["Lock"]()
+        self.observers = SubjectObservers(self.lock)
 
     def check_disposed(self):
         if self.is_disposed:
@@ -35,8 +36,7 @@ class AsyncSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                self.observers.append(observer)
-                return InnerSubscription(self, observer)
+                return InnerSubscription(self, self.observers.add(observer))
 
             ex = self.exception
             hv = self.has_value
@@ -60,8 +60,7 @@ class AsyncSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
 
                 self.is_stopped = True
                 value = self.value
@@ -82,8 +81,7 @@ class AsyncSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
                 self.exception = exception
 
@@ -1,10 +1,11 @@
-from rx import Lock
+from rx import config
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.disposables import Disposable
 from rx.abstractobserver import AbstractObserver
 
 from .innersubscription import InnerSubscription
+from .subjectobservers import SubjectObservers
 
 
 class BehaviorSubject(Observable, AbstractObserver):
@@ -26,12 +27,12 @@ class BehaviorSubject(Observable, AbstractObserver):
         super(BehaviorSubject, self).__init__(self.__subscribe)
 
         self.value = value
-        self.observers = []
         self.is_disposed = False
         self.is_stopped = False
         self.exception = None
 
-        self.lock = Lock()
+        self.lock = config["Lock"]()
+        self.observers = SubjectObservers(self.lock)
 
     def check_disposed(self):
         if self.is_disposed:
@@ -43,9 +44,9 @@ class BehaviorSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                self.observers.append(observer)
+                key = self.observers.add(observer)
                 observer.on_next(self.value)
-                return InnerSubscription(self, observer)
+                return InnerSubscription(self, key)
             ex = self.exception
 
         if ex:
@@ -62,8 +63,7 @@ class BehaviorSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
 
         if os:
@@ -78,8 +78,7 @@ class BehaviorSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
                 self.exception = error
 
@@ -94,7 +93,7 @@ class BehaviorSubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
+                os = self.observers.current()
                 self.value = value
         if os:
             for o in os:
@@ -0,0 +1,27 @@
+from .replaysubject import ReplaySubject
+from .replaybuffer import CompactedReplayBuffer
+
+
+class CompactedReplaySubject(ReplaySubject):
+    """Represents an object that is both an observable sequence as well as an
+    observer. Each notification is broadcasted to all subscribed observers,
+    and future observers are replayed the latest value of each key, like a
+    log compacted topic. Replaying costs the number of keys instead of the
+    number of values seen.
+    """
+
+    def __init__(self, key_selector, max_keys=None, scheduler=None):
+        """Initializes a new instance of the CompactedReplaySubject class
+        with the specified key selector, maximum key count and scheduler.
+
+        Keyword arguments:
+        key_selector -- Function returning the key of a value. Exceptions it
+            raises propagate to the caller of on_next, and the value is
+            neither buffered nor sent.
+        max_keys -- [Optional] Maximum number of keys to keep. The least
+            recently updated key is evicted first.
+        scheduler -- [Optional] Scheduler the observers are invoked on.
+        """
+
+        super(CompactedReplaySubject, self).__init__(scheduler=scheduler)
+        self.buffer = CompactedReplayBuffer(key_selector, max_keys)
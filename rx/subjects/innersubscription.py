@@ -1,17 +1,19 @@
-from rx import Lock
+class InnerSubscription(object):
+    """Subscription of an observer to a subject. Disposing it removes the
+    observer from the subject."""
 
+    __slots__ = ("subject", "key")
 
-class InnerSubscription(object):
-    def __init__(self, subject, observer):
+    def __init__(self, subject, key):
         self.subject = subject
-        self.observer = observer
-
-        self.lock = Lock()
+        self.key = key
 
     def dispose(self):
-        with self.lock:
-            if not self.subject.is_disposed and self.observer:
-                if self.observer in self.subject.observers:
-                    self.subject.observers.remove(self.observer)
-                self.observer = None
+        subject = self.subject
+        if subject is None:
+            return
 
+        with subject.lock:
+            if not subject.is_disposed:
+                subject.observers.remove(self.key)
+        self.subject = None
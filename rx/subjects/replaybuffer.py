@@ -0,0 +1,142 @@
+from collections import OrderedDict
+
+
+class ReplayBuffer(object):
+    """The values a ReplaySubject replays, oldest first. Values and their
+    timestamps are kept in parallel lists behind a head index, so trimming
+    only moves the head. The trimmed prefix is deleted once it outgrows the
+    live values, which keeps trimming amortized O(1) per value. Timestamps
+    are only kept when there is a window.
+
+    Must be used under the lock of the subject."""
+
+    __slots__ = ("buffer_size", "window", "values", "times", "head",
+                 "_snapshot")
+
+    def __init__(self, buffer_size, window=None):
+        self.buffer_size = buffer_size
+        self.window = window
+        self.values = []
+        self.times = None if window is None else []
+        self.head = 0
+        self._snapshot = []
+
+    def __len__(self):
+        return len(self.values) - self.head
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def append(self, value, now=None):
+        """Appends the value, timestamped with now if there is a window, and
+        trims the buffer."""
+
+        self.values.append(value)
+        if self.times is not None:
+            self.times.append(now)
+        self._snapshot = None
+        self.trim(now)
+
+    def extend(self, values, now=None):
+        """Appends the values, all timestamped with now if there is a window,
+        and trims the buffer."""
+
+        self.values.extend(values)
+        times = self.times
+        if times is not None:
+            times.extend([now] * (len(self.values) - len(times)))
+        self._snapshot = None
+        self.trim(now)
+
+    def trim(self, now=None):
+        """Drops the values beyond the buffer size, and the values older than
+        the window at time now."""
+
+        values = self.values
+        head = max(self.head, len(values) - self.buffer_size)
+
+        times = self.times
+        if times is not None:
+            window = self.window
+            count = len(values)
+            while head < count and now - times[head] > window:
+                head += 1
+
+        if head == self.head:
+            return
+
+        if head * 2 >= len(values):
+            del values[:head]
+            if times is not None:
+                del times[:head]
+            head = 0
+
+        self.head = head
+        self._snapshot = None
+
+    def snapshot(self):
+        """Returns a list of the buffered values. The list is shared by all
+        callers until the buffer changes, and must not be modified."""
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self.values[self.head:]
+        return snapshot
+
+
+class CompactedReplayBuffer(object):
+    """The values a CompactedReplaySubject replays: the latest value per
+    key, least recently updated first. With max_keys, the least recently
+    updated key is evicted when a new key would exceed it.
+
+    Must be used under the lock of the subject."""
+
+    __slots__ = ("key_selector", "max_keys", "window", "items", "_snapshot")
+
+    def __init__(self, key_selector, max_keys=None):
+        self.key_selector = key_selector
+        self.max_keys = max_keys
+        self.window = None
+        self.items = OrderedDict()
+        self._snapshot = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def append(self, value, now=None):
+        """Replaces the value of the key of the value."""
+
+        self._put(self.key_selector(value), value)
+
+    def extend(self, values, now=None):
+        """Replaces the value of the key of each of the values. The keys are
+        selected before any value is stored."""
+
+        key_selector = self.key_selector
+        keys = [key_selector(value) for value in values]
+        for key, value in zip(keys, values):
+            self._put(key, value)
+
+    def _put(self, key, value):
+        items = self.items
+        if key in items:
+            del items[key]
+        elif self.max_keys is not None and len(items) >= self.max_keys:
+            items.popitem(last=False)
+        items[key] = value
+        self._snapshot = None
+
+    def trim(self, now=None):
+        pass
+
+    def snapshot(self):
+        """Returns a list of the latest values. The list is shared by all
+        callers until the buffer changes, and must not be modified."""
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = list(self.items.values())
+        return snapshot
@@ -1,23 +1,28 @@
 import sys
 from datetime import timedelta
 
-from rx import Lock
+from rx import config
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.abstractobserver import AbstractObserver
 from rx.concurrency import current_thread_scheduler
 from rx.scheduledobserver import ScheduledObserver
 
+from .innersubscription import InnerSubscription
+from .replaybuffer import ReplayBuffer
+from .subjectobservers import SubjectObservers
 
-class RemovableDisposable(object):
-    def __init__(self, subject, observer):
-        self.subject = subject
+
+class RemovableDisposable(InnerSubscription):
+    __slots__ = ("observer",)
+
+    def __init__(self, subject, key, observer):
+        super(RemovableDisposable, self).__init__(subject, key)
         self.observer = observer
 
     def dispose(self):
         self.observer.dispose()
-        if not self.subject.is_disposed and self.observer in self.subject.observers:
-            self.subject.observers.remove(self.observer)
+        super(RemovableDisposable, self).dispose()
 
 class ReplaySubject(Observable, AbstractObserver):
     """Represents an object that is both an observable sequence as well as an
@@ -38,14 +43,15 @@ class ReplaySubject(Observable, AbstractObserver):
         self.buffer_size = sys.maxsize if buffer_size is None else buffer_size
         self.scheduler = scheduler or current_thread_scheduler
         self.window = timedelta.max if window is None else self.scheduler.to_timedelta(window)
-        self.queue = []
-        self.observers = []
+        self.buffer = ReplayBuffer(self.buffer_size,
+                                   None if window is None else self.window)
         self.is_stopped = False
         self.is_disposed = False
         self.has_error = False
         self.error = None
 
-        self.lock = Lock()
+        self.lock = config["Lock"]()
+        self.observers = SubjectObservers(self.lock)
 
         super(ReplaySubject, self).__init__(self.__subscribe)
 
@@ -55,15 +61,12 @@ class ReplaySubject(Observable, AbstractObserver):
 
     def __subscribe(self, observer):
         so = ScheduledObserver(self.scheduler, observer)
-        subscription = RemovableDisposable(self, so)
 
         with self.lock:
             self.check_disposed()
-            self._trim(self.scheduler.now())
-            self.observers.append(so)
-
-            for item in self.queue:
-                so.on_next(item['value'])
+            self.buffer.trim(self._now())
+            subscription = RemovableDisposable(self, self.observers.add(so), so)
+            so.replay(self.buffer.snapshot())
 
             if self.has_error:
                 so.on_error(self.error)
@@ -73,12 +76,9 @@ class ReplaySubject(Observable, AbstractObserver):
         so.ensure_active()
         return subscription
 
-    def _trim(self, now):
-        while len(self.queue) > self.buffer_size:
-            self.queue.pop(0)
-
-        while len(self.queue) > 0 and (now - self.queue[0]['interval']) > self.window:
-            self.queue.pop(0)
+    def _now(self):
+        # Values are only timestamped when there is a window to trim by
+        return None if self.buffer.window is None else self.scheduler.now()
 
     def on_next(self, value):
         """Notifies all subscribed observers with the value."""
@@ -87,10 +87,8 @@ class ReplaySubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                now = self.scheduler.now()
-                self.queue.append(dict(interval=now, value=value))
-                self._trim(now)
+                os = self.observers.current()
+                self.buffer.append(value, self._now())
 
                 for observer in os:
                     observer.on_next(value)
@@ -98,6 +96,30 @@ class ReplaySubject(Observable, AbstractObserver):
             for observer in os:
                 observer.ensure_active()
 
+    def on_next_batch(self, values):
+        """Notifies all subscribed observers with the batch of values. The
+        buffer is trimmed, and each observer scheduled, once for the whole
+        batch."""
+
+        os = None
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                os = self.observers.current()
+                self.buffer.extend(values, self._now())
+
+                for observer in os:
+                    observer.on_next_batch(values)
+        if os:
+            for observer in os:
+                observer.ensure_active()
+
+    def on_next_many(self, values):
+        """Notifies all subscribed observers with each of the values, as a
+        single batch."""
+
+        self.on_next_batch(list(values))
+
     def on_error(self, error):
         """Notifies all subscribed observers with the exception."""
 
@@ -105,13 +127,11 @@ class ReplaySubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
                 self.error = error
                 self.has_error = True
-                now = self.scheduler.now()
-                self._trim(now)
+                self.buffer.trim(self._now())
 
                 for observer in os:
                     observer.on_error(error)
@@ -126,11 +146,9 @@ class ReplaySubject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
-                now = self.scheduler.now()
-                self._trim(now)
+                self.buffer.trim(self._now())
                 for observer in os:
                     observer.on_completed()
         if os:
@@ -144,4 +162,4 @@ class ReplaySubject(Observable, AbstractObserver):
         with self.lock:
             self.is_disposed = True
             self.observers = None
-            self.queue = []
+            self.buffer = None
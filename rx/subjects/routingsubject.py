@@ -0,0 +1,195 @@
+from rx.observer import Observer
+from rx.disposables import Disposable
+from rx.abstractobserver import AbstractObserver, send_batch
+
+from .subject import Subject, SINGLE_THREAD_ERROR
+from .subjectobservers import SubjectObservers
+
+
+class RouteSubscription(object):
+    """Subscription of an observer to a key of a routing subject. Disposing
+    it removes the observer, and the route once it has no observers left."""
+
+    __slots__ = ("subject", "route_key", "key")
+
+    def __init__(self, subject, route_key, key):
+        self.subject = subject
+        self.route_key = route_key
+        self.key = key
+
+    def dispose(self):
+        subject = self.subject
+        if subject is None:
+            return
+
+        with subject.lock:
+            if not subject.is_disposed:
+                route = subject.routes.get(self.route_key)
+                if route is not None:
+                    route.remove(self.key)
+                    if not len(route):
+                        del subject.routes[self.route_key]
+        self.subject = None
+
+
+class RoutingSubject(Subject):
+    """Represents a subject that routes each value to the observers of its
+    key. Observers subscribed with subscribe_key only receive the values of
+    their key, found with a single dict lookup per value. Observers
+    subscribed with subscribe receive all values. Termination is broadcasted
+    to all observers.
+    """
+
+    def __init__(self, key_selector):
+        """Initializes a new instance of the RoutingSubject class with the
+        specified key selector.
+
+        Keyword arguments:
+        key_selector -- Function returning the key of a value. Exceptions it
+            raises propagate to the caller of on_next, and the value is not
+            sent.
+        """
+
+        super(RoutingSubject, self).__init__()
+        self.key_selector = key_selector
+        self.routes = {}
+
+    def subscribe_key(self, key, on_next=None, on_error=None,
+                      on_completed=None, observer=None):
+        """Subscribes an observer to the values of the key.
+
+        1 - subject.subscribe_key(key, observer)
+        2 - subject.subscribe_key(key, on_next, on_error, on_completed)
+
+        Keyword arguments:
+        key -- Key of the values to receive.
+        on_next -- [Optional] Action to invoke for each value of the key.
+        on_error -- [Optional] Action to invoke upon exceptional termination
+            of the subject.
+        on_completed -- [Optional] Action to invoke upon graceful termination
+            of the subject.
+        observer -- [Optional] The object that is to receive notifications.
+
+        Returns {Disposable} the subscription of the observer."""
+
+        if isinstance(on_next, AbstractObserver):
+            observer = on_next
+        elif not observer:
+            observer = Observer(on_next, on_error, on_completed)
+
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                route = self.routes.get(key)
+                if route is None:
+                    route = self.routes[key] = SubjectObservers(self.lock)
+                return RouteSubscription(self, key, route.add(observer))
+
+            if self.exception:
+                observer.on_error(self.exception)
+                return Disposable.empty()
+
+            observer.on_completed()
+            return Disposable.empty()
+
+    def _clear(self):
+        # Removes all observers. Must be called under the lock
+        os = list(self.observers.clear())
+        for route in self.routes.values():
+            os.extend(route.clear())
+        self.routes = {}
+        return os
+
+    def on_completed(self):
+        """Notifies all subscribed observers of the end of the sequence."""
+
+        os = None
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                os = self._clear()
+                self.is_stopped = True
+
+        if os:
+            for observer in os:
+                observer.on_completed()
+
+    def on_error(self, exception):
+        """Notifies all subscribed observers with the exception.
+
+        Keyword arguments:
+        error -- The exception to send to all subscribed observers.
+        """
+
+        os = None
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                os = self._clear()
+                self.is_stopped = True
+                self.exception = exception
+
+        if os:
+            for observer in os:
+                observer.on_error(exception)
+
+    def on_next(self, value):
+        """Notifies the observers of the key of the value, and the observers
+        of all values, with the value.
+
+        Keyword arguments:
+        value -- The value to send to the subscribed observers.
+        """
+
+        assert self.is_lock_owner is None or self.is_lock_owner(), \
+            SINGLE_THREAD_ERROR
+        observers = self.observers
+        routes = self.routes
+        self.check_disposed()
+        if not self.is_stopped:
+            route = routes.get(self.key_selector(value)) if routes else None
+            if route is not None:
+                for observer in route.snapshot:
+                    observer.on_next(value)
+            for observer in observers.snapshot:
+                observer.on_next(value)
+
+    def on_next_batch(self, values):
+        """Notifies the observers of each key with the values of the key, and
+        the observers of all values with the batch of values. The keys are
+        selected before any value is sent.
+
+        Keyword arguments:
+        values -- List of values to send to the subscribed observers.
+        """
+
+        assert self.is_lock_owner is None or self.is_lock_owner(), \
+            SINGLE_THREAD_ERROR
+        observers = self.observers
+        routes = self.routes
+        self.check_disposed()
+        if not self.is_stopped:
+            if routes:
+                key_selector = self.key_selector
+                batches = {}
+                for value in values:
+                    key = key_selector(value)
+                    if key in routes:
+                        batches.setdefault(key, []).append(value)
+
+                for key, batch in batches.items():
+                    route = routes.get(key)
+                    if route is not None:
+                        for observer in route.snapshot:
+                            send_batch(observer, batch)
+
+            for observer in observers.snapshot:
+                send_batch(observer, values)
+
+    def dispose(self):
+        """Unsubscribe all observers and release resources."""
+
+        with self.lock:
+            self.is_disposed = True
+            self.observers = None
+            self.routes = None
@@ -1,11 +1,14 @@
-from rx import Lock
+from rx import config
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.disposables import Disposable
-from rx.abstractobserver import AbstractObserver
+from rx.abstractobserver import AbstractObserver, send_batch
 
 from .anonymoussubject import AnonymousSubject
 from .innersubscription import InnerSubscription
+from .subjectobservers import SubjectObservers
+
+SINGLE_THREAD_ERROR = "Single-threaded subject notified from more than one thread"
 
 
 class Subject(Observable, AbstractObserver):
@@ -18,10 +21,14 @@ class Subject(Observable, AbstractObserver):
 
         self.is_disposed = False
         self.is_stopped = False
-        self.observers = []
         self.exception = None
 
-        self.lock = Lock()
+        self.lock = config["Lock"]()
+        self.observers = SubjectObservers(self.lock)
+
+        # Notifications do not enter the lock, so with a single-threaded lock
+        # they assert its thread instead, see SingleThreadLock.is_owner
+        self.is_lock_owner = getattr(self.lock, "is_owner", None)
 
     def check_disposed(self):
         if self.is_disposed:
@@ -31,8 +38,7 @@ class Subject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                self.observers.append(observer)
-                return InnerSubscription(self, observer)
+                return InnerSubscription(self, self.observers.add(observer))
 
             if self.exception:
                 observer.on_error(self.exception)
@@ -48,8 +54,7 @@ class Subject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
 
         if os:
@@ -67,8 +72,7 @@ class Subject(Observable, AbstractObserver):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observers.clear()
                 self.is_stopped = True
                 self.exception = exception
 
@@ -83,16 +87,42 @@ class Subject(Observable, AbstractObserver):
         value -- The value to send to all subscribed observers.
         """
 
-        os = None
-        with self.lock:
-            self.check_disposed()
-            if not self.is_stopped:
-                os = self.observers[:]
-
-        if os:
-            for observer in os:
+        # The observers are read before checking for disposal, as dispose
+        # sets is_disposed before clearing them
+        assert self.is_lock_owner is None or self.is_lock_owner(), \
+            SINGLE_THREAD_ERROR
+        observers = self.observers
+        self.check_disposed()
+        if not self.is_stopped:
+            for observer in observers.snapshot:
                 observer.on_next(value)
 
+    def on_next_batch(self, values):
+        """Notifies all subscribed observers with the batch of values. The
+        observers are looked up once for the whole batch.
+
+        Keyword arguments:
+        values -- List of values to send to all subscribed observers.
+        """
+
+        assert self.is_lock_owner is None or self.is_lock_owner(), \
+            SINGLE_THREAD_ERROR
+        observers = self.observers
+        self.check_disposed()
+        if not self.is_stopped:
+            for observer in observers.snapshot:
+                send_batch(observer, values)
+
+    def on_next_many(self, values):
+        """Notifies all subscribed observers with each of the values, as a
+        single batch.
+
+        Keyword arguments:
+        values -- Iterable of values to send to all subscribed observers.
+        """
+
+        self.on_next_batch(list(values))
+
     def dispose(self):
         """Unsubscribe all observers and release resources."""
 
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from itertools import count
+
+
+class SubjectObservers(object):
+    """The observers of a subject, in subscription order. Observers are
+    added and removed in O(1) by key. They are notified through an immutable
+    snapshot, which is only rebuilt on the first notification after a
+    change, so that notifying copies nothing and takes no lock.
+
+    Changes must be made under the lock of the subject."""
+
+    __slots__ = ("lock", "items", "keys", "_snapshot")
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.items = OrderedDict()
+        self.keys = count()
+        self._snapshot = ()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.snapshot)
+
+    def __contains__(self, observer):
+        return observer in self.snapshot
+
+    @property
+    def snapshot(self):
+        """Tuple of the current observers. Must not be read under the lock,
+        see current."""
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self.lock:
+                snapshot = self.current()
+        return snapshot
+
+    def current(self):
+        """Returns the tuple of the current observers. Must be called under
+        the lock."""
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self.items.values())
+        return snapshot
+
+    def add(self, observer):
+        """Adds the observer. Returns the key to remove it with."""
+
+        key = next(self.keys)
+        self.items[key] = observer
+        self._snapshot = None
+        return key
+
+    def remove(self, key):
+        """Removes the observer added with key, if it is still there."""
+
+        if self.items.pop(key, None) is not None:
+            self._snapshot = None
+
+    def clear(self):
+        """Removes all observers. Returns the tuple of the removed
+        observers."""
+
+        snapshot = self.current()
+        self.items = OrderedDict()
+        self._snapshot = ()
+        return snapshot
@@ -28,12 +28,10 @@ class HotObservable(Observable):
                 return Disposable.empty()
             return action
 
-        for message in self.messages:
-            notification = message.value
-
-            # Warning: Don't make closures within a loop
-            action = get_action(notification)
-            scheduler.schedule_absolute(message.time, action)
+        # Warning: Don't make closures within a loop
+        scheduler.schedule_absolute_many([
+            (message.time, get_action(message.value))
+            for message in self.messages])
 
     def _subscribe(self, observer):
         log.debug("HotObservable:subscribe()")
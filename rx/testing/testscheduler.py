@@ -2,6 +2,7 @@ import logging
 
 from rx import Observable
 from rx.concurrency import VirtualTimeScheduler
+from rx.concurrency.scheduler import to_absolute_batch
 from rx.disposables import Disposable
 
 from .coldobservable import ColdObservable
@@ -38,11 +39,31 @@ class TestScheduler(VirtualTimeScheduler):
         :rtype: Disposable
         """
 
+        duetime = self._to_virtual(duetime)
+        return super(TestScheduler, self).schedule_absolute(duetime, action, state)
+
+    def schedule_absolute_many(self, pairs):
+        """Schedules a batch of actions to be executed at the specified
+        virtual times.
+
+        Keyword arguments:
+        :param list pairs: Iterable of (duetime, action) or
+            (duetime, action, state) tuples.
+
+        :returns: Disposable object used to cancel all the scheduled actions
+            (best effort).
+        :rtype: Disposable
+        """
+
+        pairs = [(self._to_virtual(duetime), action, state)
+                 for duetime, action, state in to_absolute_batch(pairs)]
+        return super(TestScheduler, self).schedule_absolute_many(pairs)
+
+    def _to_virtual(self, duetime):
         duetime = duetime if isinstance(duetime, int) else self.to_relative(duetime)
         if duetime <= self.clock:
             duetime = self.clock + 1
-
-        return super(TestScheduler, self).schedule_absolute(duetime, action, state)
+        return duetime
 
     @staticmethod
     def add(absolute, relative):
@@ -1,4 +1,5 @@
 import unittest
+import threading
 from datetime import datetime, timedelta
 
 from rx.concurrency import Scheduler, CurrentThreadScheduler
@@ -124,3 +125,108 @@ class TestCurrentThreadScheduler(unittest.TestCase):
         scheduler.ensure_trampoline(outer_action)
         assert ran1[0] == True
         assert ran2[0] == False
+
+    def test_currentthread_trampoline_per_thread(self):
+        scheduler = CurrentThreadScheduler()
+        required = [None]
+        ran = [False]
+
+        def other_thread():
+            def action(scheduler, state):
+                ran[0] = True
+
+            required[0] = scheduler.schedule_required()
+            scheduler.schedule(action)
+
+        def outer_action(scheduler, state):
+            assert not scheduler.schedule_required()
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join()
+
+            # Work scheduled from the other thread ran on its own trampoline
+            assert ran[0] == True
+
+        scheduler.schedule(outer_action)
+        assert required[0] == True
+        assert scheduler.schedule_required()
+
+    def test_currentthread_schedule_recursive_deep(self):
+        scheduler = CurrentThreadScheduler()
+        count = [0]
+
+        def action(recurse, state):
+            count[0] += 1
+            if state < 10000:
+                recurse(state + 1)
+
+        scheduler.schedule_recursive(action, 1)
+        assert count[0] == 10000
+
+    def test_currentthread_schedule_recursive_order(self):
+        scheduler = CurrentThreadScheduler()
+        log = []
+
+        def recursive(name):
+            def action(recurse, state):
+                log.append((name, state))
+                if state < 3:
+                    recurse(state + 1)
+            return action
+
+        def outer(scheduler, state):
+            scheduler.schedule_recursive(recursive("a"), 1)
+            scheduler.schedule_recursive(recursive("b"), 1)
+
+        scheduler.schedule(outer)
+        assert log == [("a", 1), ("b", 1), ("a", 2), ("b", 2), ("a", 3),
+                       ("b", 3)]
+
+    def test_currentthread_schedule_recursive_dispose(self):
+        scheduler = CurrentThreadScheduler()
+        count = [0]
+        d = [None]
+
+        def action(recurse, state):
+            count[0] += 1
+            if count[0] == 5:
+                d[0].dispose()
+            recurse()
+
+        def outer(scheduler, state):
+            d[0] = scheduler.schedule_recursive(action)
+
+        scheduler.schedule(outer)
+        assert count[0] == 5
+
+    def test_currentthread_schedule_many(self):
+        scheduler = CurrentThreadScheduler()
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+        def outer(scheduler, state):
+            scheduler.schedule_many([(action, 1), (action, 2)])
+            scheduler.schedule(action, 3)
+            scheduler.schedule_absolute_many([
+                (scheduler.now() - timedelta(milliseconds=10), action, 4)])
+
+        scheduler.schedule(outer)
+        assert(result == [1, 2, 3, 4])
+
+    def test_currentthread_schedule_order(self):
+        scheduler = CurrentThreadScheduler()
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+        def outer(scheduler, state):
+            scheduler.schedule_relative(timedelta(milliseconds=20), action, "late")
+            for i in range(10):
+                scheduler.schedule(action, i)
+            scheduler.schedule_many([(action, i) for i in range(10, 30)])
+
+        scheduler.schedule(outer)
+        assert(result == list(range(30)) + ["late"])
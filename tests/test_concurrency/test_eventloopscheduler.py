@@ -82,3 +82,87 @@ class TestEventLoopScheduler(unittest.TestCase):
 
         sleep(0.1)
         assert (not ran[0])
+
+    def test_event_loop_schedule_timed_ordered_no_timer_threads(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        gate = threading.Semaphore(0)
+        before = threading.active_count()
+        result = []
+        threads = set()
+
+        def action(scheduler, state):
+            threads.add(threading.current_thread().ident)
+            result.append(state)
+            if state == 99:
+                gate.release()
+
+        start = scheduler.now() + timedelta(milliseconds=100)
+        for i in reversed(range(100)):
+            scheduler.schedule_absolute(start + timedelta(milliseconds=i),
+                                        action, i)
+
+        assert(threading.active_count() < before + 10)
+        gate.acquire()
+        assert(result == list(range(100)))
+        assert(len(threads) == 1)
+
+    def test_event_loop_dispose(self):
+        scheduler = EventLoopScheduler()
+        ran = [False]
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        scheduler.schedule_relative(timedelta(milliseconds=50), action)
+        scheduler.dispose()
+
+        sleep(0.1)
+        assert (not ran[0])
+        assert (not scheduler.thread.is_alive())
+
+    def test_event_loop_schedule_many(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        result = []
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            result.append(state)
+            if state == 99:
+                gate.release()
+
+        scheduler.schedule_many([(action, i) for i in range(100)])
+        gate.acquire()
+        assert(result == list(range(100)))
+
+    def test_event_loop_schedule_absolute_many(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        result = []
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            result.append(state)
+            if len(result) == 3:
+                gate.release()
+
+        start = scheduler.now()
+        scheduler.schedule_absolute_many([
+            (start + timedelta(milliseconds=60), action, 2),
+            (start + timedelta(milliseconds=30), action, 1),
+            (start - timedelta(milliseconds=10), action, 0)])
+        gate.acquire()
+        assert(result == [0, 1, 2])
+
+    def test_event_loop_schedule_many_dispose(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        ran = [False]
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        start = scheduler.now() + timedelta(milliseconds=50)
+        d = scheduler.schedule_absolute_many([(start, action),
+                                              (start, action)])
+        d.dispose()
+
+        sleep(0.1)
+        assert(not ran[0])
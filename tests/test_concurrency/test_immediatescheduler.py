@@ -122,3 +122,15 @@ class TestImmediateScheduler(unittest.TestCase):
 
         assert xx[0] == 42
         assert yy[0] == 43
+
+    def test_immediate_schedule_recursive_deep(self):
+        scheduler = ImmediateScheduler()
+        count = [0]
+
+        def action(recurse, state):
+            count[0] += 1
+            if state < 10000:
+                recurse(state + 1)
+
+        scheduler.schedule_recursive(action, 1)
+        assert count[0] == 10000
@@ -74,3 +74,82 @@ class TestAsyncIOScheduler(unittest.TestCase):
             assert(not ran)
 
         loop.run_until_complete(go())
+
+    def test_asyncio_schedule_many(self):
+        loop = asyncio.get_event_loop()
+        scheduler = AsyncIOScheduler(loop)
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+        scheduler.schedule_many([(action, 1), (action, 2), action])
+
+        loop.run_until_complete(asyncio.sleep(0.1))
+        assert(result == [1, 2, None])
+
+    def test_asyncio_schedule_absolute_many(self):
+        loop = asyncio.get_event_loop()
+        scheduler = AsyncIOScheduler(loop)
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+        now = scheduler.now()
+        d = scheduler.schedule_absolute_many([
+            (now + timedelta(milliseconds=100), action, 3),
+            (now + timedelta(milliseconds=50), action, 2),
+            (now, action, 1)])
+
+        loop.run_until_complete(asyncio.sleep(0.07))
+        d.dispose()
+        loop.run_until_complete(asyncio.sleep(0.1))
+        assert(result == [1, 2])
+
+    def test_asyncio_schedule_many_action_throws(self):
+        loop = asyncio.get_event_loop()
+        scheduler = AsyncIOScheduler(loop)
+        result = []
+        errors = []
+
+        def action(scheduler, state):
+            if state is None:
+                raise Exception("ex")
+            result.append(state)
+
+        handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        try:
+            scheduler.schedule_many([(action, 1), action, (action, 2)])
+            loop.run_until_complete(asyncio.sleep(0.1))
+        finally:
+            loop.set_exception_handler(handler)
+
+        assert(result == [1, 2])
+        assert(len(errors) == 1)
+
+    def test_asyncio_schedule_absolute_many_action_throws(self):
+        loop = asyncio.get_event_loop()
+        scheduler = AsyncIOScheduler(loop)
+        result = []
+        errors = []
+
+        def action(scheduler, state):
+            if state is None:
+                raise Exception("ex")
+            result.append(state)
+
+        now = scheduler.now()
+        handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        try:
+            scheduler.schedule_absolute_many([
+                (now, action),
+                (now, action, 1),
+                (now + timedelta(milliseconds=50), action, 2)])
+            loop.run_until_complete(asyncio.sleep(0.1))
+        finally:
+            loop.set_exception_handler(handler)
+
+        assert(result == [1, 2])
+        assert(len(errors) == 1)
@@ -0,0 +1,146 @@
+import unittest
+import threading
+from time import sleep
+
+from rx.concurrency import CurrentThreadScheduler, EventLoopScheduler, \
+    TimeoutScheduler
+from rx.concurrency.schedulerstats import Histogram, SchedulerStats
+from rx.testing import TestScheduler
+
+
+class TestHistogram(unittest.TestCase):
+    def test_histogram_empty(self):
+        histogram = Histogram()
+        snapshot = histogram.snapshot()
+        assert(snapshot["count"] == 0)
+        assert(snapshot["mean"] == 0)
+        assert(snapshot["p99"] == 0)
+        assert(snapshot["buckets"] == [])
+
+    def test_histogram_buckets(self):
+        histogram = Histogram(0, 4)
+        for value in (0, 1, 2, 3, 4, 100):
+            histogram.record(value)
+
+        snapshot = histogram.snapshot()
+        assert(snapshot["count"] == 6)
+        assert(snapshot["max"] == 100)
+        assert(snapshot["buckets"] == [(1, 2), (2, 1), (4, 2), (16, 1)])
+        assert(histogram.percentile(50) == 2)
+        assert(histogram.percentile(100) == 16)
+
+    def test_histogram_percentile_max(self):
+        histogram = Histogram()
+        histogram.record(0.003)
+        assert(histogram.percentile(50) == 0.003)
+
+
+class TestSchedulerStats(unittest.TestCase):
+    def test_stats_disabled(self):
+        scheduler = TestScheduler()
+        assert(scheduler.stats is None)
+
+        stats = scheduler.enable_stats()
+        assert(isinstance(stats, SchedulerStats))
+        assert(scheduler.enable_stats() is stats)
+
+        scheduler.disable_stats()
+        assert(scheduler.stats is None)
+
+    def test_stats_virtual_time(self):
+        scheduler = TestScheduler()
+        stats = scheduler.enable_stats()
+
+        def action(scheduler, state):
+            pass
+
+        scheduler.schedule_absolute(100, action)
+        scheduler.schedule_absolute(200, action)
+        scheduler.schedule_absolute(200, action)
+        scheduler.advance_to(300)
+
+        snapshot = stats.snapshot()
+        assert(snapshot["run_time"]["count"] == 3)
+        assert(snapshot["lag"]["max"] == 0)
+        assert(snapshot["queue_depth"]["max"] == 2)
+        assert(snapshot["errors"] == 0)
+
+    def test_stats_errors(self):
+        scheduler = TestScheduler()
+        stats = scheduler.enable_stats()
+
+        def action(scheduler, state):
+            raise Exception("ex")
+
+        scheduler.schedule_absolute(100, action)
+        self.assertRaises(Exception, scheduler.advance_to, 300)
+
+        snapshot = stats.snapshot()
+        assert(snapshot["errors"] == 1)
+        assert(snapshot["run_time"]["count"] == 1)
+
+    def test_stats_current_thread(self):
+        scheduler = CurrentThreadScheduler()
+        stats = scheduler.enable_stats()
+
+        def action(scheduler, state):
+            sleep(0.01)
+
+        def outer(scheduler, state):
+            scheduler.schedule(action)
+            scheduler.schedule(action)
+
+        scheduler.schedule(outer)
+
+        snapshot = stats.snapshot()
+        assert(snapshot["run_time"]["count"] == 3)
+        assert(snapshot["run_time"]["max"] >= 0.01)
+        # The second action waits for the first one
+        assert(snapshot["lag"]["max"] >= 0.01)
+        assert(snapshot["queue_depth"]["max"] == 1)
+
+    def test_stats_event_loop(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        stats = scheduler.enable_stats()
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            if state == 9:
+                gate.release()
+
+        scheduler.schedule_many([(action, i) for i in range(10)])
+        gate.acquire()
+        sleep(0.01)
+
+        snapshot = stats.snapshot()
+        assert(snapshot["run_time"]["count"] == 10)
+        assert(snapshot["queue_depth"]["max"] == 9)
+
+    def test_stats_timeout(self):
+        scheduler = TimeoutScheduler()
+        stats = scheduler.enable_stats()
+
+        def action(scheduler, state):
+            pass
+
+        scheduler.schedule_relative(20, action)
+        sleep(0.05)
+
+        snapshot = stats.snapshot()
+        assert(snapshot["run_time"]["count"] == 1)
+        assert(snapshot["lag"]["max"] < 0.03)
+
+    def test_stats_to_observable(self):
+        scheduler = TestScheduler()
+        stats = scheduler.enable_stats()
+
+        def create():
+            return stats.to_observable(100, scheduler)
+
+        results = scheduler.start(create, disposed=450)
+        counts = [message.value.value["run_time"]["count"]
+                  for message in results.messages]
+
+        # Each snapshot counts the runs before the tick that produced it
+        assert(len(counts) == 2)
+        assert(counts[0] < counts[1])
@@ -0,0 +1,169 @@
+import unittest
+
+from datetime import datetime, timedelta
+from time import sleep
+import threading
+
+from rx import Observable
+from rx.concurrency import ThreadPoolScheduler
+
+
+class TestThreadPoolScheduler(unittest.TestCase):
+    def test_thread_pool_now(self):
+        scheduler = ThreadPoolScheduler()
+        res = scheduler.now() - datetime.utcnow()
+        assert res < timedelta(microseconds=1000)
+
+    def test_thread_pool_schedule_action(self):
+        scheduler = ThreadPoolScheduler()
+        ran = [False]
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        scheduler.schedule(action)
+
+        sleep(0.1)
+        assert (ran[0] == True)
+
+    def test_thread_pool_schedule_action_due(self):
+        scheduler = ThreadPoolScheduler()
+        starttime = datetime.utcnow()
+        endtime = [None]
+
+        def action(scheduler, state):
+            endtime[0] = datetime.utcnow()
+
+        scheduler.schedule_relative(timedelta(milliseconds=200), action)
+
+        sleep(0.3)
+        diff = endtime[0]-starttime
+        assert(diff > timedelta(milliseconds=180))
+
+    def test_thread_pool_schedule_action_cancel(self):
+        ran = [False]
+        scheduler = ThreadPoolScheduler()
+
+        def action(scheduler, state):
+            ran[0] = True
+        d = scheduler.schedule_relative(timedelta(milliseconds=1), action)
+        d.dispose()
+
+        sleep(0.1)
+        assert (not ran[0])
+
+    def test_thread_pool_max_workers(self):
+        scheduler = ThreadPoolScheduler(2)
+        gate = threading.Event()
+        threads = set()
+        count = [0]
+        lock = threading.Lock()
+
+        def action(scheduler, state):
+            gate.wait()
+            with lock:
+                threads.add(threading.current_thread().ident)
+                count[0] += 1
+
+        for _ in range(10):
+            scheduler.schedule(action)
+
+        sleep(0.1)
+        assert(scheduler.workers == 2)
+        assert(scheduler.queue_depth == 8)
+
+        gate.set()
+        sleep(0.1)
+        assert(count[0] == 10)
+        assert(len(threads) == 2)
+        assert(scheduler.queue_depth == 0)
+
+    def test_thread_pool_subscribe_on(self):
+        scheduler = ThreadPoolScheduler(1)
+        result = []
+        done = threading.Event()
+
+        Observable.from_iterable([1, 2, 3]).subscribe_on(scheduler).subscribe(
+            result.append, on_completed=done.set)
+
+        done.wait(1)
+        assert(result == [1, 2, 3])
+
+    def test_thread_pool_observe_on(self):
+        scheduler = ThreadPoolScheduler(1)
+        result = []
+        threads = set()
+        done = threading.Event()
+
+        def on_next(x):
+            threads.add(threading.current_thread().ident)
+            result.append(x)
+
+        Observable.from_iterable([1, 2, 3]).observe_on(scheduler).subscribe(
+            on_next, on_completed=done.set)
+
+        done.wait(1)
+        assert(result == [1, 2, 3])
+        assert(threading.current_thread().ident not in threads)
+
+    def test_thread_pool_to_async(self):
+        scheduler = ThreadPoolScheduler(2)
+        result = []
+        done = threading.Event()
+
+        def add(a, b):
+            return (a + b, threading.current_thread().ident)
+
+        Observable.to_async(add, scheduler)(1, 2).subscribe(
+            result.append, on_completed=done.set)
+
+        done.wait(1)
+        assert(result[0][0] == 3)
+        assert(result[0][1] != threading.current_thread().ident)
+
+    def test_thread_pool_start(self):
+        scheduler = ThreadPoolScheduler(2)
+        result = []
+        done = threading.Event()
+
+        def func():
+            return threading.current_thread().ident
+
+        Observable.start(func, scheduler).subscribe(result.append,
+                                                    on_completed=done.set)
+
+        done.wait(1)
+        assert(len(result) == 1)
+        assert(result[0] != threading.current_thread().ident)
+
+    def test_thread_pool_idle_workers(self):
+        scheduler = ThreadPoolScheduler(4)
+        done = threading.Event()
+        scheduler.schedule(lambda scheduler, state: done.set())
+        done.wait(1)
+        sleep(0.05)
+        assert(scheduler.workers == 1)
+        assert(scheduler.idle == 1)
+
+        # The idle worker is notified for the first action, and workers are
+        # spawned for the actions it cannot take yet
+        gate = threading.Event()
+        count = [0]
+        lock = threading.Lock()
+
+        def action(scheduler, state):
+            gate.wait()
+            with lock:
+                count[0] += 1
+
+        for _ in range(3):
+            scheduler.schedule(action)
+
+        sleep(0.1)
+        assert(scheduler.workers == 3)
+        assert(scheduler.idle == 0)
+
+        gate.set()
+        sleep(0.1)
+        assert(count[0] == 3)
+        assert(scheduler.idle == 3)
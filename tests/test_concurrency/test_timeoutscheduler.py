@@ -2,7 +2,9 @@ import unittest
 
 from datetime import datetime, timedelta
 from time import sleep
+import threading
 from rx.concurrency import TimeoutScheduler
+from rx.internal import ArgumentOutOfRangeException
 
 class TestTimeoutScheduler(unittest.TestCase):
     def test_timeout_now(self):
@@ -47,3 +49,207 @@ class TestTimeoutScheduler(unittest.TestCase):
     
         sleep(0.1)
         assert (not ran)
+
+    def test_timeout_schedule_action_ordered(self):
+        scheduler = TimeoutScheduler()
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+        scheduler.schedule_relative(timedelta(milliseconds=60), action, 3)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action, 1)
+        scheduler.schedule_relative(timedelta(milliseconds=40), action, 2)
+
+        sleep(0.2)
+        assert(result == [1, 2, 3])
+
+    def test_timeout_schedule_many_single_thread(self):
+        scheduler = TimeoutScheduler()
+        threads = set()
+        count = [0]
+        before = threading.active_count()
+
+        def action(scheduler, state):
+            threads.add(threading.current_thread().ident)
+            count[0] += 1
+
+        for i in range(1000):
+            scheduler.schedule_relative(timedelta(milliseconds=50), action)
+
+        assert(threading.active_count() < before + 10)
+        sleep(0.3)
+        assert(count[0] == 1000)
+        assert(len(threads) == 1)
+
+    def test_timeout_schedule_cancel_many(self):
+        scheduler = TimeoutScheduler()
+        ran = [0]
+
+        def action(scheduler, state):
+            ran[0] += 1
+
+        disposables = [scheduler.schedule_relative(timedelta(milliseconds=50),
+                                                   action)
+                       for _ in range(100)]
+        for d in disposables[1:]:
+            d.dispose()
+
+        sleep(0.2)
+        assert(ran[0] == 1)
+        assert(not scheduler.timers)
+
+    def test_timeout_schedule_slack(self):
+        scheduler = TimeoutScheduler(slack=100)
+        starttime = scheduler.monotonic()
+        endtime = [None, None]
+
+        def action(scheduler, state):
+            endtime[state] = scheduler.monotonic()
+
+        scheduler.schedule_relative(timedelta(milliseconds=50), action, 0)
+        scheduler.schedule_relative(timedelta(milliseconds=120), action, 1)
+
+        sleep(0.4)
+        assert(endtime[0] - starttime >= 0.05)
+        assert(endtime[1] - starttime >= 0.12)
+        assert(endtime[1] - endtime[0] < 0.03)
+
+    def test_timeout_schedule_slack_never_early(self):
+        scheduler = TimeoutScheduler(slack=50)
+        early = []
+
+        def action(scheduler, duetime):
+            if scheduler.monotonic() < duetime:
+                early.append(duetime)
+
+        for ms in (10, 20, 35, 60, 61, 90, 140):
+            scheduler.schedule_relative(timedelta(milliseconds=ms), action,
+                                        scheduler.monotonic() + ms / 1000.0)
+
+        sleep(0.4)
+        assert(not early)
+        assert(not scheduler.timers)
+
+    def test_timeout_monotonic(self):
+        scheduler = TimeoutScheduler()
+        start = scheduler.monotonic()
+        sleep(0.05)
+        diff = scheduler.monotonic() - start
+        assert(0.04 < diff < 1)
+
+    def test_timeout_to_seconds(self):
+        assert(TimeoutScheduler.to_seconds(1500) == 1.5)
+        assert(TimeoutScheduler.to_seconds(1.5) == 1.5)
+        assert(TimeoutScheduler.to_seconds(timedelta(milliseconds=1500)) == 1.5)
+        assert(TimeoutScheduler.to_seconds(datetime.fromtimestamp(1.5)) == 1.5)
+
+    def test_timeout_schedule_periodic_no_drift(self):
+        scheduler = TimeoutScheduler()
+        start = scheduler.monotonic()
+        times = []
+
+        def action(state):
+            times.append(scheduler.monotonic())
+            sleep(0.01)
+
+        # A tick drifting by the 10ms of each action would only run four
+        # times before 275ms
+        d = scheduler.schedule_periodic(50, action)
+        sleep(0.275)
+        d.dispose()
+
+        assert(len(times) == 5)
+        assert(times[0] - start > 0.045)
+
+    def test_timeout_schedule_periodic_state(self):
+        scheduler = TimeoutScheduler()
+        states = []
+
+        def action(state):
+            states.append(state)
+            return state + 1
+
+        d = scheduler.schedule_periodic(20, action, 0)
+        sleep(0.11)
+        d.dispose()
+        assert(states[:3] == [0, 1, 2])
+
+    def test_timeout_schedule_periodic_catch_up(self):
+        def run(catch_up):
+            scheduler = TimeoutScheduler()
+            times = []
+
+            def action(state):
+                times.append(scheduler.monotonic())
+                if len(times) == 1:
+                    sleep(0.13)
+
+            d = scheduler.schedule_periodic(50, action, catch_up=catch_up)
+            sleep(0.32)
+            d.dispose()
+            return times
+
+        # First tick at 50ms overruns until 180ms, missing the 100 and 150ms
+        # deadlines
+        times = run("burst")
+        assert(len(times) == 6)
+        assert(times[2] - times[1] < 0.02)
+
+        times = run("coalesce")
+        assert(len(times) == 5)
+        assert(times[2] - times[1] > 0.01)
+
+        times = run("skip")
+        assert(len(times) == 4)
+        assert(times[1] - times[0] > 0.14)
+
+    def test_timeout_schedule_periodic_invalid_catch_up(self):
+        scheduler = TimeoutScheduler()
+        try:
+            scheduler.schedule_periodic(50, lambda state: None,
+                                        catch_up="later")
+        except ArgumentOutOfRangeException:
+            pass
+        else:
+            assert(False)
+
+    def test_timeout_schedule_periodic_shared(self):
+        scheduler = TimeoutScheduler()
+        ticks = [0, 0]
+
+        def action(state):
+            ticks[state] += 1
+
+        d1 = scheduler.schedule_periodic(30, action, 0, shared=True)
+        d2 = scheduler.schedule_periodic(30, action, 1, shared=True)
+        tickers = scheduler._shared_periodic
+        assert(len(tickers) == 1)
+        ticker = list(tickers.values())[0]
+
+        sleep(0.105)
+        d1.dispose()
+        sleep(0.06)
+        d2.dispose()
+
+        assert(ticks[0] == 3)
+        assert(ticks[1] == 5)
+        assert(ticker._subscription is None)
+        assert(not tickers)
+
+    def test_timeout_schedule_periodic_shared_retired(self):
+        scheduler = TimeoutScheduler()
+        ticks = []
+
+        d1 = scheduler.schedule_periodic(30, ticks.append, 0, shared=True)
+        ticker = scheduler._shared_periodic[(0.03, "coalesce")]
+        d1.dispose()
+        assert(ticker.is_retired)
+        assert(not scheduler._shared_periodic)
+
+        d2 = scheduler.schedule_periodic(30, ticks.append, 1, shared=True)
+        assert(scheduler._shared_periodic[(0.03, "coalesce")] is not ticker)
+        sleep(0.05)
+        d2.dispose()
+        assert(ticks == [1])
+        assert(not scheduler._shared_periodic)
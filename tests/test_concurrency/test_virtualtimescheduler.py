@@ -1,6 +1,7 @@
 import unittest
 from datetime import datetime, timedelta
 from rx.concurrency import VirtualTimeScheduler
+from rx.testing import TestScheduler
 
 class VirtualSchedulerTestScheduler(VirtualTimeScheduler):
     def __init__(self):
@@ -60,3 +61,39 @@ class TestVirtualTimeScheduler(unittest.TestCase):
             assert(False)
         except Exception as e:
             self.assertEqual(str(e), ex)
+
+    def test_virtual_schedule_many(self):
+        result = []
+        scheduler = VirtualSchedulerTestScheduler()
+
+        def action(scheduler, state):
+            result.append(state)
+
+        scheduler.schedule_many([(action, 1), (action, 2), action])
+        scheduler.start()
+        assert(result == [1, 2, None])
+
+    def test_virtual_schedule_absolute_many(self):
+        result = []
+        scheduler = TestScheduler()
+
+        def action(scheduler, state):
+            result.append((scheduler.clock, state))
+
+        scheduler.schedule_absolute_many([(300, action, 3), (200, action, 1),
+                                          (200, action, 2), (100, action)])
+        scheduler.start()
+        assert(result == [(100, None), (200, 1), (200, 2), (300, 3)])
+
+    def test_virtual_schedule_absolute_many_dispose(self):
+        result = []
+        scheduler = TestScheduler()
+
+        def action(scheduler, state):
+            result.append(state)
+
+        d = scheduler.schedule_absolute_many([(200, action, 2),
+                                              (100, action, 1)])
+        scheduler.schedule_absolute(150, lambda sc, st: d.dispose())
+        scheduler.start()
+        assert(result == [1])
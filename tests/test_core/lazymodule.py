@@ -0,0 +1,8 @@
+from rx.internal import extensionmethod
+
+from .test_lazyextensions import A
+
+
+@extensionmethod(A)
+def lazy_a(self):
+    return "lazy"
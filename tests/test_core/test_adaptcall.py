@@ -0,0 +1,75 @@
+import sys
+import unittest
+from functools import partial
+
+from rx.internal.utils import adapt_call, parameters
+
+
+def one(x):
+    return ("one", x)
+
+
+def two(x, i):
+    return ("two", x, i)
+
+
+def three(a, b, c=None):
+    return (a, b, c)
+
+
+def variable(*args):
+    return args
+
+
+class Callable(object):
+    def __call__(self, x):
+        return ("call", x)
+
+    def method(self, x):
+        return ("method", x)
+
+    def method_index(self, x, i):
+        return ("method", x, i)
+
+
+class TestAdaptCall(unittest.TestCase):
+    def test_adapt_call_one(self):
+        assert(adapt_call(one)(1, 2) == ("one", 1))
+        assert(adapt_call(lambda x: x)(1, 2) == 1)
+
+    def test_adapt_call_unwrapped(self):
+        assert(adapt_call(two) is two)
+        assert(adapt_call(variable) is variable)
+
+    def test_adapt_call_bound_method(self):
+        obj = Callable()
+        assert(adapt_call(obj.method)(1, 2) == ("method", 1))
+        assert(adapt_call(obj.method_index)(1, 2) == ("method", 1, 2))
+
+    def test_adapt_call_callable_object(self):
+        assert(adapt_call(Callable())(1, 2) == ("call", 1))
+
+    def test_adapt_call_partial(self):
+        assert(adapt_call(partial(three, 0))(1, 2) == (0, 1, 2))
+        assert(adapt_call(partial(three, b=0))(1, 2) == (1, 0, None))
+        assert(adapt_call(partial(two, 0))(1, 2) == ("two", 0, 1))
+
+    def test_adapt_call_builtin(self):
+        assert(adapt_call(str)(1, 2) == "1")
+        assert(adapt_call(abs)(-1, 2) == 1)
+        results = []
+        adapt_call(results.append)(1, 2)
+        assert(results == [1])
+
+    def test_adapt_call_keyword_only(self):
+        if sys.version_info[0] < 3:
+            return
+
+        namespace = {}
+        exec("def func(x, *, y=1): return (x, y)", namespace)
+        assert(adapt_call(namespace["func"])(1, 2) == (1, 1))
+
+    def test_parameters_cached(self):
+        assert(parameters(three) == (("a", "b", "c"), False))
+        assert(parameters(three) is parameters(three))
+        assert(parameters(variable) == ((), True))
@@ -0,0 +1,78 @@
+import unittest
+
+from rx import Observable, Observer
+from rx.anonymousobservable import AnonymousObservable
+from rx.subjects import Subject
+
+
+class RxException(Exception):
+    pass
+
+
+# Helper function for raising exceptions within lambdas
+def _raise(ex):
+    raise RxException(ex)
+
+
+def noop(*args):
+    pass
+
+
+class TestAnonymousObservable(unittest.TestCase):
+    def test_subscribe_internal_no_auto_detach(self):
+        observers = []
+
+        def subscribe(observer):
+            observers.append(observer)
+
+        xs = AnonymousObservable(subscribe)
+        observer = Observer(noop)
+        xs.subscribe(noop)
+        xs._subscribe_internal(observer)
+        assert(observers[0] is not observer)
+        assert(observers[1] is observer)
+
+    def test_subscribe_internal_fixes_disposable(self):
+        disposed = []
+        xs = AnonymousObservable(lambda observer: lambda: disposed.append(1))
+        xs._subscribe_internal(Observer(noop)).dispose()
+        assert(disposed == [1])
+
+    def test_operator_dispose(self):
+        subject = Subject()
+        results = []
+        d = subject.select(lambda x: x * 2).where(lambda x: x > 2) \
+            .subscribe(results.append)
+        subject.on_next(1)
+        subject.on_next(2)
+        d.dispose()
+        subject.on_next(3)
+        assert(results == [4])
+        assert(not subject.observers)
+
+    def test_operator_completed_detaches(self):
+        subject = Subject()
+        results = []
+        subject.select(lambda x: x).take(2).subscribe(results.append)
+        subject.on_next(1)
+        subject.on_next(2)
+        assert(results == [1, 2])
+        assert(not subject.observers)
+
+    def test_operator_cancels_infinite_source(self):
+        results = []
+        Observable.repeat(1).select(lambda x: x + 1).take(3) \
+            .subscribe(results.append)
+        assert(results == [2, 2, 2])
+
+    def test_operator_subscribe_error(self):
+        errors = []
+        Observable.create(lambda observer: _raise("ex")) \
+            .select(lambda x: x).where(lambda x: True) \
+            .subscribe(noop, errors.append)
+        assert(len(errors) == 1)
+        assert(str(errors[0]) == "ex")
+
+    def test_operator_observer_throws(self):
+        xs = Observable.return_value(1).select(lambda x: x).skip(0)
+        self.assertRaises(RxException, xs.subscribe, lambda x: _raise("ex"))
@@ -0,0 +1,109 @@
+import unittest
+
+from rx.boundedobserver import BoundedObserver, DROP_OLDEST, DROP_NEWEST, \
+    LATEST, ERROR
+from rx.internal import ArgumentOutOfRangeException
+from rx.internal.exceptions import QueueOverflowException
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+
+class RecordingObserver(object):
+    def __init__(self):
+        self.messages = []
+
+    def on_next(self, value):
+        self.messages.append(("next", value))
+
+    def on_error(self, error):
+        self.messages.append(("error", type(error)))
+
+    def on_completed(self):
+        self.messages.append(("completed",))
+
+
+class TestBoundedObserver(unittest.TestCase):
+    def run_policy(self, overflow):
+        scheduler = TestScheduler()
+        subject = Subject()
+        observer = RecordingObserver()
+        bounded = BoundedObserver(scheduler, observer, 3, overflow)
+        bounded.subscription.disposable = subject.subscribe(bounded)
+
+        for value in range(5):
+            subject.on_next(value)
+        depth = bounded.depth
+        subject.on_completed()
+        scheduler.start()
+        return depth, bounded.dropped, observer.messages
+
+    def test_drop_oldest(self):
+        depth, dropped, messages = self.run_policy(DROP_OLDEST)
+        assert(depth == 3)
+        assert(dropped == 2)
+        assert(messages == [("next", 2), ("next", 3), ("next", 4),
+                            ("completed",)])
+
+    def test_drop_newest(self):
+        depth, dropped, messages = self.run_policy(DROP_NEWEST)
+        assert(dropped == 2)
+        assert(messages == [("next", 0), ("next", 1), ("next", 2),
+                            ("completed",)])
+
+    def test_latest(self):
+        depth, dropped, messages = self.run_policy(LATEST)
+        assert(dropped == 2)
+        assert(messages == [("next", 0), ("next", 1), ("next", 4),
+                            ("completed",)])
+
+    def test_error(self):
+        depth, dropped, messages = self.run_policy(ERROR)
+        assert(depth == 0)
+        assert(dropped == 4)
+        assert(messages == [("error", QueueOverflowException)])
+
+    def test_error_unsubscribes(self):
+        scheduler = TestScheduler()
+        subject = Subject()
+        bounded = BoundedObserver(scheduler, RecordingObserver(), 1, ERROR)
+        bounded.subscription.disposable = subject.subscribe(bounded)
+        subject.on_next(1)
+        subject.on_next(2)
+        assert(len(subject.observers) == 0)
+
+    def test_drains_in_order(self):
+        scheduler = TestScheduler()
+        subject = Subject()
+        observer = RecordingObserver()
+        bounded = BoundedObserver(scheduler, observer, 10)
+        bounded.subscription.disposable = subject.subscribe(bounded)
+
+        def action(scheduler, state):
+            subject.on_next_batch([1, 2])
+        scheduler.schedule_absolute(100, action)
+        scheduler.start()
+        subject.on_next(3)
+        scheduler.start()
+        assert(observer.messages == [("next", 1), ("next", 2), ("next", 3)])
+        assert(bounded.depth == 0)
+
+    def test_dispose(self):
+        scheduler = TestScheduler()
+        subject = Subject()
+        observer = RecordingObserver()
+        bounded = BoundedObserver(scheduler, observer, 10)
+        bounded.subscription.disposable = subject.subscribe(bounded)
+        subject.on_next(1)
+        bounded.dispose()
+        subject.on_next(2)
+        scheduler.start()
+        assert(observer.messages == [])
+        assert(len(subject.observers) == 0)
+
+    def test_invalid_arguments(self):
+        scheduler = TestScheduler()
+        observer = RecordingObserver()
+        self.assertRaises(ArgumentOutOfRangeException, BoundedObserver,
+                          scheduler, observer, 0)
+        self.assertRaises(ArgumentOutOfRangeException, BoundedObserver,
+                          scheduler, observer, 1, "block")
@@ -21,6 +21,29 @@ def method_s(*args):
     print("args: ", args)
     return args[0]
 
+@extensionmethod(A, instancemethod=True)
+def method_d(self, arg):
+    return ("instance", self, arg)
+
+@extensionclassmethod(A)
+def method_d(cls, arg):
+    return ("class", cls, arg)
+
+@extensionclassmethod(A)
+def method_e(cls, arg):
+    return ("class", cls, arg)
+
+@extensionmethod(A, instancemethod=True)
+def method_e(self, arg):
+    return ("instance", self, arg)
+
+@extensionmethod(A, instancemethod=True)
+def method_f(self, arg):
+    return ("instance", self, arg)
+
+class B(A):
+    pass
+
 class TestExtensionMethod(unittest.TestCase):
 
     def test_method_a(self):
@@ -40,5 +63,26 @@ class TestExtensionMethod(unittest.TestCase):
         a = A()
         assert(a.method_s(42) == 42)
 
+    def test_dualmethod(self):
+        a = A()
+        assert(a.method_d(42) == ("instance", a, 42))
+        assert(A.method_d(42) == ("class", A, 42))
+        assert("method_d" not in a.__dict__)
+
+    def test_dualmethod_class_first(self):
+        a = A()
+        assert(a.method_e(42) == ("instance", a, 42))
+        assert(A.method_e(42) == ("class", A, 42))
+
+    def test_dualmethod_subclass(self):
+        b = B()
+        assert(b.method_d(42) == ("instance", b, 42))
+        assert(B.method_d(42) == ("class", B, 42))
+
+    def test_dualmethod_instance_only(self):
+        a = A()
+        assert(a.method_f(42) == ("instance", a, 42))
+        assert(not hasattr(A, "method_f"))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+import os
+import sys
+import pkgutil
+import unittest
+import subprocess
+from importlib import import_module
+
+import rx
+from rx import Observable, Observer
+from rx.blockingobservable import BlockingObservable
+from rx.internal import Enumerable
+from rx.internal.extensionmethod import lazymethod, lazyextensions, dualmethod
+from rx.linq.observable import operators
+
+
+class A(object):
+    def method_a(self):
+        return "a"
+
+
+def registered_modules(value):
+    """Returns the modules of the functions behind a class attribute"""
+
+    if isinstance(value, dualmethod):
+        funcs = [value.instancemethod, value.classmethod]
+    else:
+        funcs = [value]
+
+    modules = set()
+    for func in funcs:
+        func = getattr(func, "__func__", func)
+        module = getattr(func, "__module__", None)
+        if module:
+            modules.add(module)
+    return modules
+
+
+class TestLazyExtensions(unittest.TestCase):
+    def test_import_rx_imports_no_operators(self):
+        # Python 2 also leaves None entries for implicit relative imports
+        code = ("import sys, rx; print(len([m for m in sys.modules "
+                "if sys.modules[m] is not None and "
+                "m.startswith(('rx.linq.observable.', 'rx.backpressure'))]))")
+        root = os.path.dirname(os.path.dirname(rx.__file__))
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         cwd=root)
+        assert(output.strip() == b"0")
+
+    def test_every_operator_resolves(self):
+        for module, names in operators:
+            for name in names:
+                value = getattr(Observable, name)
+                assert(not isinstance(value, lazymethod))
+                assert(not isinstance(Observable.__dict__[name], lazymethod))
+
+        for cls in (BlockingObservable, Observer, Enumerable):
+            for name, value in list(cls.__dict__.items()):
+                if isinstance(value, lazymethod):
+                    getattr(cls, name)
+                    assert(not isinstance(cls.__dict__[name], lazymethod))
+
+    def test_operator_table_complete(self):
+        package = import_module("rx.linq.observable")
+        for _, name, is_package in pkgutil.iter_modules(package.__path__):
+            if not is_package and not name.startswith("py3"):
+                import_module("rx.linq.observable." + name)
+
+        listed = set(name for _, names in operators for name in names)
+        for name, value in Observable.__dict__.items():
+            for module in registered_modules(value):
+                if module.startswith("rx.linq.observable."):
+                    assert name in listed, name
+
+    def test_operator_instance_access(self):
+        xs = Observable.range(1, 3)
+        results = []
+        (xs + xs).select(lambda x: x * 2).subscribe(results.append)
+        assert(results == [2, 4, 6, 2, 4, 6])
+
+    def test_lazy_extension_module(self):
+        lazyextensions(A, [("tests.test_core.lazymodule", ["lazy_a"])])
+        assert(isinstance(A.__dict__["lazy_a"], lazymethod))
+        assert(A().lazy_a() == "lazy")
+        assert(not isinstance(A.__dict__["lazy_a"], lazymethod))
+
+    def test_lazy_extension_existing_name(self):
+        lazyextensions(A, [("tests.test_core.lazymodule", ["method_a"])])
+        assert(not isinstance(A.__dict__["method_a"], lazymethod))
+
+    def test_lazy_extension_not_registered(self):
+        lazyextensions(A, [("tests.test_core.lazymodule", ["lazy_missing"])])
+        self.assertRaises(AttributeError, getattr, A, "lazy_missing")
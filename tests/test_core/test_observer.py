@@ -1,6 +1,7 @@
 from nose.tools import assert_raises
 
 from rx import Observer
+from rx.internal import noop
 from rx.notification import OnNext, OnError, OnCompleted
 from rx.internal.exceptions import CompletedException
 
@@ -435,5 +436,25 @@ def test_observer_checked_reentrant_completed():
     o.on_completed()
     assert(1 == n[0])
 
+def test_observer_slots():
+    from rx.anonymousobservable import AnonymousObservable
+    from rx.autodetachobserver import AutoDetachObserver
+
+    observer = Observer(noop)
+    assert(not hasattr(observer, "__dict__"))
+    assert(not hasattr(AutoDetachObserver(observer), "__dict__"))
+    assert(not hasattr(AnonymousObservable(noop), "__dict__"))
+
+def test_auto_detach_observer_completed_once():
+    from rx.autodetachobserver import AutoDetachObserver
+
+    completed = []
+    observer = AutoDetachObserver(Observer(noop, noop,
+                                           lambda: completed.append(1)))
+    observer.on_completed()
+    observer.on_completed()
+    assert(completed == [1])
+    assert(observer.is_stopped)
+
 if __name__ == '__main__':
-    test_to_notifier_forwards()
\ No newline at end of file
+    test_to_notifier_forwards()
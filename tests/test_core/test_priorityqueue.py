@@ -139,3 +139,60 @@ class TestPriorityQueue(unittest.TestCase):
         assert(p.remove_at(1) == 42)
         assert(p.remove_at(0) == 41)
         self.assertRaises(IndexError, p.remove_at, 0)
+
+    def test_priorityqueue_remove_at_after_remove(self):
+        """Remove item at index skips items already removed"""
+
+        p = PriorityQueue()
+        items = [40, 41, 42, 43]
+        for item in items:
+            p.enqueue(item)
+        assert(p.remove(40))
+
+        removed = [p.remove_at(0), p.remove_at(0), p.remove_at(0)]
+        assert(sorted(removed) == [41, 42, 43])
+        assert(len(p) == 0)
+        self.assertRaises(IndexError, p.remove_at, 0)
+
+    def test_priorityqueue_remove_identity(self):
+        """Remove the given item, not another item comparing equal to it"""
+
+        p = PriorityQueue()
+
+        first = TestItem(42, "first")
+        second = TestItem(42, "second")
+        p.enqueue(first)
+        p.enqueue(second)
+        p.enqueue(TestItem(41, "low"))
+
+        assert(p.remove(second) == True)
+        assert(len(p) == 2)
+        p.dequeue().assert_equal(TestItem(41, "low"))
+        p.dequeue().assert_equal(TestItem(42, "first"))
+        assert(len(p) == 0)
+
+    def test_priorityqueue_remove_many(self):
+        """Removing most of the items keeps the remaining items ordered"""
+
+        p = PriorityQueue()
+        items = [TestItem(n) for n in range(100)]
+        for item in reversed(items):
+            p.enqueue(item)
+
+        for item in items:
+            if item.value % 10:
+                assert(p.remove(item) == True)
+
+        assert(len(p) == 10)
+        assert(p.peek().value == 0)
+        assert([p.dequeue().value for _ in range(10)] == list(range(0, 100, 10)))
+        self.assertRaises(IndexError, p.dequeue)
+
+    def test_priorityqueue_enqueue_many(self):
+        p = PriorityQueue()
+        p.enqueue(TestItem(5))
+        p.enqueue_many([TestItem(n) for n in (9, 1, 5, 3)])
+        p.enqueue_many([TestItem(4)])
+
+        assert(len(p) == 6)
+        assert([p.dequeue().value for _ in range(6)] == [1, 3, 4, 5, 5, 9])
@@ -0,0 +1,64 @@
+import unittest
+
+from rx.subjects.replaybuffer import ReplayBuffer, CompactedReplayBuffer
+
+
+class TestReplayBuffer(unittest.TestCase):
+    def test_buffer_size(self):
+        buffer = ReplayBuffer(3)
+        for value in range(10):
+            buffer.append(value)
+        assert(list(buffer) == [7, 8, 9])
+        assert(len(buffer) == 3)
+        assert(buffer.times is None)
+
+    def test_compacts_trimmed_values(self):
+        buffer = ReplayBuffer(100)
+        for value in range(10000):
+            buffer.append(value)
+        assert(len(buffer.values) <= 200)
+        assert(list(buffer) == list(range(9900, 10000)))
+
+    def test_extend(self):
+        buffer = ReplayBuffer(5)
+        buffer.extend([1, 2, 3])
+        buffer.extend([4, 5, 6, 7])
+        assert(list(buffer) == [3, 4, 5, 6, 7])
+
+    def test_window(self):
+        buffer = ReplayBuffer(100, window=10)
+        buffer.append(1, 0)
+        buffer.extend([2, 3], 5)
+        buffer.append(4, 12)
+        assert(list(buffer) == [2, 3, 4])
+        buffer.trim(16)
+        assert(list(buffer) == [4])
+        assert(len(buffer.values) == len(buffer.times))
+        buffer.trim(23)
+        assert(len(buffer) == 0)
+
+    def test_snapshot_is_shared_until_changed(self):
+        buffer = ReplayBuffer(100)
+        buffer.extend([1, 2, 3])
+        snapshot = buffer.snapshot()
+        buffer.trim()
+        assert(buffer.snapshot() is snapshot)
+        buffer.append(4)
+        assert(buffer.snapshot() is not snapshot)
+        assert(snapshot == [1, 2, 3])
+        assert(buffer.snapshot() == [1, 2, 3, 4])
+
+
+class TestCompactedReplayBuffer(unittest.TestCase):
+    def test_latest_per_key(self):
+        buffer = CompactedReplayBuffer(lambda x: x % 3)
+        buffer.extend([1, 2, 3, 4])
+        assert(list(buffer) == [2, 3, 4])
+        buffer.append(5)
+        assert(list(buffer) == [3, 4, 5])
+
+    def test_max_keys(self):
+        buffer = CompactedReplayBuffer(lambda x: x % 10, max_keys=2)
+        buffer.extend([1, 2, 11, 3])
+        assert(list(buffer) == [11, 3])
+        assert(len(buffer) == 2)
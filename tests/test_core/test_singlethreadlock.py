@@ -0,0 +1,75 @@
+import threading
+import unittest
+
+import rx
+from rx import Observable
+from rx.internal.concurrency import SingleThreadLock
+from rx.subjects import Subject, ReplaySubject, BehaviorSubject, \
+    RoutingSubject
+
+
+class TestSingleThreadLock(unittest.TestCase):
+    def setUp(self):
+        self.lock = rx.config["Lock"]
+        rx.config["Lock"] = SingleThreadLock
+
+    def tearDown(self):
+        rx.config["Lock"] = self.lock
+
+    def test_locks_from_config(self):
+        subject = Subject()
+        assert(isinstance(subject.lock, SingleThreadLock))
+        assert(isinstance(Observable.never().lock, SingleThreadLock))
+
+        rx.config["Lock"] = self.lock
+        assert(not isinstance(Subject().lock, SingleThreadLock))
+
+    def test_single_thread_pipeline(self):
+        subject = ReplaySubject()
+        results = []
+        Observable.combine_latest(subject, Observable.return_value(10),
+                                  lambda x, y: x + y) \
+            .subscribe(results.append)
+        subject.on_next(1)
+        subject.on_next(2)
+        assert(results == [11, 12])
+
+    def test_other_thread_asserts(self):
+        if not __debug__:
+            return
+
+        subject = BehaviorSubject(0)
+        subject.on_next(1)
+        assert(len(self.notify_from_thread(subject.on_next, 2)) == 1)
+
+    def test_other_thread_asserts_lock_free_subject(self):
+        if not __debug__:
+            return
+
+        for subject in (Subject(), RoutingSubject(lambda x: x)):
+            subject.on_next(1)
+            assert(len(self.notify_from_thread(subject.on_next, 2)) == 1)
+            assert(len(self.notify_from_thread(subject.on_next_batch, [2])) == 1)
+
+    def test_other_thread_lock_free_subject_default_lock(self):
+        rx.config["Lock"] = self.lock
+        subject = Subject()
+        results = []
+        subject.subscribe(results.append)
+        subject.on_next(1)
+        assert(self.notify_from_thread(subject.on_next, 2) == [])
+        assert(results == [1, 2])
+
+    def notify_from_thread(self, on_next, value):
+        errors = []
+
+        def run():
+            try:
+                on_next(value)
+            except AssertionError as ex:
+                errors.append(ex)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        return errors
@@ -0,0 +1,83 @@
+import unittest
+
+from rx import Observable
+from rx.linq.sink import Sink
+from rx.subjects import Subject
+
+
+class RecordingObserver(object):
+    def __init__(self):
+        self.messages = []
+
+    def on_next(self, value):
+        self.messages.append(("next", value))
+
+    def on_error(self, error):
+        self.messages.append(("error", error))
+
+    def on_completed(self):
+        self.messages.append(("completed",))
+
+
+class TestSink(unittest.TestCase):
+    def test_sink_forwards(self):
+        observer = RecordingObserver()
+        sink = Sink(observer)
+        sink.on_next(1)
+        sink.on_next_batch([2, 3])
+        sink.on_completed()
+        assert(observer.messages == [("next", 1), ("next", 2), ("next", 3),
+                                     ("completed",)])
+
+    def test_sink_grammar(self):
+        observer = RecordingObserver()
+        sink = Sink(observer)
+        sink.on_error("ex")
+        sink.on_next(1)
+        sink.on_completed()
+        assert(observer.messages == [("error", "ex")])
+
+    def test_sink_state_per_subscription(self):
+        xs = Subject()
+        ys = Subject()
+        zs = xs.select(lambda x, i: (x, i)).zip(ys, lambda a, b: a + (b,))
+        first = []
+        second = []
+        zs.subscribe(first.append)
+        xs.on_next("a")
+        ys.on_next(1)
+        zs.subscribe(second.append)
+        xs.on_next("b")
+        ys.on_next(2)
+        assert(first == [("a", 0, 1), ("b", 1, 2)])
+        assert(second == [("b", 0, 2)])
+
+    def test_combine_latest_state_per_subscription(self):
+        xs = Observable.range(1, 3)
+        zs = xs.combine_latest(Observable.return_value(10),
+                               lambda x, y: x + y)
+        results = []
+        zs.subscribe(results.append)
+        zs.subscribe(results.append)
+        assert(results == [11, 12, 13, 11, 12, 13])
+
+    def test_merge_state_per_subscription(self):
+        xs = Observable.from_iterable([Observable.range(0, 2),
+                                       Observable.range(2, 2)])
+        for zs in (xs.merge_observable(), xs.merge(1)):
+            results = []
+            zs.subscribe(results.append)
+            zs.subscribe(results.append)
+            assert(results == [0, 1, 2, 3, 0, 1, 2, 3])
+
+    def test_group_by_until_state_per_subscription(self):
+        xs = Observable.from_iterable([1, 2, 3, 4])
+        zs = xs.group_by_until(lambda x: x % 2, None,
+                               lambda g: Observable.never())
+        results = []
+
+        def on_next(group):
+            group.subscribe(lambda x: results.append((group.key, x)))
+        zs.subscribe(on_next)
+        zs.subscribe(on_next)
+        assert(results == [(1, 1), (0, 2), (1, 3), (0, 4)] * 2)
@@ -282,3 +282,31 @@ def test_refcountdisposable_primarydisposesfirst():
     assert not d.is_disposed
     d2.dispose()
     assert d.is_disposed
+
+def test_disposable_lock_lazy():
+    d = SingleAssignmentDisposable()
+    assert d._lock is None
+    assert not hasattr(d, "__dict__")
+
+    lock = d.lock
+    assert lock is not None
+    assert d.lock is lock
+
+    d.disposable = Disposable()
+    d.dispose()
+    assert d.lock is lock
+
+def test_disposable_lock_lazy_threads():
+    import threading
+
+    d = Disposable()
+    locks = []
+    threads = [threading.Thread(target=lambda: locks.append(d.lock))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(locks) == 8
+    assert all(lock is locks[0] for lock in locks)
@@ -0,0 +1,158 @@
+import unittest
+
+import rx
+from rx import Observer
+from rx.observable import Observable
+from rx.subjects import Subject, ReplaySubject
+from rx.internal.exceptions import ArgumentOutOfRangeException
+from rx.testing import TestScheduler
+
+
+class RxException(Exception):
+    pass
+
+
+# Helper function for raising exceptions within lambdas
+def _raise(ex):
+    raise RxException(ex)
+
+
+class BatchObserver(Observer):
+    """Records the batches and single elements it receives"""
+
+    def __init__(self):
+        super(BatchObserver, self).__init__(self.next, self.error,
+                                            self.completed, self.next_batch)
+        self.messages = []
+
+    def next(self, value):
+        self.messages.append(("next", value))
+
+    def next_batch(self, values):
+        self.messages.append(("batch", list(values)))
+
+    def error(self, exception):
+        self.messages.append(("error", str(exception)))
+
+    def completed(self):
+        self.messages.append(("completed",))
+
+
+class TestBatch(unittest.TestCase):
+    def test_from_iterable_batch_size(self):
+        observer = BatchObserver()
+        Observable.from_iterable(range(7), batch_size=3).subscribe(observer)
+        assert(observer.messages == [("batch", [0, 1, 2]),
+                                     ("batch", [3, 4, 5]),
+                                     ("batch", [6]), ("completed",)])
+
+    def test_from_iterable_batch_size_exact(self):
+        observer = BatchObserver()
+        Observable.from_iterable(range(4), batch_size=2).subscribe(observer)
+        assert(observer.messages == [("batch", [0, 1]), ("batch", [2, 3]),
+                                     ("completed",)])
+
+    def test_from_iterable_batch_size_invalid(self):
+        self.assertRaises(ArgumentOutOfRangeException,
+                          Observable.from_iterable, [1], batch_size=0)
+
+    def test_batch_fallback(self):
+        results = []
+        completed = []
+        Observable.from_iterable(range(5), batch_size=2) \
+            .subscribe(results.append,
+                       on_completed=lambda: completed.append(1))
+        assert(results == [0, 1, 2, 3, 4])
+        assert(completed == [1])
+
+    def test_batch_select_where_scan(self):
+        observer = BatchObserver()
+        Observable.from_iterable(range(6), batch_size=3) \
+            .select(lambda x, i: x + i) \
+            .where(lambda x: x % 4 == 0) \
+            .scan(lambda acc, x: acc + x) \
+            .subscribe(observer)
+        assert(observer.messages == [("batch", [0, 4]), ("batch", [12]),
+                                     ("completed",)])
+
+    def test_batch_select_error(self):
+        observer = BatchObserver()
+        Observable.from_iterable(range(6), batch_size=6) \
+            .select(lambda x: _raise("ex") if x == 3 else x) \
+            .subscribe(observer)
+        assert(observer.messages == [("batch", [0, 1, 2]), ("error", "ex")])
+
+    def test_batch_where_unsupported_operator(self):
+        observer = BatchObserver()
+        Observable.from_iterable(range(4), batch_size=4) \
+            .where(lambda x: x % 2) \
+            .take(5) \
+            .subscribe(observer)
+        assert(observer.messages == [("next", 1), ("next", 3),
+                                     ("completed",)])
+
+    def test_batch_fusion(self):
+        fusion = rx.config["fusion"]
+        rx.config["fusion"] = True
+        try:
+            observer = BatchObserver()
+            Observable.from_iterable(range(10), batch_size=4) \
+                .select(lambda x: x * 2) \
+                .where(lambda x: x % 3) \
+                .take_while(lambda x: x < 15) \
+                .subscribe(observer)
+        finally:
+            rx.config["fusion"] = fusion
+        assert(observer.messages == [("batch", [2, 4]), ("batch", [8, 10, 14]),
+                                     ("completed",)])
+
+    def test_batch_buffer_with_count(self):
+        observer = BatchObserver()
+        Observable.from_iterable(range(7), batch_size=7) \
+            .buffer_with_count(3, 2) \
+            .subscribe(observer)
+        assert(observer.messages == [
+            ("batch", [[0, 1, 2], [2, 3, 4], [4, 5, 6]]),
+            ("batch", [[6]]),
+            ("completed",)])
+
+    def test_subject_on_next_many(self):
+        subject = Subject()
+        observer = BatchObserver()
+        results = []
+        subject.subscribe(observer)
+        subject.subscribe(results.append)
+
+        subject.on_next_many(x for x in range(3))
+        subject.on_completed()
+
+        assert(observer.messages == [("batch", [0, 1, 2]), ("completed",)])
+        assert(results == [0, 1, 2])
+
+    def test_replay_subject_on_next_many(self):
+        scheduler = TestScheduler()
+        subject = ReplaySubject(3, scheduler=scheduler)
+        observer = BatchObserver()
+        subject.subscribe(observer)
+        subject.on_next_many(range(5))
+        scheduler.start()
+
+        assert(observer.messages == [("batch", [0, 1, 2, 3, 4])])
+
+        results = []
+        subject.subscribe(results.append)
+        scheduler.start()
+        assert(results == [2, 3, 4])
+
+    def test_observe_on_batch(self):
+        scheduler = TestScheduler()
+        observer = BatchObserver()
+        subject = Subject()
+        subject.observe_on(scheduler).subscribe(observer)
+
+        def action(scheduler, state):
+            subject.on_next_many([1, 2, 3])
+        scheduler.schedule_absolute(220, action)
+        scheduler.start()
+
+        assert(observer.messages == [("batch", [1, 2, 3])])
@@ -236,3 +236,11 @@ class TestCatch(unittest.TestCase):
         results.messages.assert_equal(on_next(210, 2), on_next(220, 3), on_next(230, 4), on_completed(235))
         assert(first_handler_called[0])
         assert(second_handler_called[0])
+
+    def test_catch_many_synchronous(self):
+        errors = []
+        xs = Observable.catch_exception(
+            [Observable.throw_exception(Exception(i)) for i in range(3000)])
+        xs.subscribe(on_error=errors.append)
+        assert(len(errors) == 1)
+        assert(str(errors[0]) == "2999")
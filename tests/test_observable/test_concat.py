@@ -3,6 +3,7 @@ import unittest
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable
+from rx.internal.enumerable import AnonymousEnumerable
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -209,3 +210,38 @@ class TestConcat(unittest.TestCase):
 
         results = scheduler.start(create)
         results.messages.assert_equal(on_next(210, 2), on_next(220, 3), on_next(230, 4), on_next(240, 5), on_completed(250))
+
+    def test_concat_many_synchronous(self):
+        xs = Observable.concat([Observable.return_value(i) for i in range(3000)])
+        results = []
+        xs.subscribe(results.append)
+        assert(results == list(range(3000)))
+
+    def test_concat_resubscribe(self):
+        xs = Observable.concat([Observable.range(0, 2), Observable.range(2, 2)])
+        results = []
+        xs.subscribe(results.append)
+        xs.subscribe(results.append)
+        assert(results == [0, 1, 2, 3, 0, 1, 2, 3])
+
+    def test_concat_infinite_sources_take(self):
+        def sources():
+            i = 0
+            while True:
+                yield Observable.just(i)
+                i += 1
+
+        results = []
+        Observable.concat(AnonymousEnumerable(sources)).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+
+    def test_concat_infinite_sources_pairwise_take(self):
+        def sources():
+            i = 0
+            while True:
+                yield Observable.just(i)
+                i += 1
+
+        results = []
+        Observable.concat(AnonymousEnumerable(sources)).pairwise().take(3).subscribe(results.append)
+        assert(results == [(0, 1), (1, 2), (2, 3)])
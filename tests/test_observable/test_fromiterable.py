@@ -1,8 +1,10 @@
 import unittest
+import itertools
 
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable, BooleanDisposable
+from rx.concurrency import immediate_scheduler
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -47,4 +49,60 @@ class TestFromArray(unittest.TestCase):
           return Observable.from_(enumerable_finite, scheduler=scheduler)
       results = scheduler.start(create)
 
-      results.messages.assert_equal(on_completed(201))
\ No newline at end of file
+      results.messages.assert_equal(on_completed(201))
+    def test_subscribe_to_enumerable_infinite_immediate_take(self):
+        results = []
+        Observable.from_iterable(itertools.count(), immediate_scheduler).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+
+    def test_subscribe_to_enumerable_infinite_immediate_batch_take(self):
+        results = []
+        Observable.from_iterable(itertools.count(), immediate_scheduler, batch_size=2).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+
+    def test_subscribe_to_enumerable_twice(self):
+        results = []
+        xs = Observable.from_iterable(range(3))
+        xs.subscribe(results.append)
+        xs.subscribe(results.append)
+        assert(results == [0, 1, 2, 0, 1, 2])
+
+    def test_subscribe_to_enumerable_batch_duck_observer(self):
+        class DuckObserver(object):
+            def __init__(self):
+                self.values = []
+                self.completed = False
+
+            def on_next(self, value):
+                self.values.append(value)
+
+            def on_error(self, error):
+                pass
+
+            def on_completed(self):
+                self.completed = True
+
+        observer = DuckObserver()
+        Observable.from_iterable([1, 2, 3], batch_size=2).subscribe(observer=observer)
+        assert(observer.values == [1, 2, 3])
+        assert(observer.completed)
+
+    def test_subscribe_to_enumerable_infinite_immediate_do_action_take(self):
+        results = []
+        Observable.from_iterable(itertools.count(), immediate_scheduler).do_action(lambda x: None).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+
+    def test_subscribe_to_enumerable_infinite_immediate_pairwise_take(self):
+        results = []
+        Observable.from_iterable(itertools.count(), immediate_scheduler).pairwise().take(3).subscribe(results.append)
+        assert(results == [(0, 1), (1, 2), (2, 3)])
+
+    def test_subscribe_to_enumerable_infinite_immediate_distinct_take(self):
+        results = []
+        Observable.from_iterable(itertools.count(), immediate_scheduler).distinct().take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+
+    def test_subscribe_to_enumerable_infinite_immediate_buffer_take(self):
+        results = []
+        Observable.from_iterable(itertools.count(), immediate_scheduler).buffer_with_count(2).take(2).subscribe(results.append)
+        assert(results == [[0, 1], [2, 3]])
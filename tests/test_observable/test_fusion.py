@@ -0,0 +1,155 @@
+import unittest
+
+import rx
+from rx.observable import Observable
+from rx.linq.fusedobservable import FusedObservable
+from rx.concurrency import immediate_scheduler
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+
+
+class RxException(Exception):
+    pass
+
+
+# Helper function for raising exceptions within lambdas
+def _raise(ex):
+    raise RxException(ex)
+
+
+def noop(*args):
+    pass
+
+
+class TestFusion(unittest.TestCase):
+    def setUp(self):
+        self.fusion = rx.config["fusion"]
+        rx.config["fusion"] = True
+
+    def tearDown(self):
+        rx.config["fusion"] = self.fusion
+
+    def run_chain(self, create):
+        """Runs the chain with fusion on and off and returns both results"""
+
+        results = []
+        for fusion in (True, False):
+            rx.config["fusion"] = fusion
+            scheduler = TestScheduler()
+            xs = scheduler.create_hot_observable(
+                on_next(150, 1), on_next(210, 2), on_next(220, 3),
+                on_next(230, 3), on_next(240, 4), on_next(250, 5),
+                on_next(260, 6), on_completed(300))
+            results.append(scheduler.start(lambda: create(xs)).messages)
+        return results
+
+    def test_fusion_disabled(self):
+        rx.config["fusion"] = False
+        xs = Observable.from_iterable([1, 2])
+        assert(not isinstance(xs.select(lambda x: x), FusedObservable))
+
+    def test_fusion_collapses_chain(self):
+        xs = Observable.from_iterable([1, 2])
+        ys = xs.select(lambda x: x).where(lambda x: True)
+        assert(isinstance(ys, FusedObservable))
+        assert(ys.source.source is xs)
+
+    def test_fusion_chain(self):
+        actions = []
+
+        def create(xs):
+            return xs.select(lambda x, i: x * 10 + i) \
+                .do_action(actions.append) \
+                .where(lambda x: x % 2 == 0) \
+                .distinct_until_changed(lambda x: x // 20) \
+                .skip_while(lambda x: x < 30) \
+                .scan(lambda acc, x: acc + x, 1) \
+                .take_while(lambda x: x < 200)
+
+        fused, unfused = self.run_chain(create)
+        assert(fused == unfused)
+        assert(fused == [on_next(250, 55), on_completed(300)])
+        assert(actions[:6] == actions[6:])
+
+    def test_fusion_pluck(self):
+        def create(xs):
+            return xs.select(lambda x: {"a": x}).pluck("a")
+
+        fused, unfused = self.run_chain(create)
+        assert(fused == unfused)
+        assert(len(fused) == 7)
+
+    def test_fusion_error_in_stage(self):
+        errors = []
+
+        def create(xs):
+            return xs.do_action(noop, errors.append) \
+                .select(lambda x: _raise("ex") if x == 4 else x) \
+                .do_action(noop, errors.append)
+
+        fused, unfused = self.run_chain(create)
+        assert(fused == unfused)
+        assert(fused == [on_next(210, 2), on_next(220, 3), on_next(230, 3),
+                         on_error(240, "ex")])
+        # Only the do_action after the failing stage sees the error
+        assert(len(errors) == 2)
+
+    def test_fusion_source_error(self):
+        scheduler = TestScheduler()
+        ex = 'ex'
+        xs = scheduler.create_hot_observable(on_next(210, 2), on_error(220, ex))
+        errors = []
+
+        def create():
+            return xs.do_action(noop, errors.append).select(lambda x: x) \
+                .do_action(noop, lambda e: _raise('ex2'))
+
+        results = scheduler.start(create)
+        assert(results.messages == [on_next(210, 2), on_error(220, 'ex2')])
+        assert(errors == [ex])
+        assert(xs.subscriptions == [subscribe(200, 220)])
+
+    def test_fusion_take_while_completes(self):
+        completed = []
+
+        def create(xs):
+            return xs.do_action(noop, None, lambda: completed.append(1)) \
+                .take_while(lambda x: x < 4) \
+                .do_action(noop, None, lambda: completed.append(2))
+
+        fused, unfused = self.run_chain(create)
+        assert(fused == unfused)
+        assert(fused[-1] == on_completed(240))
+        assert(completed == [2, 2])
+
+    def test_fusion_completed_throws(self):
+        def create(xs):
+            return xs.do_action(noop, on_completed=lambda: _raise('ex')) \
+                .select(lambda x: x)
+
+        fused, unfused = self.run_chain(create)
+        assert(fused == unfused)
+        assert(fused[-1] == on_error(300, 'ex'))
+
+    def test_fusion_resubscribe_resets_state(self):
+        xs = Observable.range(1, 3).scan(lambda acc, x: acc + x)
+        results = []
+        xs.subscribe(results.append)
+        xs.subscribe(results.append)
+        assert(results == [1, 3, 6, 1, 3, 6])
+
+    def test_fusion_immediate_select_take(self):
+        selected = []
+
+        def selector(x):
+            selected.append(x)
+            return x
+
+        results = []
+        Observable.range(0, 10 ** 6, immediate_scheduler).select(selector).where(lambda x: True).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+        assert(len(selected) == 3)
@@ -3,6 +3,7 @@ import unittest
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable, BooleanDisposable
+from rx.concurrency import immediate_scheduler
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -100,3 +101,8 @@ class TestGenerate(unittest.TestCase):
         results.messages.assert_equal(
                             on_next(201, 0),
                             on_next(202, 1))
+
+    def test_generate_infinite_immediate_take(self):
+        results = []
+        Observable.generate(0, lambda x: True, lambda x: x + 1, lambda x: x, immediate_scheduler).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
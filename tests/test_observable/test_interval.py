@@ -1,7 +1,9 @@
 import unittest
 from datetime import datetime, timedelta
+from time import sleep
 
 from rx import Observable
+from rx.concurrency import TimeoutScheduler
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable
 from rx.subjects import Subject
@@ -32,6 +34,24 @@ class TestTimeInterval(unittest.TestCase):
         results = scheduler.start(create)
         results.messages.assert_equal(on_next(300, 0), on_next(400, 1), on_next(500, 2), on_next(600, 3), on_next(700, 4), on_next(800, 5), on_next(900, 6))
     
+    def test_interval_timespan_shared(self):
+        # Virtual time does not share ticks, see VirtualTimeScheduler
+        scheduler = TimeoutScheduler()
+        ticks = []
+
+        xs = Observable.interval(30, scheduler=scheduler, shared=True)
+        d1 = xs.subscribe(lambda x: ticks.append((x, 1)))
+        d2 = xs.subscribe(lambda x: ticks.append((x, 2)))
+        assert(len(scheduler._shared_periodic) == 1)
+
+        sleep(0.075)
+        d1.dispose()
+        d2.dispose()
+
+        # Both intervals get their values from the same tick
+        assert(ticks[:4] == [(0, 1), (0, 2), (1, 1), (1, 2)])
+        assert(not scheduler._shared_periodic)
+
     def test_interval_timespan_zero(self):
         scheduler = TestScheduler()
     
@@ -187,4 +187,9 @@ class TestOnErrorResumeNext(unittest.TestCase):
             on_next(240, 4),
             on_completed(250))
 
-
+    def test_on_error_resume_next_many_synchronous(self):
+        results = []
+        sources = [Observable.throw_exception(Exception()),
+                   Observable.return_value(1)] * 1500
+        Observable.on_error_resume_next(sources).subscribe(results.append)
+        assert(results == [1] * 1500)
@@ -541,3 +541,53 @@ class TestPublish(unittest.TestCase):
             on_next(430, 15),
             on_next(450, 11))
         xs.subscriptions.assert_equal(subscribe(200, 470))
+
+    def test_publish_key_selector(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_completed(300))
+        ys = [None]
+        results1 = scheduler.create_observer()
+        results2 = scheduler.create_observer()
+
+        def action0(scheduler, state):
+            ys[0] = xs.publish(key_selector=lambda x: x % 2)
+            ys[0].subscribe_key(0, results1)
+            ys[0].subscribe(results2)
+        scheduler.schedule_absolute(created, action0)
+
+        def action1(scheduler, state):
+            ys[0].connect()
+        scheduler.schedule_absolute(200, action1)
+
+        scheduler.start()
+        results1.messages.assert_equal(on_next(220, 2), on_next(240, 4), on_completed(300))
+        results2.messages.assert_equal(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_next(240, 4), on_completed(300))
+        xs.subscriptions.assert_equal(subscribe(200, 300))
+
+    def test_publish_subscribe_bounded(self):
+        scheduler = TestScheduler()
+        slow_scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(300))
+        ys = xs.publish()
+        results = scheduler.create_observer()
+        slow = []
+        ys.subscribe(results)
+        subscription = ys.subscribe_bounded(slow.append, slow_scheduler, 2)
+        ys.connect()
+
+        scheduler.start()
+        results.messages.assert_equal(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        assert(subscription.depth == 2)
+        assert(subscription.dropped == 1)
+
+        slow_scheduler.start()
+        assert(slow == [2, 3])
@@ -3,6 +3,7 @@ import unittest
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable, BooleanDisposable
+from rx.concurrency import immediate_scheduler
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -56,3 +57,20 @@ class TestRange(unittest.TestCase):
         results = scheduler.start(create, disposed=204)
         results.messages.assert_equal(on_next(201, -10), on_next(202, -9), on_next(203, -8))
     
+
+    def test_range_immediate_take(self):
+        results = []
+        Observable.range(0, 10 ** 6, immediate_scheduler).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+
+    def test_range_immediate_select_take(self):
+        selected = []
+
+        def selector(x):
+            selected.append(x)
+            return x
+
+        results = []
+        Observable.range(0, 10 ** 6, immediate_scheduler).select(selector).take(3).subscribe(results.append)
+        assert(results == [0, 1, 2])
+        assert(len(selected) == 3)
@@ -190,4 +190,41 @@ class TestRepeat(unittest.TestCase):
         xss = Observable.create(lambda o: _raise('ex4')).repeat(3)
         with self.assertRaises(RxException):
             xss.subscribe()
-        
\ No newline at end of file
+        
+
+    def test_repeat_many_synchronous(self):
+        results = []
+        Observable.return_value(1).repeat(3000).subscribe(results.append)
+        assert(results == [1] * 3000)
+
+    def test_repeat_resubscribe(self):
+        xs = Observable.range(1, 2).repeat(2)
+        results = []
+        xs.subscribe(results.append)
+        xs.subscribe(results.append)
+        assert(results == [1, 2, 1, 2, 1, 2, 1, 2])
+
+    def test_repeat_infinite_take(self):
+        results = []
+        Observable.just(1).repeat().take(3).subscribe(results.append)
+        assert(results == [1, 1, 1])
+
+    def test_repeat_count_take_stops_early(self):
+        subscriptions = []
+
+        def subscribe(observer):
+            subscriptions.append(1)
+            observer.on_next(1)
+            observer.on_completed()
+        Observable.create(subscribe).repeat(10 ** 5).take(3).subscribe()
+        assert(len(subscriptions) == 3)
+
+    def test_repeat_infinite_pairwise_take(self):
+        results = []
+        Observable.just(1).repeat().pairwise().take(3).subscribe(results.append)
+        assert(results == [(1, 1), (1, 1), (1, 1)])
+
+    def test_repeat_infinite_do_action_take(self):
+        results = []
+        Observable.just(1).repeat().do_action(lambda x: None).take(3).subscribe(results.append)
+        assert(results == [1, 1, 1])
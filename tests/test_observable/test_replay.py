@@ -474,3 +474,25 @@ class TestReplay(unittest.TestCase):
         results.messages.assert_equal(on_next(221, 3), on_next(281, 4), on_next(291, 1), on_next(341, 8), on_next(361, 5), on_next(371, 6), on_next(372, 8), on_next(373, 5), on_next(374, 6), on_next(391, 7), on_next(411, 13), on_next(431, 2), on_next(432, 7), on_next(433, 13), on_next(434, 2), on_next(451, 9))
         xs.subscriptions.assert_equal(subscribe(200, 470))
 
+
+    def test_replay_key_selector(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 4), on_next(240, 3), on_next(250, 7), on_completed(500))
+        ys = [None]
+        results = scheduler.create_observer()
+
+        def action0(scheduler, state):
+            ys[0] = xs.replay(None, key_selector=lambda x: x % 3, scheduler=scheduler)
+        scheduler.schedule_absolute(created, action0)
+
+        def action1(scheduler, state):
+            ys[0].connect()
+        scheduler.schedule_absolute(200, action1)
+
+        def action2(scheduler, state):
+            ys[0].subscribe(results)
+        scheduler.schedule_absolute(400, action2)
+
+        scheduler.start()
+        results.messages.assert_equal(on_next(401, 2), on_next(402, 3), on_next(403, 7), on_completed(501))
+        xs.subscriptions.assert_equal(subscribe(200, 500))
@@ -64,8 +64,10 @@ class TestRetry(unittest.TestCase):
         
         self.assertRaises(RxException, scheduler3.start)
 
-        xss = Observable.create(lambda o: _raise('ex')).retry()
-        self.assertRaises(Exception, xss.subscribe)
+        # Recursion on the immediate scheduler does not grow the stack, so
+        # retry a failing subscribe well beyond the recursion limit
+        xss = Observable.create(lambda o: _raise('ex')).retry(5000)
+        self.assertRaises(RxException, xss.subscribe)
         
     def test_retry_observable_retry_count_basic(self):
         scheduler = TestScheduler()
@@ -124,6 +126,16 @@ class TestRetry(unittest.TestCase):
         
         xss = Observable.create(lambda o: _raise('ex')).retry(100)
         self.assertRaises(Exception, xss.subscribe)
-        
+
+    def test_retry_infinite_take(self):
+        results = []
+        Observable.throw_exception(RxException()).start_with(1).retry().take(3).subscribe(results.append)
+        assert(results == [1, 1, 1])
+
+    def test_retry_infinite_pairwise_take(self):
+        results = []
+        Observable.throw_exception(RxException()).start_with(1).retry().pairwise().take(3).subscribe(results.append)
+        assert(results == [(1, 1), (1, 1), (1, 1)])
+
 if __name__ == '__main__':
     unittest.main()
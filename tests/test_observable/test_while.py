@@ -90,3 +90,27 @@ class TestWhile(unittest.TestCase):
 
         results.messages.assert_equal(on_next(250, 1), on_next(300, 2), on_next(350, 3), on_next(400, 4), on_next(500, 1), on_next(550, 2), on_next(600, 3), on_next(650, 4), on_error(700, ex))
         xs.subscriptions.assert_equal(subscribe(200, 450), subscribe(450, 700))
+
+    def test_while_many_synchronous(self):
+        remaining = [3000]
+
+        def condition(source):
+            remaining[0] -= 1
+            return remaining[0] >= 0
+
+        results = []
+        completed = []
+        Observable.while_do(condition, Observable.return_value(1)) \
+            .subscribe(results.append, on_completed=lambda: completed.append(1))
+        assert(results == [1] * 3000)
+        assert(completed == [1])
+
+    def test_while_infinite_take(self):
+        results = []
+        Observable.while_do(lambda _: True, Observable.just(1)).take(3).subscribe(results.append)
+        assert(results == [1, 1, 1])
+
+    def test_while_infinite_do_action_take(self):
+        results = []
+        Observable.while_do(lambda _: True, Observable.just(1)).do_action(lambda x: None).take(3).subscribe(results.append)
+        assert(results == [1, 1, 1])
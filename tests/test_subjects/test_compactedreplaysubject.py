@@ -0,0 +1,55 @@
+from nose.tools import assert_raises
+
+from rx.subjects import CompactedReplaySubject
+from rx.internal.exceptions import DisposedException
+
+
+def test_replays_latest_value_per_key():
+    subject = CompactedReplaySubject(lambda x: x[0])
+    subject.on_next(("a", 1))
+    subject.on_next(("b", 1))
+    subject.on_next(("a", 2))
+
+    results = []
+    subject.subscribe(results.append)
+    subject.on_next(("c", 1))
+    assert(results == [("b", 1), ("a", 2), ("c", 1)])
+
+    late = []
+    subject.subscribe(late.append)
+    assert(late == [("b", 1), ("a", 2), ("c", 1)])
+
+def test_max_keys_evicts_least_recently_updated():
+    subject = CompactedReplaySubject(lambda x: x[0], max_keys=2)
+    subject.on_next_batch([("a", 1), ("b", 1), ("a", 2), ("c", 1)])
+    subject.on_completed()
+
+    results = []
+    completed = []
+    subject.subscribe(results.append, on_completed=lambda: completed.append(True))
+    assert(results == [("a", 2), ("c", 1)])
+    assert(completed == [True])
+
+def test_key_selector_throws():
+    def key_selector(x):
+        if x is None:
+            raise ValueError()
+        return x
+
+    subject = CompactedReplaySubject(key_selector)
+    results = []
+    subject.subscribe(results.append)
+    subject.on_next(1)
+    assert_raises(ValueError, subject.on_next, None)
+    assert_raises(ValueError, subject.on_next_batch, [2, None])
+    subject.on_next(3)
+    assert(results == [1, 3])
+
+    late = []
+    subject.subscribe(late.append)
+    assert(late == [1, 3])
+
+def test_disposed():
+    subject = CompactedReplaySubject(lambda x: x)
+    subject.dispose()
+    assert_raises(DisposedException, subject.on_next, 1)
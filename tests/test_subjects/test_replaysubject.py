@@ -640,3 +640,58 @@ def test_replay_subject_dies_out():
         on_completed(901)
     )
 
+
+def test_replay_subject_late_subscribers():
+    subject = ReplaySubject(3)
+    for value in range(10):
+        subject.on_next(value)
+
+    results1 = []
+    results2 = []
+    subject.subscribe(results1.append)
+    subject.subscribe(results2.append)
+    subject.on_next(10)
+    subject.on_completed()
+
+    results3 = []
+    subject.subscribe(results3.append)
+    assert(results1 == [7, 8, 9, 10])
+    assert(results2 == [7, 8, 9, 10])
+    assert(results3 == [8, 9, 10])
+
+def test_replay_subject_replays_one_value_per_step():
+    scheduler = TestScheduler()
+    subject = ReplaySubject(scheduler=scheduler)
+    subject.on_next_batch([1, 2, 3])
+    results = scheduler.create_observer()
+
+    def action(scheduler, state=None):
+        subject.subscribe(results)
+    scheduler.schedule_absolute(100, action)
+    scheduler.start()
+
+    results.messages.assert_equal(
+        on_next(101, 1),
+        on_next(102, 2),
+        on_next(103, 3)
+    )
+
+def test_replay_subject_on_next_many_duck_observer():
+    class DuckObserver(object):
+        def __init__(self):
+            self.values = []
+
+        def on_next(self, value):
+            self.values.append(value)
+
+        def on_error(self, error):
+            pass
+
+        def on_completed(self):
+            pass
+
+    subject = ReplaySubject()
+    observer = DuckObserver()
+    subject.subscribe(observer=observer)
+    subject.on_next_many([1, 2])
+    assert(observer.values == [1, 2])
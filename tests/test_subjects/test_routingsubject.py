@@ -0,0 +1,99 @@
+from nose.tools import assert_raises
+
+from rx.subjects import RoutingSubject
+from rx.internal.exceptions import DisposedException
+
+
+def test_routes_values_by_key():
+    subject = RoutingSubject(lambda x: x[0])
+    a, b, all_ = [], [], []
+    subject.subscribe_key("a", a.append)
+    subject.subscribe_key("b", b.append)
+    subject.subscribe(all_.append)
+
+    subject.on_next(("a", 1))
+    subject.on_next(("b", 2))
+    subject.on_next(("c", 3))
+    assert(a == [("a", 1)])
+    assert(b == [("b", 2)])
+    assert(all_ == [("a", 1), ("b", 2), ("c", 3)])
+
+def test_routes_batches_by_key():
+    subject = RoutingSubject(lambda x: x % 3)
+    zeros, ones = [], []
+    subject.subscribe_key(0, zeros.append)
+    subject.subscribe_key(1, ones.append)
+    subject.on_next_batch([1, 2, 3, 4, 5, 6])
+    assert(zeros == [3, 6])
+    assert(ones == [1, 4])
+
+def test_dispose_key_subscription():
+    subject = RoutingSubject(lambda x: x)
+    results1, results2 = [], []
+    subscription1 = subject.subscribe_key(1, results1.append)
+    subscription2 = subject.subscribe_key(1, results2.append)
+    subject.on_next(1)
+    subscription1.dispose()
+    subject.on_next(1)
+    subscription2.dispose()
+    subscription2.dispose()
+    assert(1 not in subject.routes)
+    subject.on_next(1)
+    assert(results1 == [1])
+    assert(results2 == [1, 1])
+
+def test_terminates_all_observers():
+    subject = RoutingSubject(lambda x: x)
+    completed = []
+    subject.subscribe_key(1, on_completed=lambda: completed.append(1))
+    subject.subscribe_key(2, on_completed=lambda: completed.append(2))
+    subject.subscribe(on_completed=lambda: completed.append(None))
+    subject.on_completed()
+    subject.subscribe_key(3, on_completed=lambda: completed.append(3))
+    assert(sorted(completed, key=str) == [1, 2, 3, None])
+    assert(subject.routes == {})
+
+def test_error_after_termination_replays_error():
+    subject = RoutingSubject(lambda x: x)
+    errors = []
+    subject.subscribe_key(1, on_error=errors.append)
+    error = Exception("ex")
+    subject.on_error(error)
+    subject.subscribe_key(2, on_error=errors.append)
+    assert(errors == [error, error])
+
+def test_key_selector_throws():
+    def key_selector(x):
+        if x is None:
+            raise ValueError()
+        return x
+
+    subject = RoutingSubject(key_selector)
+    results = []
+    subject.subscribe_key(1, results.append)
+    assert_raises(ValueError, subject.on_next, None)
+    assert_raises(ValueError, subject.on_next_batch, [1, None])
+    subject.on_next(1)
+    assert(results == [1])
+
+def test_disposed():
+    subject = RoutingSubject(lambda x: x)
+    subject.dispose()
+    assert_raises(DisposedException, subject.on_next, 1)
+    assert_raises(DisposedException, subject.subscribe_key, 1, lambda x: x)
+
+def test_routes_batches_to_duck_observers():
+    class DuckObserver(object):
+        def __init__(self):
+            self.values = []
+
+        def on_next(self, value):
+            self.values.append(value)
+
+    subject = RoutingSubject(lambda x: x % 2)
+    odd, all_ = DuckObserver(), DuckObserver()
+    subject.subscribe_key(1, observer=odd)
+    subject.subscribe(observer=all_)
+    subject.on_next_many([1, 2, 3])
+    assert(odd.values == [1, 3])
+    assert(all_.values == [1, 2, 3])
@@ -359,3 +359,75 @@ def test_subject_create():
     s.on_completed()
     assert(not done)
 
+
+
+def test_unsubscribe_order():
+    s = Subject()
+    results = []
+    subscriptions = [s.subscribe(lambda x, i=i: results.append((i, x)))
+                     for i in range(4)]
+
+    subscriptions[1].dispose()
+    subscriptions[1].dispose()
+    s.on_next(1)
+    assert(results == [(0, 1), (2, 1), (3, 1)])
+    assert(len(s.observers) == 3)
+
+    for subscription in subscriptions:
+        subscription.dispose()
+    s.on_next(2)
+    assert(len(results) == 3)
+    assert(not s.observers)
+
+
+def test_unsubscribe_while_notifying():
+    s = Subject()
+    results = []
+    subscriptions = []
+
+    def first(x):
+        results.append(("first", x))
+        subscriptions[1].dispose()
+
+    subscriptions.append(s.subscribe(first))
+    subscriptions.append(s.subscribe(lambda x: results.append(("second", x))))
+
+    # The second observer was in the snapshot of the first notification
+    s.on_next(1)
+    s.on_next(2)
+    assert(results == [("first", 1), ("second", 1), ("first", 2)])
+
+
+def test_subscribe_while_notifying():
+    s = Subject()
+    results = []
+
+    def first(x):
+        results.append(("first", x))
+        if x == 1:
+            s.subscribe(lambda x: results.append(("second", x)))
+
+    s.subscribe(first)
+    s.on_next(1)
+    s.on_next(2)
+    assert(results == [("first", 1), ("first", 2), ("second", 2)])
+
+class DuckObserver(object):
+    def __init__(self):
+        self.values = []
+
+    def on_next(self, value):
+        self.values.append(value)
+
+    def on_error(self, error):
+        pass
+
+    def on_completed(self):
+        pass
+
+def test_on_next_many_duck_observer():
+    s = Subject()
+    observer = DuckObserver()
+    s.subscribe(observer=observer)
+    s.on_next_many([1, 2])
+    assert(observer.values == [1, 2])